@@ -0,0 +1,39 @@
+"""
+Content Builder - Brand Palette
+
+Single source of truth for Snowflake brand colors. pptx_base.Colors and
+the Marp theme's CSS :root variables (slide_model.py) are both derived
+from PALETTE, so a color changes in one place.
+"""
+
+# Name -> hex RGB (no "#"); names map to CSS variables as --sf-blue etc.
+PALETTE = {
+    "SF_BLUE": "29B5E8",          # Accent, links
+    "SF_DARK_BLUE": "11567F",     # Titles, headers
+    "SF_NAVY": "0D2C54",          # Table headers
+    "SF_LIGHT_BG": "F4FAFF",      # Backgrounds
+    "SF_GRAY": "6E7681",          # Subtitles
+    "TABLE_HEADER": "2980B9",     # Blue for table headers
+    "WHITE": "FFFFFF",
+    "BLACK": "1A1A1A",
+    "LIGHT_GRAY": "646464",
+    "RED": "B43232",              # For "before" examples
+    "GREEN": "329632",            # For "after" examples
+    "HIGHLIGHT_GREEN": "27AE60",  # For filled values
+    "TITLE_SUBTITLE": "E8F4FC",   # Subtitles on dark title slides
+    "FOOTER_LIGHT": "A0C4E8",     # Footer / date text on dark slides
+    "FOOTER": "969696",           # Footer on light slides
+}
+
+
+def css_variable(name: str) -> str:
+    """CSS custom property name for a palette entry (SF_DARK_BLUE -> --sf-dark-blue)."""
+    return "--" + name.lower().replace("_", "-")
+
+
+def css_root(indent: str = "") -> str:
+    """The palette as a CSS :root block."""
+    lines = [f"{indent}:root {{"]
+    lines += [f"{indent}  {css_variable(name)}: #{value};" for name, value in PALETTE.items()]
+    lines.append(f"{indent}}}")
+    return "\n".join(lines)
@@ -0,0 +1,219 @@
+"""
+Content Builder - Batch Deck Builder
+
+Builds many PPTX decks from one data manifest in parallel. Each deck is a
+list of slides whose type and arguments match the DeckBuilder helpers in
+pptx_base.py, so there is no need to copy pptx_base.py per customer.
+
+Usage:
+    uv run python deck_batch.py briefings.json
+    uv run python deck_batch.py briefings.yaml --jobs 8 --out-dir decks/
+
+Manifest format (JSON, or YAML if PyYAML is installed):
+    {
+      "skeleton": [                                  # optional, shared slides
+        {"type": "title", "title": "{{customer}} Briefing", "subtitle": "{{date}}"},
+        {"type": "content", "title": "Feature Overview",
+         "items": [{"type": "table", "data": "{{features}}", "top": 1.4},
+                   {"type": "doc_link", "url": "{{docs}}"}]},
+        {"type": "before_after", "title": "...", "problem": "...",
+         "before_code": "...", "after_code": "...", "customer_quote": "{{quote}}"}
+      ],
+      "decks": [
+        {"output_file": "acme.pptx", "vars": {"customer": "Acme", "features": [[...]], ...}},
+        {"output_file": "globex.pptx", "slides": [...]}  # own slides instead of skeleton
+      ]
+    }
+
+Slide types: title, section, content, before_after, value_prop, roadmap
+(-> DeckBuilder.add_<type>_slide), and paginated_table
+(-> DeckBuilder.add_paginated_table_slides, one or more slides). Content slide "items" types: table, text,
+code, doc_link (-> add_table, add_text_content, add_code_block, add_doc_link).
+
+Relative "output_file" paths are resolved against --out-dir when given,
+otherwise against the manifest's directory (as in tpcds_batch.py).
+
+"{{name}}" placeholders are filled from the deck's "vars": a value that is
+exactly one placeholder is replaced by the var itself (so tables and lists
+can be injected), otherwise placeholders are substituted as text.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pptx_base
+
+ITEM_HELPERS = {
+    "table": "add_table",
+    "text": "add_text_content",
+    "code": "add_code_block",
+    "doc_link": "add_doc_link",
+}
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+def load_manifest(path) -> dict:
+    """Load a JSON or YAML deck manifest, remembering its directory in "_base_dir"."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+        manifest = yaml.safe_load(text)
+    else:
+        manifest = json.loads(text)
+    manifest.setdefault("_base_dir", str(path.parent.resolve()))
+    return manifest
+
+
+def fill(value, variables: dict):
+    """Recursively substitute {{name}} placeholders from `variables`."""
+    if isinstance(value, str):
+        whole = _PLACEHOLDER.fullmatch(value.strip())
+        if whole and whole.group(1) in variables:
+            return variables[whole.group(1)]
+        return _PLACEHOLDER.sub(lambda m: str(variables.get(m.group(1), m.group(0))), value)
+    if isinstance(value, list):
+        return [fill(v, variables) for v in value]
+    if isinstance(value, dict):
+        return {k: fill(v, variables) for k, v in value.items()}
+    return value
+
+
+def expand_decks(manifest: dict, out_dir=None) -> list:
+    """
+    Resolve each deck's slides (own slides or filled skeleton) and output
+    path: relative to `out_dir`, else the manifest's directory (else CWD).
+    """
+    skeleton = manifest.get("skeleton", [])
+    base_dir = out_dir or manifest.get("_base_dir", ".")
+    decks = []
+    for deck in manifest.get("decks", []):
+        slides = deck.get("slides", skeleton)
+        output = Path(deck["output_file"])
+        if not output.is_absolute():
+            output = Path(base_dir, output)
+        decks.append({"output_file": str(output), "slides": fill(slides, deck.get("vars", {}))})
+    return decks
+
+
+# =============================================================================
+# BUILDING
+# =============================================================================
+
+def add_slide(deck, spec: dict):
+    """Add one manifest slide to a DeckBuilder."""
+    spec = dict(spec)
+    slide_type = spec.pop("type")
+    items = spec.pop("items", [])
+    method = getattr(deck, f"add_{slide_type}_slide", None) or getattr(deck, f"add_{slide_type}_slides", None)
+    if method is None:
+        raise ValueError(f"Unknown slide type {slide_type!r}")
+    slide = method(**spec)
+    if isinstance(slide, list):  # Multi-slide types; items go on the last slide
+        slide = slide[-1]
+    for item in items:
+        item = dict(item)
+        item_type = item.pop("type")
+        if item_type not in ITEM_HELPERS:
+            raise ValueError(f"Unknown item type {item_type!r}; expected one of {sorted(ITEM_HELPERS)}")
+        getattr(deck, ITEM_HELPERS[item_type])(slide, **item)
+    return slide
+
+
+def build_deck(entry: dict) -> dict:
+    """Build and save one deck; returns its timing record."""
+    start = time.perf_counter()
+    deck = pptx_base.DeckBuilder(clone_prototypes=True)
+    for index, spec in enumerate(entry["slides"], 1):
+        try:
+            add_slide(deck, spec)
+        except Exception as exc:
+            raise ValueError(f"{entry['output_file']} slide {index}: {exc}") from exc
+    built = time.perf_counter()
+
+    output = Path(entry["output_file"])
+    output.parent.mkdir(parents=True, exist_ok=True)
+    deck.save(str(output))
+    done = time.perf_counter()
+    return {
+        "output_file": str(output),
+        "slides": deck.slide_count,
+        "build_sec": round(built - start, 4),
+        "save_sec": round(done - built, 4),
+        "total_sec": round(done - start, 4),
+        "pid": os.getpid(),
+    }
+
+
+def _build_safely(entry: dict) -> dict:
+    try:
+        return build_deck(entry)
+    except Exception as exc:
+        return {"output_file": entry["output_file"], "error": repr(exc)}
+
+
+def run_batch(decks: list, jobs: int = None) -> dict:
+    """Build all decks (in a process pool unless jobs=1) and summarize throughput."""
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(decks) or 1))
+    start = time.perf_counter()
+    if jobs == 1:
+        records = [_build_safely(entry) for entry in decks]
+    else:
+        # Batch small decks per task so IPC overhead stays low at 100s of decks
+        chunksize = max(1, len(decks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            records = list(pool.map(_build_safely, decks, chunksize=chunksize))
+    wall = time.perf_counter() - start
+
+    built = [r for r in records if "error" not in r]
+    failed = [r for r in records if "error" in r]
+    slides = sum(r["slides"] for r in built)
+    return {
+        "decks": len(built),
+        "failed": len(failed),
+        "slides": slides,
+        "jobs": jobs,
+        "wall_sec": round(wall, 3),
+        "decks_per_sec": round(len(built) / wall, 2) if wall else None,
+        "slides_per_sec": round(slides / wall, 1) if wall else None,
+        "results": built,
+        "failures": failed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build many PPTX decks from a manifest.")
+    parser.add_argument("manifest", help="JSON or YAML deck manifest")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--out-dir", default=None,
+                        help="directory for relative output_file paths (default: the manifest's)")
+    parser.add_argument("--summary", default=None, help="throughput summary path (default: <manifest>_summary.json)")
+    args = parser.parse_args(argv)
+
+    manifest_path = Path(args.manifest)
+    decks = expand_decks(load_manifest(manifest_path), args.out_dir)
+    summary = run_batch(decks, jobs=args.jobs)
+
+    summary_path = Path(args.summary or manifest_path.with_name(manifest_path.stem + "_summary.json"))
+    summary_path.write_text(json.dumps(summary, indent=2))
+    for failure in summary["failures"]:
+        print(f"✗ {failure['output_file']}: {failure['error']}")
+    print(f"✅ Built {summary['decks']} decks ({summary['slides']} slides) in {summary['wall_sec']}s "
+          f"with {summary['jobs']} workers: {summary['decks_per_sec']} decks/s, "
+          f"{summary['slides_per_sec']} slides/s")
+    print(f"   Summary: {summary_path.absolute()}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
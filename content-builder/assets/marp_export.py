@@ -0,0 +1,236 @@
+"""
+Content Builder - Parallel Marp PDF/PNG Export
+
+Exports a Marp deck to PDF or PNG one slide at a time instead of in one
+long browser session:
+
+    1. The deck is rendered with marp_render and split into one small HTML
+       page per slide.
+    2. Each slide is screenshotted by a local headless Chrome/Chromium, in
+       a pool of worker processes.
+    3. Slide images are cached by a hash of the slide's own markup, theme
+       CSS, size and scale (not the deck title, slide id or slide count),
+       so after a one-slide edit only that slide is rasterized again.
+    4. PNGs are copied out (<name>.001.png, ...) or stitched, in order, into
+       one PDF with Pillow.
+
+A slide that fails to rasterize is retried once and then reported; the
+other slides are still rendered and cached.
+
+Requires Chrome or Chromium (found on PATH, or set CHROME_PATH) and, for
+PDF, Pillow (`uv sync --extra export`).
+
+Usage:
+    uv run python marp_export.py slides.md -o slides.pdf
+    uv run python marp_export.py slides.md -o slides.png --jobs 8 --scale 2
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import marp_render
+
+DEFAULT_CACHE_DIR = marp_render.DEFAULT_CACHE_DIR / "slides"
+BROWSER_CANDIDATES = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable", "chrome")
+RENDER_TIMEOUT = 60  # Seconds per slide screenshot
+PDF_DPI = 96  # CSS pixels per inch; slide pages are size x scale pixels
+# Per-deck attributes of a slide's markup that do not change its pixels
+_UNRENDERED_ATTRS_RE = re.compile(r' (?:id|data-marpit-pagination-total)="[^"]*"')
+
+# One slide per page, exactly slide-sized, no page chrome
+SLIDE_PAGE_CSS = """
+html, body { margin: 0; padding: 0; overflow: hidden; }
+div.marpit > svg { display: block; width: 100vw; height: 100vh; }
+"""
+
+
+# =============================================================================
+# SLIDE PAGES
+# =============================================================================
+
+def find_browser() -> str:
+    """Path to a headless-capable Chrome/Chromium, or raise FileNotFoundError."""
+    if os.environ.get("CHROME_PATH"):
+        return os.environ["CHROME_PATH"]
+    for name in BROWSER_CANDIDATES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise FileNotFoundError("No Chrome/Chromium found on PATH; install one or set CHROME_PATH")
+
+
+def slide_pages(source: str, scale: float = 1.0) -> list:
+    """
+    Split a deck into standalone single-slide HTML pages.
+
+    Returns [{"number", "html", "hash", "size"}, ...]. The hash covers what
+    reaches the pixels: the slide's markup (minus its id and the deck's
+    slide count), theme and page CSS, size and scale. The page <title>
+    (from the deck's first heading) stays outside it, so editing one slide
+    or appending slides does not invalidate the others.
+    """
+    deck = marp_render.render_slides(source)
+    style = hashlib.sha256(f"{SLIDE_PAGE_CSS}\0{deck['theme_css']}".encode()).hexdigest()
+    pages = []
+    for number, slide in enumerate(deck["slides"], 1):
+        page = marp_render.html_document([slide], deck["theme_css"], f"{deck['title']} ({number})",
+                                         deck["lang"], page_css=SLIDE_PAGE_CSS)
+        markup = _UNRENDERED_ATTRS_RE.sub("", slide)
+        key = f"{scale}\0{deck['size']}\0{deck['lang']}\0{style}\0{markup}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:24]
+        pages.append({"number": number, "html": page, "hash": digest, "size": deck["size"]})
+    return pages
+
+
+# =============================================================================
+# RASTERIZING
+# =============================================================================
+
+def rasterize(task: dict) -> dict:
+    """
+    Screenshot one slide page to its cached PNG (runs in a worker process).
+
+    `task` holds number, html, size, scale, browser and png (cache path).
+    Returns {"number", "png", "sec"} or {"number", "error"}.
+    """
+    start = time.perf_counter()
+    width, height = task["size"]
+    png = Path(task["png"])
+    with tempfile.TemporaryDirectory(prefix="marp_slide_") as tmp:
+        page = Path(tmp, "slide.html")
+        page.write_text(task["html"], encoding="utf-8")
+        shot = Path(tmp, "slide.png")
+        command = [
+            task["browser"], "--headless=new", "--disable-gpu", "--hide-scrollbars",
+            "--no-first-run", "--no-default-browser-check", f"--user-data-dir={tmp}/profile",
+            f"--window-size={width},{height}", f"--force-device-scale-factor={task['scale']}",
+            f"--screenshot={shot}", page.as_uri(),
+        ]
+        error = None
+        for _attempt in range(2):  # One retry: browsers occasionally fail to start
+            try:
+                subprocess.run(command, check=True, capture_output=True, timeout=RENDER_TIMEOUT)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+                error = exc
+                continue
+            if shot.exists():
+                png.parent.mkdir(parents=True, exist_ok=True)
+                tmp_png = png.with_suffix(".tmp")
+                shutil.move(str(shot), tmp_png)
+                tmp_png.replace(png)
+                return {"number": task["number"], "png": str(png), "sec": round(time.perf_counter() - start, 3)}
+            error = RuntimeError("browser exited without writing a screenshot")
+    return {"number": task["number"], "error": repr(error)}
+
+
+def rasterize_deck(source: str, jobs: int = None, scale: float = 1.0,
+                   cache_dir=DEFAULT_CACHE_DIR, browser: str = None) -> dict:
+    """
+    Rasterize every slide of a deck, reusing cached images.
+
+    Returns {"pngs": [path per slide, in order], "rendered", "cached",
+    "failures", "wall_sec"}; failed slides have None in "pngs".
+    """
+    start = time.perf_counter()
+    cache_dir = Path(cache_dir)
+    pages = slide_pages(source, scale)
+    pngs = [cache_dir / f"{page['hash']}.png" for page in pages]
+    todo = [
+        {**page, "scale": scale, "png": str(png)}
+        for page, png in zip(pages, pngs) if not png.exists()
+    ]
+
+    results = []
+    if todo:
+        browser = browser or find_browser()
+        for task in todo:
+            task["browser"] = browser
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(todo)))
+        if jobs == 1:
+            results = [rasterize(task) for task in todo]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(rasterize, todo))
+
+    failures = [r for r in results if "error" in r]
+    failed = {r["number"] for r in failures}
+    return {
+        "pngs": [None if page["number"] in failed else str(png) for page, png in zip(pages, pngs)],
+        "rendered": len(results) - len(failures),
+        "cached": len(pages) - len(todo),
+        "failures": failures,
+        "wall_sec": round(time.perf_counter() - start, 3),
+    }
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def stitch_pdf(pngs: list, output, scale: float = 1.0) -> Path:
+    """Combine slide PNGs, in order, into one PDF (one page per slide, slide-sized at any scale)."""
+    from PIL import Image  # Only needed for PDF output
+
+    output = Path(output)
+    images = [Image.open(png).convert("RGB") for png in pngs]
+    try:
+        images[0].save(output, "PDF", save_all=True, append_images=images[1:],
+                       resolution=PDF_DPI * scale)
+    finally:
+        for image in images:
+            image.close()
+    return output
+
+
+def export(path, output, jobs: int = None, scale: float = 1.0, cache_dir=DEFAULT_CACHE_DIR) -> dict:
+    """
+    Export a Marp .md deck to PDF (`output` ends in .pdf) or numbered PNGs.
+
+    Returns the rasterize_deck() summary plus "outputs". Raises
+    RuntimeError if any slide failed (after writing nothing).
+    """
+    path, output = Path(path), Path(output)
+    summary = rasterize_deck(path.read_text(encoding="utf-8"), jobs, scale, cache_dir)
+    if summary["failures"]:
+        numbers = ", ".join(str(f["number"]) for f in summary["failures"])
+        raise RuntimeError(f"Slides {numbers} failed to render: {summary['failures'][0]['error']}")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.suffix.lower() == ".pdf":
+        summary["outputs"] = [str(stitch_pdf(summary["pngs"], output, scale))]
+    else:
+        outputs = []
+        for number, png in enumerate(summary["pngs"], 1):
+            target = output.with_name(f"{output.stem}.{number:03d}.png")
+            shutil.copyfile(png, target)
+            outputs.append(str(target))
+        summary["outputs"] = outputs
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a Marp deck to PDF/PNG, one slide per worker.")
+    parser.add_argument("file", help="Marp markdown deck")
+    parser.add_argument("-o", "--output", required=True, help="output .pdf, or .png (numbered per slide)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--scale", type=float, default=1.0, help="device scale factor (2 = retina)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="slide image cache directory")
+    args = parser.parse_args(argv)
+
+    summary = export(args.file, args.output, args.jobs, args.scale, args.cache_dir)
+    print(f"✅ Exported {len(summary['pngs'])} slides ({summary['rendered']} rendered, "
+          f"{summary['cached']} cached) in {summary['wall_sec']}s")
+    for output in summary["outputs"][:1]:
+        print(f"   Output: {Path(output).absolute()}" + (" ..." if len(summary["outputs"]) > 1 else ""))
+
+
+if __name__ == "__main__":
+    main()
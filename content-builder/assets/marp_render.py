@@ -0,0 +1,688 @@
+"""
+Content Builder - Native Marp Renderer
+
+Renders a Marp markdown deck (such as marp_base.md) to a self-contained
+HTML file in-process, without Node or a network connection. Covers what
+the skill's decks use:
+
+    - YAML front matter (global directives: theme, paginate, footer, header,
+      class, backgroundColor, color, size, style)
+    - `---` slide separators
+    - HTML-comment directives: `<!-- class: x -->` (this and later slides)
+      and `<!-- _class: x -->` (this slide only)
+    - Markdown: headings, paragraphs (line breaks kept, as in Marp),
+      bold/italic/strikethrough/code/links/images, lists, tables with
+      alignment, fenced code, blockquotes and raw HTML
+
+Slides use Marpit's markup (<svg data-marpit-svg><foreignObject><section>)
+and the front matter `style` CSS is scoped the way Marpit scopes theme CSS.
+The default theme is a compact stand-in for marp-core's, so spacing can
+differ slightly from marp-cli; code is not syntax-highlighted and emoji are
+left as text.
+
+Scoped theme CSS is cached in memory and on disk (keyed by a hash of the
+CSS), so rebuilds of the same deck only re-render the markdown.
+
+Usage:
+    uv run python marp_render.py slides.md -o slides.html
+
+    from marp_render import render_file
+    render_file("slides.md", "slides.html")
+"""
+
+import argparse
+import hashlib
+import html
+import re
+from functools import lru_cache
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(".marp_cache")
+
+SLIDE_SIZES = {"16:9": (1280, 720), "4:3": (960, 720)}
+
+# Marpit wraps each slide in inline SVG; theme CSS is scoped to this selector
+SECTION_SCOPE = "div.marpit > svg > foreignObject > section"
+
+# Directives that apply to the whole deck, wherever they are set
+GLOBAL_DIRECTIVES = {"theme", "style", "size", "lang", "title", "headingDivider", "math"}
+# Directives that apply from their slide on (or to one slide with a leading "_")
+LOCAL_DIRECTIVES = {"class", "paginate", "header", "footer", "backgroundColor",
+                    "backgroundImage", "color"}
+
+# Stand-in for marp-core's default theme: slide box, pagination, header/footer
+BASE_THEME_CSS = """
+section {
+  width: 1280px;
+  height: 720px;
+  box-sizing: border-box;
+  overflow: hidden;
+  position: relative;
+  padding: 78.5px;
+  font-family: -apple-system, 'Segoe UI', Helvetica, Arial, sans-serif;
+  font-size: 29px;
+  line-height: 1.5;
+  background: #fff;
+  color: #24292f;
+}
+section > :first-child { margin-top: 0; }
+h1, h2, h3, h4, h5, h6 { margin: 0.5em 0 0; line-height: 1.25; font-weight: 600; }
+h1 { font-size: 1.6em; }
+h2 { font-size: 1.3em; }
+h3 { font-size: 1.1em; }
+p, blockquote, ul, ol, table, pre { margin: 0.8em 0 0; }
+table { border-collapse: collapse; border-spacing: 0; }
+th, td { border: 1px solid #d0d7de; padding: 0.2em 0.6em; }
+pre { overflow: auto; }
+code { font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace; }
+img { max-width: 100%; }
+header, footer {
+  position: absolute;
+  left: 30px;
+  right: 30px;
+  height: 50px;
+  line-height: 50px;
+  font-size: 18px;
+  color: rgba(102, 102, 102, 0.75);
+}
+header { top: 21px; }
+footer { bottom: 21px; }
+section[data-marpit-pagination]::after {
+  content: attr(data-marpit-pagination);
+  position: absolute;
+  right: 30px;
+  bottom: 21px;
+  font-size: 24px;
+  color: #777;
+}
+"""
+
+# Page-level CSS: stack slides vertically, each scaled to the window width
+DOCUMENT_CSS = """
+html, body { margin: 0; padding: 0; background: #f5f5f5; }
+div.marpit > svg { display: block; width: 100vw; height: auto; margin: 0 auto 16px; box-shadow: 0 2px 6px rgba(0,0,0,.15); }
+@media print {
+  body { background: none; }
+  div.marpit > svg { width: 100%; margin: 0; box-shadow: none; page-break-after: always; }
+}
+"""
+
+_DOCUMENT = """<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>{css}</style>
+</head>
+<body>
+<div class="marpit">
+{slides}
+</div>
+</body>
+</html>
+"""
+
+
+# =============================================================================
+# FRONT MATTER & SLIDES
+# =============================================================================
+
+def _scalar(value: str):
+    """Parse a YAML scalar as Marp directives use them."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        inner = value[1:-1]
+        return inner.replace("''", "'") if value[0] == "'" else inner.replace('\\"', '"')
+    if value in ("true", "false"):
+        return value == "true"
+    return value
+
+
+def parse_directives(text: str) -> dict:
+    """
+    Parse `key: value` lines (the YAML subset Marp front matter uses).
+
+    Supports plain and quoted scalars, true/false, and `|` / `>` block
+    scalars (used for `style:`).
+    """
+    directives = {}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        match = re.match(r"^([A-Za-z_$][\w$]*)\s*:(.*)$", line.strip())
+        if not match:
+            continue
+        key, value = match.group(1), match.group(2).strip()
+        if value[:1] in ("|", ">"):
+            block = []
+            while i < len(lines) and (not lines[i].strip() or lines[i][:1] in " \t"):
+                block.append(lines[i])
+                i += 1
+            indent = min((len(l) - len(l.lstrip()) for l in block if l.strip()), default=0)
+            body = [l[indent:] for l in block]
+            while body and not body[-1].strip():
+                body.pop()
+            directives[key] = "\n".join(body) + "\n" if value[0] == "|" else " ".join(body) + "\n"
+        else:
+            directives[key] = _scalar(value)
+    return directives
+
+
+def parse_front_matter(source: str):
+    """Split a deck into (front matter directives, markdown body)."""
+    match = re.match(r"^---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|$)", source, re.DOTALL)
+    if not match:
+        return {}, source
+    return parse_directives(match.group(1)), source[match.end():]
+
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_SEPARATOR = re.compile(r"^ {0,3}(-{3,}|\*{3,}|_{3,})[ \t]*$")
+
+
+def _fence_state(line: str, fence):
+    """
+    Track fenced code while scanning lines.
+
+    Returns (new fence marker or None, whether this line is a fence line).
+    A fence closes on a line of at least as many of the same characters.
+    """
+    match = _FENCE.match(line)
+    if not match:
+        return fence, False
+    marker = match.group(1)
+    if fence is None:
+        return marker, True
+    if marker[0] == fence[0] and len(marker) >= len(fence) and not line.strip().strip(marker[0]):
+        return None, True
+    return fence, False
+
+
+def split_slides(body: str) -> list:
+    """Split the markdown body on horizontal rules outside code fences."""
+    slides, current, fence = [], [], None
+    for line in body.splitlines():
+        fence, is_fence = _fence_state(line, fence)
+        if fence is None and not is_fence and _SEPARATOR.match(line):
+            slides.append("\n".join(current))
+            current = []
+            continue
+        current.append(line)
+    slides.append("\n".join(current))
+    return slides
+
+
+_COMMENT = re.compile(r"<!--(.*?)-->", re.DOTALL)
+
+
+def _segments(markdown: str):
+    """Yield (is_code, text) runs of a slide, separating fenced code blocks."""
+    buffer, fence = [], None
+    for line in markdown.splitlines(keepends=True):
+        opened = fence is None
+        fence, is_fence = _fence_state(line, fence)
+        if is_fence and opened:
+            yield False, "".join(buffer)
+            buffer = [line]
+        elif is_fence:
+            buffer.append(line)
+            yield True, "".join(buffer)
+            buffer = []
+        else:
+            buffer.append(line)
+    yield fence is not None, "".join(buffer)
+
+
+def extract_directives(markdown: str):
+    """
+    Pull HTML-comment directives out of one slide.
+
+    Returns (directives, markdown without comments). Comments that are not
+    directives are dropped too, as Marp does; comments in code are kept.
+    """
+    directives, parts = {}, []
+    for is_code, text in _segments(markdown):
+        if not is_code:
+            for comment in _COMMENT.findall(text):
+                directives.update(parse_directives(comment))
+            text = _COMMENT.sub("", text)
+        parts.append(text)
+    return directives, "".join(parts)
+
+
+# =============================================================================
+# MARKDOWN
+# =============================================================================
+
+_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_BLOCKQUOTE = re.compile(r"^ {0,3}> ?(.*)$")
+_LIST_ITEM = re.compile(r"^( *)([-*+]|\d{1,9}[.)])[ \t]+(.*)$")
+_TABLE_SEP = re.compile(r"^ {0,3}\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_HTML_BLOCK = re.compile(
+    r"^ {0,3}(?:<(?:/?(?:address|article|aside|blockquote|details|div|dl|figure|figcaption|footer|"
+    r"h[1-6]|header|hr|iframe|li|nav|ol|p|pre|section|summary|table|tbody|td|tfoot|th|thead|tr|ul)"
+    r"(?=[\s/>]|$))|<[A-Za-z][\w-]*(?:\s[^<>]*)?/?>\s*$|</[A-Za-z][\w-]*>\s*$)"
+)
+
+_ESCAPABLE = re.compile(r"\\([!-/:-@\[-`{-~])")
+_CODE_SPAN = re.compile(r"(`+)(.+?)(?<!`)\1(?!`)", re.DOTALL)
+_AUTOLINK = re.compile(r"<(https?://[^<>\s]+)>")
+_INLINE_TAG = re.compile(r"</?[A-Za-z][\w-]*(?:\s[^<>]*)?/?>")
+_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)\s]*)(?:\s+&quot;(.*?)&quot;)?\)')
+_LINK = re.compile(r'\[([^\]]+)\]\(([^)\s]*)(?:\s+&quot;(.*?)&quot;)?\)')
+_EMPHASIS = [
+    (re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w])__(?=\S)(.+?)(?<=\S)__(?![\w])"), r"<strong>\1</strong>"),
+    (re.compile(r"\*(?=[^\s*])(.+?)(?<=[^\s*])\*"), r"<em>\1</em>"),
+    (re.compile(r"(?<![\w])_(?=\S)(.+?)(?<=\S)_(?![\w])"), r"<em>\1</em>"),
+    (re.compile(r"~~(?=\S)(.+?)(?<=\S)~~"), r"<s>\1</s>"),
+]
+
+
+def escape(text: str) -> str:
+    """Escape text content (markdown-it style: quotes too, apostrophes kept)."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def render_inline(text: str) -> str:
+    """Render inline markdown: code, links, images, emphasis and raw HTML."""
+    stash = []
+
+    def keep(html_fragment):
+        stash.append(html_fragment)
+        return f"\x00{len(stash) - 1}\x00"
+
+    text = _CODE_SPAN.sub(lambda m: keep(f"<code>{escape(m.group(2).strip() or m.group(2))}</code>"), text)
+    text = _ESCAPABLE.sub(lambda m: keep(escape(m.group(1))), text)
+    text = _AUTOLINK.sub(lambda m: keep(f'<a href="{escape(m.group(1))}">{escape(m.group(1))}</a>'), text)
+    text = _INLINE_TAG.sub(lambda m: keep(m.group(0)), text)
+    text = escape(text)
+
+    def image(m):
+        title = f' title="{m.group(3)}"' if m.group(3) else ""
+        return keep(f'<img src="{m.group(2)}" alt="{m.group(1)}"{title} />')
+
+    def link(m):
+        title = f' title="{m.group(3)}"' if m.group(3) else ""
+        return f'<a href="{m.group(2)}"{title}>{m.group(1)}</a>'
+
+    text = _IMAGE.sub(image, text)
+    text = _LINK.sub(link, text)
+    for pattern, replacement in _EMPHASIS:
+        text = pattern.sub(replacement, text)
+    while "\x00" in text:
+        text = re.sub(r"\x00(\d+)\x00", lambda m: stash[int(m.group(1))], text)
+    return text
+
+
+def _table_cells(line: str) -> list:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _render_table(header: str, separator: str, rows: list) -> str:
+    aligns = []
+    for cell in _table_cells(separator):
+        left, right = cell.startswith(":"), cell.endswith(":")
+        aligns.append("center" if left and right else "right" if right else "left" if left else None)
+
+    def row_html(cells, tag):
+        cells = (cells + [""] * len(aligns))[:len(aligns)]
+        html_cells = []
+        for cell, align in zip(cells, aligns):
+            style = f' style="text-align:{align}"' if align else ""
+            html_cells.append(f"<{tag}{style}>{render_inline(cell)}</{tag}>\n")
+        return "<tr>\n" + "".join(html_cells) + "</tr>\n"
+
+    body = "".join(row_html(_table_cells(row), "td") for row in rows)
+    return ("<table>\n<thead>\n" + row_html(_table_cells(header), "th") + "</thead>\n"
+            + (f"<tbody>\n{body}</tbody>\n" if body else "") + "</table>")
+
+
+def _is_block_start(lines: list, i: int) -> bool:
+    """Whether lines[i] starts a non-paragraph block (ends a paragraph)."""
+    line = lines[i]
+    return bool(
+        _FENCE.match(line) or _HEADING.match(line) or _BLOCKQUOTE.match(line)
+        or _LIST_ITEM.match(line) or _HTML_BLOCK.match(line)
+        or ("|" in line and i + 1 < len(lines) and _TABLE_SEP.match(lines[i + 1]))
+    )
+
+
+def _render_list(lines: list, i: int):
+    """Render the list starting at lines[i]; returns (html, next index)."""
+    first = _LIST_ITEM.match(lines[i])
+    indent, ordered = len(first.group(1)), first.group(2)[0].isdigit()
+    items = []
+    while i < len(lines):
+        match = _LIST_ITEM.match(lines[i])
+        if not match or len(match.group(1)) != indent or match.group(2)[0].isdigit() != ordered:
+            break
+        content = [match.group(3)]
+        child_indent = indent + len(match.group(2)) + 1
+        i += 1
+        while i < len(lines):
+            line = lines[i]
+            if not line.strip():
+                if i + 1 < len(lines) and len(lines[i + 1]) - len(lines[i + 1].lstrip()) > indent:
+                    content.append("")
+                    i += 1
+                    continue
+                break
+            if len(line) - len(line.lstrip()) > indent:
+                content.append(line[min(child_indent, len(line) - len(line.lstrip())):])
+            elif _is_block_start(lines, i):
+                break
+            else:
+                content.append(line)  # Lazy continuation
+            i += 1
+        items.append(content)
+
+    tag = "ol" if ordered else "ul"
+    start = int(first.group(2)[:-1]) if ordered else 1
+    out = [f'<{tag} start="{start}">' if start != 1 else f"<{tag}>"]
+    for content in items:
+        text = []
+        while content and content[0].strip() and not (len(text) and _is_block_start(content, 0)):
+            text.append(content.pop(0))
+        inner = "<br />\n".join(render_inline(t.strip()) for t in text)
+        rest = "\n".join(_render_blocks(content)) if any(c.strip() for c in content) else ""
+        out.append(f"<li>{inner}\n{rest}\n</li>" if rest else f"<li>{inner}</li>")
+    out.append(f"</{tag}>")
+    return "\n".join(out), i
+
+
+def _render_blocks(lines: list) -> list:
+    out = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            i += 1
+            continue
+
+        fence = _FENCE.match(line)
+        if fence:
+            marker = fence.group(1)
+            info = line.strip()[len(marker):].strip()
+            lang = info.split()[0] if info else ""
+            code = []
+            i += 1
+            while i < len(lines) and _fence_state(lines[i], marker) != (None, True):
+                code.append(lines[i])
+                i += 1
+            i += 1
+            cls = f' class="language-{escape(lang)}"' if lang else ""
+            body = escape("\n".join(code) + "\n") if code else ""
+            out.append(f"<pre><code{cls}>{body}</code></pre>")
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{render_inline(heading.group(2) or '')}</h{level}>")
+            i += 1
+            continue
+
+        if _BLOCKQUOTE.match(line):
+            quoted = []
+            while i < len(lines) and lines[i].strip():
+                match = _BLOCKQUOTE.match(lines[i])
+                quoted.append(match.group(1) if match else lines[i])
+                i += 1
+            out.append("<blockquote>\n" + "\n".join(_render_blocks(quoted)) + "\n</blockquote>")
+            continue
+
+        if _LIST_ITEM.match(line):
+            html_list, i = _render_list(lines, i)
+            out.append(html_list)
+            continue
+
+        if "|" in line and i + 1 < len(lines) and _TABLE_SEP.match(lines[i + 1]):
+            header, separator = line, lines[i + 1]
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip() and "|" in lines[i]:
+                rows.append(lines[i])
+                i += 1
+            out.append(_render_table(header, separator, rows))
+            continue
+
+        if _HTML_BLOCK.match(line):
+            raw = []
+            while i < len(lines) and lines[i].strip():
+                raw.append(lines[i])
+                i += 1
+            out.append("\n".join(raw))
+            continue
+
+        paragraph = [line.strip()]
+        i += 1
+        while i < len(lines) and lines[i].strip() and not _is_block_start(lines, i):
+            paragraph.append(lines[i].strip())
+            i += 1
+        # Marp renders single newlines as line breaks
+        out.append("<p>" + "<br />\n".join(render_inline(p) for p in paragraph) + "</p>")
+    return out
+
+
+def render_markdown(markdown: str) -> str:
+    """Render one slide's markdown to HTML."""
+    return "\n".join(_render_blocks(markdown.splitlines()))
+
+
+# =============================================================================
+# THEME CSS
+# =============================================================================
+
+def _scope_selector(selector: str) -> str:
+    """Scope one selector to Marpit's slide sections."""
+    selector = selector.strip()
+    if selector.startswith(":root"):
+        return SECTION_SCOPE + selector[len(":root"):]
+    if re.match(r"section(?![\w-])", selector):
+        return SECTION_SCOPE[:-len("section")] + selector
+    return f"{SECTION_SCOPE} {selector}"
+
+
+def _matching_brace(css: str, start: int) -> int:
+    """Index of the "}" closing the "{" at `start`."""
+    depth = 0
+    for i in range(start, len(css)):
+        if css[i] == "{":
+            depth += 1
+        elif css[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(css)
+
+
+def scope_css(css: str) -> str:
+    """
+    Scope theme CSS the way Marpit does.
+
+    `:root` and `section` selectors target each slide section; any other
+    selector is nested under it. @media/@supports blocks are scoped
+    recursively; other at-rules (@font-face, @keyframes, @import) are kept.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    out = []
+    i = 0
+    while True:
+        brace = css.find("{", i)
+        semicolon = css.find(";", i)
+        if brace == -1:
+            break
+        prelude = css[i:brace].strip()
+        if prelude.startswith("@") and -1 < semicolon < brace:  # @import / @charset
+            out.append(css[i:semicolon + 1].strip())
+            i = semicolon + 1
+            continue
+        end = _matching_brace(css, brace)
+        body = css[brace + 1:end]
+        if prelude.startswith(("@media", "@supports")):
+            out.append(f"{prelude} {{\n{scope_css(body)}\n}}")
+        elif prelude.startswith("@"):
+            out.append(f"{prelude} {{{body}}}")
+        else:
+            selectors = ",\n".join(_scope_selector(s) for s in prelude.split(",") if s.strip())
+            out.append(f"{selectors} {{{body}}}")
+        i = end + 1
+    return "\n".join(out)
+
+
+@lru_cache(maxsize=32)
+def scoped_theme_css(style: str = "", cache_dir=DEFAULT_CACHE_DIR) -> str:
+    """
+    Base theme plus the deck's `style` CSS, scoped; cached by content hash.
+
+    Kept in memory for repeated builds in one process (watch mode) and on
+    disk under cache_dir/<hash>.css for later processes. Set cache_dir=None
+    to skip the disk cache.
+    """
+    key = hashlib.sha256((BASE_THEME_CSS + "\0" + style).encode()).hexdigest()[:16]
+    path = Path(cache_dir) / f"{key}.css" if cache_dir is not None else None
+    if path is not None and path.exists():
+        return path.read_text()
+    css = scope_css(BASE_THEME_CSS) + "\n" + scope_css(style)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(css)
+        tmp.replace(path)
+    return css
+
+
+# =============================================================================
+# DECK
+# =============================================================================
+
+def _kebab(name: str) -> str:
+    return re.sub(r"([A-Z])", lambda m: "-" + m.group(1).lower(), name)
+
+
+def _directive_value(value) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def render_slide(number: int, total: int, markdown: str, directives: dict,
+                 theme: str = "default", size=(1280, 720), lang: str = "en") -> str:
+    """Render one slide as Marpit's <svg><foreignObject><section> markup."""
+    width, height = size
+    attrs = [f'id="{number}"', f'data-theme="{escape(theme)}"', f'lang="{escape(lang)}"']
+    style = []
+    for key, value in directives.items():
+        text = escape(_directive_value(value))
+        attrs.append(f'data-{_kebab(key)}="{text}"')
+        style.append(f"--{key}:{text};")
+    if directives.get("class"):
+        attrs.append(f'class="{escape(str(directives["class"]))}"')
+    if directives.get("paginate") is True:
+        attrs.append(f'data-marpit-pagination="{number}" data-marpit-pagination-total="{total}"')
+    if directives.get("backgroundColor"):
+        style.append(f"background-color:{escape(str(directives['backgroundColor']))};")
+    if directives.get("backgroundImage"):
+        style.append(f"background-image:{escape(str(directives['backgroundImage']))};")
+    if directives.get("color"):
+        style.append(f"color:{escape(str(directives['color']))};")
+    if style:
+        attrs.append(f'style="{"".join(style)}"')
+
+    content = render_markdown(markdown)
+    if directives.get("header"):
+        content = f"<header>{render_inline(str(directives['header']))}</header>\n{content}"
+    if directives.get("footer"):
+        content = f"{content}\n<footer>{render_inline(str(directives['footer']))}</footer>"
+    return (f'<svg data-marpit-svg="" viewBox="0 0 {width} {height}">'
+            f'<foreignObject width="{width}" height="{height}">'
+            f"<section {' '.join(attrs)}>\n{content}\n</section></foreignObject></svg>")
+
+
+def render_slides(source: str, cache_dir=DEFAULT_CACHE_DIR) -> dict:
+    """
+    Render a deck's slides without wrapping them in a document.
+
+    Returns {"slides": [svg markup, ...], "theme_css", "title", "lang",
+    "size"}; render_deck() and marp_export build documents from it.
+    """
+    front_matter, body = parse_front_matter(source)
+    global_directives = dict(front_matter)
+    inherited = {k: v for k, v in front_matter.items() if k in LOCAL_DIRECTIVES}
+
+    slides = []
+    for markdown in split_slides(body):
+        directives, markdown = extract_directives(markdown)
+        scoped = {}
+        for key, value in directives.items():
+            if key.startswith("_") and key[1:] in LOCAL_DIRECTIVES:
+                scoped[key[1:]] = value
+            elif key in LOCAL_DIRECTIVES:
+                inherited[key] = value
+            elif key in GLOBAL_DIRECTIVES:
+                global_directives[key] = value
+        slides.append((markdown, {**inherited, **scoped}))
+
+    theme = str(global_directives.get("theme", "default"))
+    size = SLIDE_SIZES.get(str(global_directives.get("size", "16:9")), SLIDE_SIZES["16:9"])
+    lang = str(global_directives.get("lang", "en"))
+    rendered = [
+        render_slide(n, len(slides), markdown, directives, theme, size, lang)
+        for n, (markdown, directives) in enumerate(slides, 1)
+    ]
+
+    title = global_directives.get("title")
+    if title is None:
+        first_heading = re.search(r"<h1>(.*?)</h1>", rendered[0]) if rendered else None
+        title = re.sub(r"<[^>]+>", "", first_heading.group(1)) if first_heading else "Slides"
+        title = html.unescape(title)
+    return {
+        "slides": rendered,
+        "theme_css": scoped_theme_css(str(global_directives.get("style", "")), cache_dir),
+        "title": str(title),
+        "lang": lang,
+        "size": size,
+    }
+
+
+def html_document(slides: list, theme_css: str, title: str, lang: str = "en",
+                  page_css: str = DOCUMENT_CSS) -> str:
+    """Wrap rendered slides in a standalone HTML document."""
+    return _DOCUMENT.format(lang=escape(lang), title=escape(title), css=page_css + theme_css,
+                            slides="\n".join(slides))
+
+
+def render_deck(source: str, cache_dir=DEFAULT_CACHE_DIR, title: str = None) -> str:
+    """Render a whole Marp markdown deck to a standalone HTML document."""
+    deck = render_slides(source, cache_dir)
+    return html_document(deck["slides"], deck["theme_css"], title or deck["title"], deck["lang"])
+
+
+def render_file(path, output=None, cache_dir=DEFAULT_CACHE_DIR) -> Path:
+    """Render a .md deck to HTML (default: same name with .html); returns the output path."""
+    path = Path(path)
+    output = Path(output) if output else path.with_suffix(".html")
+    output.write_text(render_deck(path.read_text(encoding="utf-8"), cache_dir), encoding="utf-8")
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a Marp markdown deck to HTML (no Node needed).")
+    parser.add_argument("file", help="Marp markdown deck")
+    parser.add_argument("-o", "--output", default=None, help="HTML output (default: <file>.html)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="theme CSS cache directory")
+    args = parser.parse_args(argv)
+
+    output = render_file(args.file, args.output, args.cache_dir)
+    print(f"✅ Rendered: {output.absolute()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,46 +7,49 @@ This template includes all the patterns and helper functions developed for
 customer briefings, with consistent styling across all slides.
 
 Usage:
-    1. Copy this file to your project
-    2. Customize the SLIDES section at the bottom
+    1. Copy this file and brand.py to your project
+    2. Customize build_presentation() at the bottom
     3. Run: python3 create_presentation.py
 """
 
+import copy
+import functools
+import inspect
+import re
+from xml.sax.saxutils import escape
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+from brand import PALETTE
 
 # =============================================================================
 # SNOWFLAKE BRAND COLORS
 # =============================================================================
 class Colors:
-    """Snowflake brand colors for consistent styling."""
-    SF_BLUE = RGBColor(41, 181, 232)        # #29B5E8 - Accent, links
-    SF_DARK_BLUE = RGBColor(17, 86, 127)    # #11567F - Titles, headers
-    SF_NAVY = RGBColor(13, 44, 84)          # #0D2C54 - Table headers
-    SF_LIGHT_BG = RGBColor(244, 250, 255)   # #F4FAFF - Backgrounds
-    SF_GRAY = RGBColor(110, 118, 129)       # #6E7681 - Subtitles
-    TABLE_HEADER = RGBColor(41, 128, 185)   # Blue for table headers
-    WHITE = RGBColor(255, 255, 255)
-    BLACK = RGBColor(26, 26, 26)
-    LIGHT_GRAY = RGBColor(100, 100, 100)
-    RED = RGBColor(180, 50, 50)             # For "before" examples
-    GREEN = RGBColor(50, 150, 50)           # For "after" examples
-    HIGHLIGHT_GREEN = RGBColor(39, 174, 96) # For filled values
-
-# =============================================================================
-# PRESENTATION SETUP
-# =============================================================================
-prs = Presentation()
-prs.slide_width = Inches(13.333)  # 16:9 aspect ratio
-prs.slide_height = Inches(7.5)
-
-# Get layouts
-blank_layout = prs.slide_layouts[6]  # Blank - used for all custom slides
+    """Snowflake brand colors for consistent styling (see brand.PALETTE)."""
+    SF_BLUE = RGBColor.from_string(PALETTE["SF_BLUE"])
+    SF_DARK_BLUE = RGBColor.from_string(PALETTE["SF_DARK_BLUE"])
+    SF_NAVY = RGBColor.from_string(PALETTE["SF_NAVY"])
+    SF_LIGHT_BG = RGBColor.from_string(PALETTE["SF_LIGHT_BG"])
+    SF_GRAY = RGBColor.from_string(PALETTE["SF_GRAY"])
+    TABLE_HEADER = RGBColor.from_string(PALETTE["TABLE_HEADER"])
+    WHITE = RGBColor.from_string(PALETTE["WHITE"])
+    BLACK = RGBColor.from_string(PALETTE["BLACK"])
+    LIGHT_GRAY = RGBColor.from_string(PALETTE["LIGHT_GRAY"])
+    RED = RGBColor.from_string(PALETTE["RED"])
+    GREEN = RGBColor.from_string(PALETTE["GREEN"])
+    HIGHLIGHT_GREEN = RGBColor.from_string(PALETTE["HIGHLIGHT_GREEN"])
+    TITLE_SUBTITLE = RGBColor.from_string(PALETTE["TITLE_SUBTITLE"])
+    FOOTER_LIGHT = RGBColor.from_string(PALETTE["FOOTER_LIGHT"])
+    FOOTER = RGBColor.from_string(PALETTE["FOOTER"])
 
 # =============================================================================
-# HELPER FUNCTIONS
+# SLIDE HELPER FUNCTIONS
 # =============================================================================
 
 def add_copyright_footer(slide, light=False):
@@ -56,9 +59,9 @@ def add_copyright_footer(slide, light=False):
     tf.paragraphs[0].text = "© 2026 Snowflake Inc. All Rights Reserved | Confidential"
     tf.paragraphs[0].font.size = Pt(9)
     if light:
-        tf.paragraphs[0].font.color.rgb = RGBColor(160, 196, 232)
+        tf.paragraphs[0].font.color.rgb = Colors.FOOTER_LIGHT
     else:
-        tf.paragraphs[0].font.color.rgb = RGBColor(150, 150, 150)
+        tf.paragraphs[0].font.color.rgb = Colors.FOOTER
 
 
 def add_doc_link(slide, url, display_text=None):
@@ -72,116 +75,6 @@ def add_doc_link(slide, url, display_text=None):
     tf.paragraphs[0].font.color.rgb = Colors.LIGHT_GRAY
 
 
-def add_title_slide(title, subtitle="", event_name="", date_presenter=""):
-    """
-    Add a title slide with dark blue background.
-    Used for presentation title and section dividers.
-    """
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Dark blue background
-    bg = slide.shapes.add_shape(1, Inches(0), Inches(0), prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = Colors.SF_DARK_BLUE
-    bg.line.fill.background()
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.3), Inches(1))
-    tf = title_box.text_frame
-    tf.paragraphs[0].text = title
-    tf.paragraphs[0].font.size = Pt(44)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = Colors.WHITE
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    # Subtitle
-    if subtitle:
-        sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.6), Inches(12.3), Inches(0.8))
-        tf = sub_box.text_frame
-        tf.paragraphs[0].text = subtitle
-        tf.paragraphs[0].font.size = Pt(24)
-        tf.paragraphs[0].font.color.rgb = RGBColor(232, 244, 252)
-        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    # Event name
-    if event_name:
-        event_box = slide.shapes.add_textbox(Inches(0.5), Inches(4.5), Inches(12.3), Inches(0.6))
-        tf = event_box.text_frame
-        tf.paragraphs[0].text = event_name
-        tf.paragraphs[0].font.size = Pt(18)
-        tf.paragraphs[0].font.color.rgb = RGBColor(232, 244, 252)
-        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    # Date/Presenter
-    if date_presenter:
-        date_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.2), Inches(12.3), Inches(0.5))
-        tf = date_box.text_frame
-        tf.paragraphs[0].text = date_presenter
-        tf.paragraphs[0].font.size = Pt(14)
-        tf.paragraphs[0].font.color.rgb = RGBColor(160, 196, 232)
-        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    add_copyright_footer(slide, light=True)
-    return slide
-
-
-def add_section_slide(title, subtitle=""):
-    """Add a section divider slide with dark blue background."""
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Dark blue background
-    bg = slide.shapes.add_shape(1, Inches(0), Inches(0), prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = Colors.SF_DARK_BLUE
-    bg.line.fill.background()
-    
-    # Title - centered
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.8), Inches(12.3), Inches(1))
-    tf = title_box.text_frame
-    tf.paragraphs[0].text = title
-    tf.paragraphs[0].font.size = Pt(40)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = Colors.WHITE
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    if subtitle:
-        sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.9), Inches(12.3), Inches(0.8))
-        tf = sub_box.text_frame
-        tf.paragraphs[0].text = subtitle
-        tf.paragraphs[0].font.size = Pt(20)
-        tf.paragraphs[0].font.color.rgb = RGBColor(232, 244, 252)
-        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    add_copyright_footer(slide, light=True)
-    return slide
-
-
-def add_content_slide(title, subtitle=""):
-    """
-    Add a content slide with fixed header position.
-    Returns the slide for adding additional content.
-    """
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Title at fixed position
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-    tf = title_box.text_frame
-    tf.paragraphs[0].text = title
-    tf.paragraphs[0].font.size = Pt(28)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = Colors.SF_DARK_BLUE
-    
-    if subtitle:
-        sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.9), Inches(12), Inches(0.4))
-        tf = sub_box.text_frame
-        tf.paragraphs[0].text = subtitle
-        tf.paragraphs[0].font.size = Pt(16)
-        tf.paragraphs[0].font.color.rgb = Colors.SF_GRAY
-    
-    add_copyright_footer(slide)
-    return slide
-
-
 def add_text_content(slide, content, left=0.5, top=1.4, width=12, height=5):
     """Add text content to a slide."""
     content_box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
@@ -192,34 +85,146 @@ def add_text_content(slide, content, left=0.5, top=1.4, width=12, height=5):
     return content_box
 
 
+# Table style python-pptx applies to new tables ("Medium Style 2 - Accent 1")
+DEFAULT_TABLE_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+
+
+def _paragraph_style_xml(font_size, color=None, bold=False):
+    """Shared <a:pPr> for every cell of one row style (header or body)."""
+    bold_attr = ' b="1"' if bold else ""
+    if color is None:
+        return f'<a:pPr><a:defRPr sz="{font_size * 100}"{bold_attr}/></a:pPr>'
+    return (f'<a:pPr><a:defRPr sz="{font_size * 100}"{bold_attr}>'
+            f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:defRPr></a:pPr>')
+
+
+# Characters XML cannot hold; python-pptx writes them as "_x0007_" escapes
+_CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def _escape_ctrl_chars(text):
+    """Control characters as plain-text escapes ("\\x07" -> "_x0007_"), as python-pptx does."""
+    return _CTRL_CHARS_RE.sub(lambda match: "_x%04X_" % ord(match.group(0)), text)
+
+
+def _runs_xml(text):
+    """Runs for one paragraph; vertical tabs become line breaks, as in python-pptx."""
+    return "<a:br/>".join(
+        f"<a:r><a:t>{escape(_escape_ctrl_chars(part))}</a:t></a:r>" if part else "" for part in text.split("\v")
+    )
+
+
+def _cell_xml(text, paragraph_style, cell_props):
+    """One <a:tc>; the style applies to the first paragraph, like cell.text + para.font."""
+    paragraphs = str(text).split("\n")
+    body = f"<a:p>{paragraph_style}{_runs_xml(paragraphs[0])}</a:p>"
+    body += "".join(f"<a:p>{_runs_xml(p)}</a:p>" if p else "<a:p/>" for p in paragraphs[1:])
+    return f"<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{body}</a:txBody>{cell_props}</a:tc>"
+
+
+def build_table_xml(data, width, height, font_size=12, body_color=Colors.BLACK, row_heights=None):
+    """
+    Build the <a:tbl> XML for a whole styled table in one pass.
+    
+    `width` and `height` are EMU and are split across columns/rows exactly
+    as python-pptx does, unless explicit EMU `row_heights` are given. The
+    first row uses the header style (bold white on TABLE_HEADER); the rest
+    use the body style. Style fragments are built once and shared by every
+    cell.
+    """
+    rows, cols = len(data), len(data[0])
+    col_width, row_height = width // cols, height // rows
+    col_widths = [col_width] * (cols - 1) + [width - (cols - 1) * col_width]
+    if row_heights is None:
+        row_heights = [row_height] * (rows - 1) + [height - (rows - 1) * row_height]
+    
+    header_style = _paragraph_style_xml(font_size, Colors.WHITE, bold=True)
+    header_props = f'<a:tcPr><a:solidFill><a:srgbClr val="{Colors.TABLE_HEADER}"/></a:solidFill></a:tcPr>'
+    body_style = _paragraph_style_xml(font_size, body_color)
+    body_props = "<a:tcPr/>"
+    
+    parts = [
+        f'<a:tbl {nsdecls("a")}><a:tblPr firstRow="1" bandRow="1">'
+        f"<a:tableStyleId>{DEFAULT_TABLE_STYLE_ID}</a:tableStyleId></a:tblPr><a:tblGrid>",
+        "".join(f'<a:gridCol w="{w}"/>' for w in col_widths),
+        "</a:tblGrid>",
+    ]
+    for i, row_data in enumerate(data):
+        style, props = (header_style, header_props) if i == 0 else (body_style, body_props)
+        parts.append(f'<a:tr h="{row_heights[i]}">')
+        parts.append("".join(_cell_xml(cell_text, style, props) for cell_text in row_data))
+        parts.append("</a:tr>")
+    parts.append("</a:tbl>")
+    return "".join(parts)
+
+
+def add_styled_table(slide, data, left, top, width, height, font_size=12, body_color=Colors.BLACK,
+                     row_heights=None):
+    """
+    Add a table whose XML is generated in bulk (positions/sizes in EMU).
+    
+    python-pptx creates the graphic frame; its placeholder <a:tbl> is then
+    swapped for the fully styled one, so no cell is touched through the
+    object model.
+    """
+    frame = slide.shapes.add_table(1, len(data[0]), left, top, width, height)
+    graphic_data = frame._element.graphic.graphicData
+    graphic_data.replace(graphic_data.tbl, parse_xml(
+        build_table_xml(data, width, height, font_size=font_size, body_color=body_color,
+                        row_heights=row_heights)
+    ))
+    return frame.table
+
+
 def add_table(slide, data, left=0.5, top=1.5, width=12, row_height=0.4):
     """
     Add a styled table to a slide.
     First row is treated as header (blue background, white text).
     """
-    rows = len(data)
-    cols = len(data[0])
-    
-    table_shape = slide.shapes.add_table(rows, cols, Inches(left), Inches(top), 
-                                          Inches(width), Inches(row_height * rows))
-    table = table_shape.table
-    
-    for i, row_data in enumerate(data):
-        for j, cell_text in enumerate(row_data):
-            cell = table.cell(i, j)
-            cell.text = str(cell_text)
-            para = cell.text_frame.paragraphs[0]
-            para.font.size = Pt(12)
-            
-            if i == 0:  # Header row
-                para.font.bold = True
-                para.font.color.rgb = Colors.WHITE
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = Colors.TABLE_HEADER
-            else:
-                para.font.color.rgb = Colors.BLACK
+    return add_styled_table(slide, data, Inches(left), Inches(top), Inches(width),
+                            Inches(row_height * len(data)))
+
+
+# Bottom edge for paginated tables: clear of the doc link (6.5") and footer (7.0")
+TABLE_BOTTOM = 6.4
+# Average characters per inch of column width for 12pt body text
+CHARS_PER_INCH = 12
+
+
+def row_lines(row, col_width, font_size=12):
+    """Estimated text lines in a table row: explicit newlines plus wrapping."""
+    chars = max(1, int(col_width * CHARS_PER_INCH * 12 / font_size))
+    return max(
+        sum(-(-len(line) // chars) or 1 for line in str(cell).split("\n"))
+        for cell in row
+    )
+
+
+def paginate_table(data, available_height, width=12, row_height=0.4, font_size=12):
+    """
+    Split a table into pages that fit `available_height` inches.
     
-    return table
+    Rows are measured once (row_height per estimated text line) and packed
+    greedily in a single pass, so layout is linear in the number of rows.
+    Every page repeats the header row. A row taller than a whole page gets
+    a page to itself. Returns [(rows, row_heights_inches), ...].
+    """
+    header, body = data[0], data[1:]
+    col_width = width / len(header)
+    header_height = row_height * row_lines(header, col_width, font_size)
+    
+    pages = []
+    rows, heights, used = [header], [header_height], header_height
+    for row in body:
+        height = row_height * row_lines(row, col_width, font_size)
+        if len(rows) > 1 and used + height > available_height:
+            pages.append((rows, heights))
+            rows, heights, used = [header], [header_height], header_height
+        rows.append(row)
+        heights.append(height)
+        used += height
+    pages.append((rows, heights))
+    return pages
 
 
 def add_code_block(slide, code, left=0.5, top=1.5, width=12, height=3, font_size=11):
@@ -233,242 +238,455 @@ def add_code_block(slide, code, left=0.5, top=1.5, width=12, height=3, font_size
     return code_box
 
 
-def add_before_after_slide(title, problem, before_code, after_code, 
-                           comparison_data=None, customer_quote=None, doc_url=None):
-    """
-    Add a before/after comparison slide.
-    This is a key pattern for showing value of new features.
-    """
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(12), Inches(0.5))
-    tf = title_box.text_frame
-    tf.paragraphs[0].text = title
-    tf.paragraphs[0].font.size = Pt(28)
-    tf.paragraphs[0].font.bold = True
-    
-    # Problem statement
-    problem_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.7), Inches(12), Inches(0.4))
-    tf = problem_box.text_frame
-    tf.paragraphs[0].text = f"Problem: {problem}"
-    tf.paragraphs[0].font.size = Pt(14)
-    tf.paragraphs[0].font.bold = True
-    
-    # BEFORE label
-    before_label = slide.shapes.add_textbox(Inches(0.3), Inches(1.1), Inches(6), Inches(0.3))
-    tf = before_label.text_frame
-    tf.paragraphs[0].text = "❌ BEFORE: Complex, error-prone, slow"
-    tf.paragraphs[0].font.size = Pt(13)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = Colors.RED
-    
-    # BEFORE code
-    before_box = slide.shapes.add_textbox(Inches(0.3), Inches(1.4), Inches(6.2), Inches(2.4))
-    tf = before_box.text_frame
-    tf.word_wrap = True
-    tf.paragraphs[0].text = before_code
-    tf.paragraphs[0].font.size = Pt(9)
-    tf.paragraphs[0].font.name = "Courier New"
-    
-    # AFTER label
-    after_label = slide.shapes.add_textbox(Inches(6.7), Inches(1.1), Inches(6), Inches(0.3))
-    tf = after_label.text_frame
-    tf.paragraphs[0].text = "✅ AFTER: Clean, fast, correct"
-    tf.paragraphs[0].font.size = Pt(13)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = Colors.GREEN
-    
-    # AFTER code
-    after_box = slide.shapes.add_textbox(Inches(6.7), Inches(1.4), Inches(6), Inches(1.5))
-    tf = after_box.text_frame
-    tf.word_wrap = True
-    tf.paragraphs[0].text = after_code
-    tf.paragraphs[0].font.size = Pt(11)
-    tf.paragraphs[0].font.name = "Courier New"
-    
-    # Comparison table (if provided)
-    if comparison_data:
-        table = slide.shapes.add_table(len(comparison_data), len(comparison_data[0]), 
-                                       Inches(6.7), Inches(3.0), Inches(6), Inches(1.5)).table
-        for i, row_data in enumerate(comparison_data):
-            for j, cell_text in enumerate(row_data):
-                cell = table.cell(i, j)
-                cell.text = str(cell_text)
-                para = cell.text_frame.paragraphs[0]
-                para.font.size = Pt(11)
-                if i == 0:
-                    para.font.bold = True
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = Colors.TABLE_HEADER
-                    para.font.color.rgb = Colors.WHITE
-    
-    # Customer quote (if provided)
-    if customer_quote:
-        quote_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.2), Inches(12), Inches(0.5))
-        tf = quote_box.text_frame
-        tf.paragraphs[0].text = f"🏆 {customer_quote}"
-        tf.paragraphs[0].font.size = Pt(14)
-        tf.paragraphs[0].font.bold = True
-    
-    # Doc link
-    if doc_url:
-        add_doc_link(slide, doc_url)
-    
-    add_copyright_footer(slide)
-    return slide
-
+# =============================================================================
+# DECK BUILDER
+# =============================================================================
 
-def add_value_prop_slide(title, subtitle, features_table, struggles, values, customer_quote=None, doc_url=None):
+def cloneable(method):
     """
-    Add a value proposition slide with:
-    - Feature table
-    - Common struggles we solve
-    - Business value delivered
-    - Optional customer quote
+    Let DeckBuilder(clone_prototypes=True) build this slide type by cloning.
+    
+    The first call for a given slide type and set of non-empty fields builds
+    the slide normally with "{{field}}" tokens as its text and keeps a copy
+    of its shapes as the prototype. Later calls deep-copy the prototype's
+    shape XML onto a new blank slide and swap the tokens for the real text,
+    skipping the python-pptx shape and font calls. Only for methods whose
+    arguments are all plain text.
     """
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(12), Inches(0.5))
-    tf = title_box.text_frame
-    tf.paragraphs[0].text = title
-    tf.paragraphs[0].font.size = Pt(28)
-    tf.paragraphs[0].font.bold = True
-    
-    # Subtitle (value prop)
-    sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.7), Inches(12), Inches(0.4))
-    tf = sub_box.text_frame
-    tf.paragraphs[0].text = subtitle
-    tf.paragraphs[0].font.size = Pt(13)
-    tf.paragraphs[0].font.italic = True
-    tf.paragraphs[0].font.color.rgb = Colors.SF_BLUE
-    
-    # Features table
-    add_table(slide, features_table, top=1.2, width=12.2, row_height=0.35)
-    
-    # Common struggles label
-    struggle_label = slide.shapes.add_textbox(Inches(0.5), Inches(3.6), Inches(6), Inches(0.3))
-    tf = struggle_label.text_frame
-    tf.paragraphs[0].text = "Common Struggles We Solve:"
-    tf.paragraphs[0].font.size = Pt(13)
-    tf.paragraphs[0].font.bold = True
-    
-    # Struggles list
-    struggle_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.9), Inches(5.5), Inches(1.5))
-    tf = struggle_box.text_frame
-    for i, struggle in enumerate(struggles):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = f"❌ {struggle}"
-        p.font.size = Pt(12)
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.clone_prototypes:
+            return method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        fields = dict(list(bound.arguments.items())[1:])
+        # Line breaks become <a:br/> runs and control characters "_x0007_"
+        # escapes (python-pptx's text setters); neither matches a plain token
+        if not all(isinstance(v, str) and "\n" not in v and not _CTRL_CHARS_RE.search(v) for v in fields.values()):
+            return method(self, *args, **kwargs)
+        
+        key = (method.__name__,) + tuple(name for name, value in fields.items() if value)
+        tokens = {"{{%s}}" % name: value for name, value in fields.items() if value}
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            slide = method(self, **{name: "{{%s}}" % name if value else value for name, value in fields.items()})
+            self._prototypes[key] = [copy.deepcopy(el) for el in _shape_elements(slide)]
+        else:
+            slide = self.new_slide()
+            sp_tree = slide.shapes._spTree
+            for element in prototype:
+                sp_tree.append(copy.deepcopy(element))
+        for text in slide._element.iter(qn("a:t")):
+            if text.text in tokens:
+                text.text = tokens[text.text]
+        return slide
+    
+    return wrapper
+
+
+def _shape_elements(slide):
+    """The slide's shape elements (spTree children after its group properties)."""
+    return list(slide.shapes._spTree)[2:]
+
+
+class DeckBuilder:
+    """
+    Builds one presentation.
     
-    # Value label
-    value_label = slide.shapes.add_textbox(Inches(7), Inches(3.6), Inches(6), Inches(0.3))
-    tf = value_label.text_frame
-    tf.paragraphs[0].text = "Business Value Delivered:"
-    tf.paragraphs[0].font.size = Pt(13)
-    tf.paragraphs[0].font.bold = True
+    Each builder owns its own Presentation, so several decks can be built
+    in one process, back to back or concurrently (one builder per thread or
+    worker). Slide-level helpers (add_table, add_doc_link, ...) are also
+    exposed as methods for convenience.
     
-    # Values list
-    value_box = slide.shapes.add_textbox(Inches(7), Inches(3.9), Inches(5.5), Inches(1.5))
-    tf = value_box.text_frame
-    for i, value in enumerate(values):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = f"✅ {value}"
-        p.font.size = Pt(12)
+    With clone_prototypes=True, repeated title/section/content slides are
+    made by cloning a prototype slide's XML instead of rebuilding every
+    shape (see cloneable); the output is identical.
+    """
     
-    # Customer quote
-    if customer_quote:
-        quote_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.6), Inches(12), Inches(0.5))
-        tf = quote_box.text_frame
-        tf.paragraphs[0].text = f"🏆 {customer_quote}"
-        tf.paragraphs[0].font.size = Pt(12)
+    # Slide-level helpers work on any slide and need no deck state
+    add_copyright_footer = staticmethod(add_copyright_footer)
+    add_doc_link = staticmethod(add_doc_link)
+    add_text_content = staticmethod(add_text_content)
+    add_table = staticmethod(add_table)
+    add_code_block = staticmethod(add_code_block)
+    
+    def __init__(self, template=None, clone_prototypes=False):
+        self.prs = Presentation(template)
+        self.clone_prototypes = clone_prototypes
+        self._prototypes = {}  # (method, non-empty fields) -> shape elements
+        self.prs.slide_width = Inches(13.333)  # 16:9 aspect ratio
+        self.prs.slide_height = Inches(7.5)
+        self.blank_layout = self.prs.slide_layouts[6]  # Blank - used for all custom slides
+    
+    @property
+    def slide_count(self):
+        return len(self.prs.slides)
+    
+    def new_slide(self):
+        """Add an empty slide using the blank layout."""
+        return self.prs.slides.add_slide(self.blank_layout)
+    
+    def save(self, output_path):
+        """Save the presentation and return the output path."""
+        self.prs.save(output_path)
+        return output_path
+    
+    @cloneable
+    def add_title_slide(self, title, subtitle="", event_name="", date_presenter=""):
+        """
+        Add a title slide with dark blue background.
+        Used for presentation title and section dividers.
+        """
+        slide = self.new_slide()
+        
+        # Dark blue background
+        bg = slide.shapes.add_shape(1, Inches(0), Inches(0), self.prs.slide_width, self.prs.slide_height)
+        bg.fill.solid()
+        bg.fill.fore_color.rgb = Colors.SF_DARK_BLUE
+        bg.line.fill.background()
+        
+        # Title
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.3), Inches(1))
+        tf = title_box.text_frame
+        tf.paragraphs[0].text = title
+        tf.paragraphs[0].font.size = Pt(44)
         tf.paragraphs[0].font.bold = True
-    
-    if doc_url:
-        add_doc_link(slide, doc_url)
-    
-    add_copyright_footer(slide)
-    return slide
-
+        tf.paragraphs[0].font.color.rgb = Colors.WHITE
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        
+        # Subtitle
+        if subtitle:
+            sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.6), Inches(12.3), Inches(0.8))
+            tf = sub_box.text_frame
+            tf.paragraphs[0].text = subtitle
+            tf.paragraphs[0].font.size = Pt(24)
+            tf.paragraphs[0].font.color.rgb = Colors.TITLE_SUBTITLE
+            tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        
+        # Event name
+        if event_name:
+            event_box = slide.shapes.add_textbox(Inches(0.5), Inches(4.5), Inches(12.3), Inches(0.6))
+            tf = event_box.text_frame
+            tf.paragraphs[0].text = event_name
+            tf.paragraphs[0].font.size = Pt(18)
+            tf.paragraphs[0].font.color.rgb = Colors.TITLE_SUBTITLE
+            tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        
+        # Date/Presenter
+        if date_presenter:
+            date_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.2), Inches(12.3), Inches(0.5))
+            tf = date_box.text_frame
+            tf.paragraphs[0].text = date_presenter
+            tf.paragraphs[0].font.size = Pt(14)
+            tf.paragraphs[0].font.color.rgb = Colors.FOOTER_LIGHT
+            tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        
+        add_copyright_footer(slide, light=True)
+        return slide
 
-def add_roadmap_slide(title, pain_point, current_behavior, roadmap_table, planned_syntax=None, doc_url=None):
-    """
-    Add a roadmap slide for upcoming features.
-    """
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(12), Inches(0.5))
-    tf = title_box.text_frame
-    tf.paragraphs[0].text = title
-    tf.paragraphs[0].font.size = Pt(28)
-    tf.paragraphs[0].font.bold = True
-    
-    # Pain point quote
-    pain_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.9), Inches(12), Inches(0.8))
-    tf = pain_box.text_frame
-    tf.word_wrap = True
-    tf.paragraphs[0].text = f'"{pain_point}"'
-    tf.paragraphs[0].font.size = Pt(14)
-    tf.paragraphs[0].font.italic = True
-    
-    # Current behavior
-    current_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.7), Inches(12), Inches(0.4))
-    tf = current_box.text_frame
-    tf.paragraphs[0].text = f"Current: {current_behavior}"
-    tf.paragraphs[0].font.size = Pt(14)
-    
-    # Roadmap table
-    add_table(slide, roadmap_table, top=2.2, width=6, row_height=0.4)
-    
-    # Planned syntax
-    if planned_syntax:
-        syntax_label = slide.shapes.add_textbox(Inches(0.5), Inches(4.0), Inches(6), Inches(0.3))
-        tf = syntax_label.text_frame
-        tf.paragraphs[0].text = "Planned Syntax:"
+    @cloneable
+    def add_section_slide(self, title, subtitle=""):
+        """Add a section divider slide with dark blue background."""
+        slide = self.new_slide()
+        
+        # Dark blue background
+        bg = slide.shapes.add_shape(1, Inches(0), Inches(0), self.prs.slide_width, self.prs.slide_height)
+        bg.fill.solid()
+        bg.fill.fore_color.rgb = Colors.SF_DARK_BLUE
+        bg.line.fill.background()
+        
+        # Title - centered
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.8), Inches(12.3), Inches(1))
+        tf = title_box.text_frame
+        tf.paragraphs[0].text = title
+        tf.paragraphs[0].font.size = Pt(40)
+        tf.paragraphs[0].font.bold = True
+        tf.paragraphs[0].font.color.rgb = Colors.WHITE
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        
+        if subtitle:
+            sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.9), Inches(12.3), Inches(0.8))
+            tf = sub_box.text_frame
+            tf.paragraphs[0].text = subtitle
+            tf.paragraphs[0].font.size = Pt(20)
+            tf.paragraphs[0].font.color.rgb = Colors.TITLE_SUBTITLE
+            tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        
+        add_copyright_footer(slide, light=True)
+        return slide
+
+    @cloneable
+    def add_content_slide(self, title, subtitle=""):
+        """
+        Add a content slide with fixed header position.
+        Returns the slide for adding additional content.
+        """
+        slide = self.new_slide()
+        
+        # Title at fixed position
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
+        tf = title_box.text_frame
+        tf.paragraphs[0].text = title
+        tf.paragraphs[0].font.size = Pt(28)
+        tf.paragraphs[0].font.bold = True
+        tf.paragraphs[0].font.color.rgb = Colors.SF_DARK_BLUE
+        
+        if subtitle:
+            sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.9), Inches(12), Inches(0.4))
+            tf = sub_box.text_frame
+            tf.paragraphs[0].text = subtitle
+            tf.paragraphs[0].font.size = Pt(16)
+            tf.paragraphs[0].font.color.rgb = Colors.SF_GRAY
+        
+        add_copyright_footer(slide)
+        return slide
+
+    def add_paginated_table_slides(self, title, data, subtitle="", left=0.5, top=1.4, width=12,
+                                   bottom=TABLE_BOTTOM, row_height=0.4, font_size=12,
+                                   continued=" (continued)"):
+        """
+        Add a table too long for one slide as a run of content slides.
+
+        Rows are split to fit between `top` and `bottom` (inches); each
+        continuation slide repeats the header row and gets `continued`
+        appended to its title. Returns the list of slides added.
+        """
+        slides = []
+        for page, (rows, heights) in enumerate(paginate_table(data, bottom - top, width, row_height, font_size)):
+            slide = self.add_content_slide(title if page == 0 else f"{title}{continued}", subtitle)
+            row_heights = [Inches(h) for h in heights]
+            add_styled_table(slide, rows, Inches(left), Inches(top), Inches(width), sum(row_heights),
+                             font_size=font_size, row_heights=row_heights)
+            slides.append(slide)
+        return slides
+
+    def add_before_after_slide(self, title, problem, before_code, after_code, 
+                               comparison_data=None, customer_quote=None, doc_url=None):
+        """
+        Add a before/after comparison slide.
+        This is a key pattern for showing value of new features.
+        """
+        slide = self.new_slide()
+        
+        # Title
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(12), Inches(0.5))
+        tf = title_box.text_frame
+        tf.paragraphs[0].text = title
+        tf.paragraphs[0].font.size = Pt(28)
+        tf.paragraphs[0].font.bold = True
+        
+        # Problem statement
+        problem_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.7), Inches(12), Inches(0.4))
+        tf = problem_box.text_frame
+        tf.paragraphs[0].text = f"Problem: {problem}"
         tf.paragraphs[0].font.size = Pt(14)
         tf.paragraphs[0].font.bold = True
         
-        add_code_block(slide, planned_syntax, top=4.4, width=8, height=1.5, font_size=12)
-    
-    if doc_url:
-        add_doc_link(slide, doc_url)
-    
-    add_copyright_footer(slide)
-    return slide
+        # BEFORE label
+        before_label = slide.shapes.add_textbox(Inches(0.3), Inches(1.1), Inches(6), Inches(0.3))
+        tf = before_label.text_frame
+        tf.paragraphs[0].text = "❌ BEFORE: Complex, error-prone, slow"
+        tf.paragraphs[0].font.size = Pt(13)
+        tf.paragraphs[0].font.bold = True
+        tf.paragraphs[0].font.color.rgb = Colors.RED
+        
+        # BEFORE code
+        before_box = slide.shapes.add_textbox(Inches(0.3), Inches(1.4), Inches(6.2), Inches(2.4))
+        tf = before_box.text_frame
+        tf.word_wrap = True
+        tf.paragraphs[0].text = before_code
+        tf.paragraphs[0].font.size = Pt(9)
+        tf.paragraphs[0].font.name = "Courier New"
+        
+        # AFTER label
+        after_label = slide.shapes.add_textbox(Inches(6.7), Inches(1.1), Inches(6), Inches(0.3))
+        tf = after_label.text_frame
+        tf.paragraphs[0].text = "✅ AFTER: Clean, fast, correct"
+        tf.paragraphs[0].font.size = Pt(13)
+        tf.paragraphs[0].font.bold = True
+        tf.paragraphs[0].font.color.rgb = Colors.GREEN
+        
+        # AFTER code
+        after_box = slide.shapes.add_textbox(Inches(6.7), Inches(1.4), Inches(6), Inches(1.5))
+        tf = after_box.text_frame
+        tf.word_wrap = True
+        tf.paragraphs[0].text = after_code
+        tf.paragraphs[0].font.size = Pt(11)
+        tf.paragraphs[0].font.name = "Courier New"
+        
+        # Comparison table (if provided)
+        if comparison_data:
+            add_styled_table(slide, comparison_data, Inches(6.7), Inches(3.0), Inches(6), Inches(1.5),
+                             font_size=11, body_color=None)
+        
+        # Customer quote (if provided)
+        if customer_quote:
+            quote_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.2), Inches(12), Inches(0.5))
+            tf = quote_box.text_frame
+            tf.paragraphs[0].text = f"🏆 {customer_quote}"
+            tf.paragraphs[0].font.size = Pt(14)
+            tf.paragraphs[0].font.bold = True
+        
+        # Doc link
+        if doc_url:
+            add_doc_link(slide, doc_url)
+        
+        add_copyright_footer(slide)
+        return slide
+
+    def add_value_prop_slide(self, title, subtitle, features_table, struggles, values, customer_quote=None, doc_url=None):
+        """
+        Add a value proposition slide with:
+        - Feature table
+        - Common struggles we solve
+        - Business value delivered
+        - Optional customer quote
+        """
+        slide = self.new_slide()
+        
+        # Title
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(12), Inches(0.5))
+        tf = title_box.text_frame
+        tf.paragraphs[0].text = title
+        tf.paragraphs[0].font.size = Pt(28)
+        tf.paragraphs[0].font.bold = True
+        
+        # Subtitle (value prop)
+        sub_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.7), Inches(12), Inches(0.4))
+        tf = sub_box.text_frame
+        tf.paragraphs[0].text = subtitle
+        tf.paragraphs[0].font.size = Pt(13)
+        tf.paragraphs[0].font.italic = True
+        tf.paragraphs[0].font.color.rgb = Colors.SF_BLUE
+        
+        # Features table
+        add_table(slide, features_table, top=1.2, width=12.2, row_height=0.35)
+        
+        # Common struggles label
+        struggle_label = slide.shapes.add_textbox(Inches(0.5), Inches(3.6), Inches(6), Inches(0.3))
+        tf = struggle_label.text_frame
+        tf.paragraphs[0].text = "Common Struggles We Solve:"
+        tf.paragraphs[0].font.size = Pt(13)
+        tf.paragraphs[0].font.bold = True
+        
+        # Struggles list
+        struggle_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.9), Inches(5.5), Inches(1.5))
+        tf = struggle_box.text_frame
+        for i, struggle in enumerate(struggles):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.text = f"❌ {struggle}"
+            p.font.size = Pt(12)
+        
+        # Value label
+        value_label = slide.shapes.add_textbox(Inches(7), Inches(3.6), Inches(6), Inches(0.3))
+        tf = value_label.text_frame
+        tf.paragraphs[0].text = "Business Value Delivered:"
+        tf.paragraphs[0].font.size = Pt(13)
+        tf.paragraphs[0].font.bold = True
+        
+        # Values list
+        value_box = slide.shapes.add_textbox(Inches(7), Inches(3.9), Inches(5.5), Inches(1.5))
+        tf = value_box.text_frame
+        for i, value in enumerate(values):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.text = f"✅ {value}"
+            p.font.size = Pt(12)
+        
+        # Customer quote
+        if customer_quote:
+            quote_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.6), Inches(12), Inches(0.5))
+            tf = quote_box.text_frame
+            tf.paragraphs[0].text = f"🏆 {customer_quote}"
+            tf.paragraphs[0].font.size = Pt(12)
+            tf.paragraphs[0].font.bold = True
+        
+        if doc_url:
+            add_doc_link(slide, doc_url)
+        
+        add_copyright_footer(slide)
+        return slide
+
+    def add_roadmap_slide(self, title, pain_point, current_behavior, roadmap_table, planned_syntax=None, doc_url=None):
+        """
+        Add a roadmap slide for upcoming features.
+        """
+        slide = self.new_slide()
+        
+        # Title
+        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(12), Inches(0.5))
+        tf = title_box.text_frame
+        tf.paragraphs[0].text = title
+        tf.paragraphs[0].font.size = Pt(28)
+        tf.paragraphs[0].font.bold = True
+        
+        # Pain point quote
+        pain_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.9), Inches(12), Inches(0.8))
+        tf = pain_box.text_frame
+        tf.word_wrap = True
+        tf.paragraphs[0].text = f'"{pain_point}"'
+        tf.paragraphs[0].font.size = Pt(14)
+        tf.paragraphs[0].font.italic = True
+        
+        # Current behavior
+        current_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.7), Inches(12), Inches(0.4))
+        tf = current_box.text_frame
+        tf.paragraphs[0].text = f"Current: {current_behavior}"
+        tf.paragraphs[0].font.size = Pt(14)
+        
+        # Roadmap table
+        add_table(slide, roadmap_table, top=2.2, width=6, row_height=0.4)
+        
+        # Planned syntax
+        if planned_syntax:
+            syntax_label = slide.shapes.add_textbox(Inches(0.5), Inches(4.0), Inches(6), Inches(0.3))
+            tf = syntax_label.text_frame
+            tf.paragraphs[0].text = "Planned Syntax:"
+            tf.paragraphs[0].font.size = Pt(14)
+            tf.paragraphs[0].font.bold = True
+        
+            add_code_block(slide, planned_syntax, top=4.4, width=8, height=1.5, font_size=12)
+        
+        if doc_url:
+            add_doc_link(slide, doc_url)
+        
+        add_copyright_footer(slide)
+        return slide
 
 
 # =============================================================================
 # PRESENTATION CONTENT - CUSTOMIZE BELOW
 # =============================================================================
 
-# Example: Title slide
-add_title_slide(
-    title="Presentation Title",
-    subtitle="Subtitle Here",
-    event_name="Customer/Event Name",
-    date_presenter="January 2026 | Presenter Name"
-)
-
-# Example: Section slide
-add_section_slide("Part 1: Introduction", "Overview and Context")
-
-# Example: Content slide with table
-slide = add_content_slide("Feature Overview", "Key capabilities")
-add_table(slide, [
-    ["Feature", "Status", "Description"],
-    ["Feature A", "✅ GA", "Available today"],
-    ["Feature B", "🟡 Preview", "Coming soon"],
-    ["Feature C", "🔜 Roadmap", "Q1 FY27"],
-], top=1.4)
-add_doc_link(slide, "https://docs.snowflake.com")
-
-# Example: Before/After comparison
-add_before_after_slide(
-    title="New Feature - Before vs After ✅ GA",
-    problem="Complex queries required multiple CTEs and window functions",
-    before_code="""WITH complex_cte AS (
+def build_presentation(deck):
+    """Add this presentation's slides to `deck`."""
+    # Example: Title slide
+    deck.add_title_slide(
+        title="Presentation Title",
+        subtitle="Subtitle Here",
+        event_name="Customer/Event Name",
+        date_presenter="January 2026 | Presenter Name"
+    )
+
+    # Example: Section slide
+    deck.add_section_slide("Part 1: Introduction", "Overview and Context")
+
+    # Example: Content slide with table
+    slide = deck.add_content_slide("Feature Overview", "Key capabilities")
+    deck.add_table(slide, [
+        ["Feature", "Status", "Description"],
+        ["Feature A", "✅ GA", "Available today"],
+        ["Feature B", "🟡 Preview", "Coming soon"],
+        ["Feature C", "🔜 Roadmap", "Q1 FY27"],
+    ], top=1.4)
+    deck.add_doc_link(slide, "https://docs.snowflake.com")
+
+    # Example: Before/After comparison
+    deck.add_before_after_slide(
+        title="New Feature - Before vs After ✅ GA",
+        problem="Complex queries required multiple CTEs and window functions",
+        before_code="""WITH complex_cte AS (
   SELECT *, ROW_NUMBER() OVER (
     PARTITION BY id ORDER BY ts DESC
   ) AS rn
@@ -483,75 +701,78 @@ add_before_after_slide(
     AND t1.ts < t2.next_ts
 )
 SELECT * FROM complex_cte WHERE rn = 1;""",
-    after_code="""SELECT * FROM table1 t1
+        after_code="""SELECT * FROM table1 t1
 NEW_JOIN table2 t2
   MATCH_CONDITION(t1.ts >= t2.ts)
   ON t1.id = t2.id;""",
-    comparison_data=[
-        ["Metric", "Before", "After"],
-        ["Lines of SQL", "15+", "5"],
-        ["Readability", "Complex", "Intuitive"],
-        ["Performance", "Slow", "Optimized"],
-    ],
-    customer_quote='"99% performance improvement over previous solutions" — Customer Name',
-    doc_url="https://docs.snowflake.com/path/to/docs"
-)
-
-# Example: Value proposition slide
-add_value_prop_slide(
-    title="Platform Capabilities",
-    subtitle="No separate specialized database needed → Lower TCO, unified governance",
-    features_table=[
-        ["Function", "What It Solves", "Without It..."],
-        ["Feature A", "Problem A", "Manual workaround"],
-        ["Feature B", "Problem B", "Complex alternative"],
-        ["Feature C", "Problem C", "Tedious approach"],
-    ],
-    struggles=[
-        "Pain point 1",
-        "Pain point 2",
-        "Pain point 3",
-        "Pain point 4",
-    ],
-    values=[
-        "Benefit 1",
-        "Benefit 2",
-        "Benefit 3",
-        "Benefit 4",
-    ],
-    customer_quote='"Customer success quote" — Customer Name',
-    doc_url="https://docs.snowflake.com"
-)
-
-# Example: Roadmap slide
-add_roadmap_slide(
-    title="Upcoming Feature",
-    pain_point="Customer pain point that this feature solves",
-    current_behavior="How things work today (with limitations)",
-    roadmap_table=[
-        ["Milestone", "Timeline"],
-        ["Design", "Q4 FY26 (Complete)"],
-        ["Preview", "Q1 FY27"],
-        ["GA", "Q2 FY27"],
-    ],
-    planned_syntax="""CREATE NEW_FEATURE feature_name
+        comparison_data=[
+            ["Metric", "Before", "After"],
+            ["Lines of SQL", "15+", "5"],
+            ["Readability", "Complex", "Intuitive"],
+            ["Performance", "Slow", "Optimized"],
+        ],
+        customer_quote='"99% performance improvement over previous solutions" — Customer Name',
+        doc_url="https://docs.snowflake.com/path/to/docs"
+    )
+
+    # Example: Value proposition slide
+    deck.add_value_prop_slide(
+        title="Platform Capabilities",
+        subtitle="No separate specialized database needed → Lower TCO, unified governance",
+        features_table=[
+            ["Function", "What It Solves", "Without It..."],
+            ["Feature A", "Problem A", "Manual workaround"],
+            ["Feature B", "Problem B", "Complex alternative"],
+            ["Feature C", "Problem C", "Tedious approach"],
+        ],
+        struggles=[
+            "Pain point 1",
+            "Pain point 2",
+            "Pain point 3",
+            "Pain point 4",
+        ],
+        values=[
+            "Benefit 1",
+            "Benefit 2",
+            "Benefit 3",
+            "Benefit 4",
+        ],
+        customer_quote='"Customer success quote" — Customer Name',
+        doc_url="https://docs.snowflake.com"
+    )
+
+    # Example: Roadmap slide
+    deck.add_roadmap_slide(
+        title="Upcoming Feature",
+        pain_point="Customer pain point that this feature solves",
+        current_behavior="How things work today (with limitations)",
+        roadmap_table=[
+            ["Milestone", "Timeline"],
+            ["Design", "Q4 FY26 (Complete)"],
+            ["Preview", "Q1 FY27"],
+            ["GA", "Q2 FY27"],
+        ],
+        planned_syntax="""CREATE NEW_FEATURE feature_name
     SETTING = 'value'
 AS SELECT ...;""",
-    doc_url="https://docs.snowflake.com"
-)
+        doc_url="https://docs.snowflake.com"
+    )
+
+    # Example: Thank you slide
+    deck.add_title_slide(
+        title="Thank You!",
+        subtitle="Questions?",
+        event_name="",
+        date_presenter="Contact: email@snowflake.com | Next: Topic @ Time"
+    )
 
-# Example: Thank you slide
-add_title_slide(
-    title="Thank You!",
-    subtitle="Questions?",
-    event_name="",
-    date_presenter="Contact: email@snowflake.com | Next: Topic @ Time"
-)
 
 # =============================================================================
 # SAVE
 # =============================================================================
-output_path = "presentation_output.pptx"
-prs.save(output_path)
-print(f"✅ Created: {output_path}")
-print(f"   Total slides: {len(prs.slides)}")
+if __name__ == "__main__":
+    deck = DeckBuilder()
+    build_presentation(deck)
+    output_path = deck.save("presentation_output.pptx")
+    print(f"✅ Created: {output_path}")
+    print(f"   Total slides: {deck.slide_count}")
@@ -0,0 +1,351 @@
+"""
+Content Builder - Slide Model
+
+Write a deck once and build both formats from it. A deck file (JSON, or
+YAML if PyYAML is installed) is parsed once into slide dataclasses, which
+are rendered to PPTX (via pptx_base.DeckBuilder) and to Marp markdown/HTML
+(via marp_base.md's theme and marp_render) in two concurrent worker
+processes, so a dual-format build takes about as long as the slower of the
+two.
+
+Brand colors come from brand.PALETTE for both outputs: pptx_base.Colors is
+derived from it, and the Marp theme's :root variables are regenerated from
+it.
+
+Usage:
+    uv run python slide_model.py deck.json --pptx deck.pptx --marp deck.md --html deck.html
+
+Deck format (the slide entries of deck_batch.py manifests, except
+paginated_table, which has no Marp layout; `title` becomes the PPTX document
+title and the Marp HTML <title>):
+    {
+      "title": "Customer Briefing",
+      "slides": [
+        {"type": "title", "title": "...", "subtitle": "...", "date_presenter": "..."},
+        {"type": "section", "title": "Part 1"},
+        {"type": "content", "title": "...", "subtitle": "...",
+         "items": [{"type": "table", "data": [[...], ...]},
+                   {"type": "text", "content": "..."},
+                   {"type": "code", "code": "..."},
+                   {"type": "doc_link", "url": "https://docs.snowflake.com/..."}]},
+        {"type": "before_after", "title": "...", "problem": "...",
+         "before_code": "...", "after_code": "...", "comparison_data": [[...]]},
+        {"type": "value_prop", "title": "...", "subtitle": "...", "features_table": [[...]],
+         "struggles": [...], "values": [...]},
+        {"type": "roadmap", "title": "...", "pain_point": "...", "current_behavior": "...",
+         "roadmap_table": [[...]], "planned_syntax": "..."}
+      ]
+    }
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from html import escape
+from pathlib import Path
+from typing import ClassVar
+
+import brand
+
+MARP_TEMPLATE = Path(__file__).with_name("marp_base.md")
+
+
+# =============================================================================
+# SLIDE MODEL
+# =============================================================================
+
+@dataclass
+class TitleSlide:
+    kind: ClassVar[str] = "title"
+    title: str
+    subtitle: str = ""
+    event_name: str = ""
+    date_presenter: str = ""
+
+
+@dataclass
+class SectionSlide:
+    kind: ClassVar[str] = "section"
+    title: str
+    subtitle: str = ""
+
+
+@dataclass
+class ContentSlide:
+    """Title/subtitle plus items: {"type": "table" | "text" | "code" | "doc_link", ...}."""
+    kind: ClassVar[str] = "content"
+    title: str
+    subtitle: str = ""
+    items: list = field(default_factory=list)
+
+
+@dataclass
+class BeforeAfterSlide:
+    kind: ClassVar[str] = "before_after"
+    title: str
+    problem: str
+    before_code: str
+    after_code: str
+    comparison_data: list = None
+    customer_quote: str = None
+    doc_url: str = None
+
+
+@dataclass
+class ValuePropSlide:
+    kind: ClassVar[str] = "value_prop"
+    title: str
+    subtitle: str
+    features_table: list
+    struggles: list
+    values: list
+    customer_quote: str = None
+    doc_url: str = None
+
+
+@dataclass
+class RoadmapSlide:
+    kind: ClassVar[str] = "roadmap"
+    title: str
+    pain_point: str
+    current_behavior: str
+    roadmap_table: list
+    planned_syntax: str = None
+    doc_url: str = None
+
+
+SLIDE_TYPES = {cls.kind: cls for cls in (TitleSlide, SectionSlide, ContentSlide,
+                                          BeforeAfterSlide, ValuePropSlide, RoadmapSlide)}
+
+
+def slide_fields(slide) -> dict:
+    """The slide's fields as keyword arguments for its DeckBuilder method."""
+    return {f.name: getattr(slide, f.name) for f in fields(slide)}
+
+
+def parse_slides(specs: list) -> list:
+    """Turn slide dicts ({"type": ..., **fields}) into slide dataclasses."""
+    slides = []
+    for index, spec in enumerate(specs, 1):
+        spec = dict(spec)
+        slide_type = spec.pop("type", None)
+        if slide_type not in SLIDE_TYPES:
+            raise ValueError(f"slide {index}: unknown type {slide_type!r}; expected one of {sorted(SLIDE_TYPES)}")
+        try:
+            slides.append(SLIDE_TYPES[slide_type](**spec))
+        except TypeError as exc:
+            raise ValueError(f"slide {index} ({slide_type}): {exc}") from exc
+    return slides
+
+
+def load_deck(path) -> dict:
+    """Load a deck file; returns {"title", "slides": [dataclasses]}."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+        spec = yaml.safe_load(text)
+    else:
+        spec = json.loads(text)
+    if isinstance(spec, list):
+        spec = {"slides": spec}
+    return {"title": spec.get("title", path.stem), "slides": parse_slides(spec.get("slides", []))}
+
+
+# =============================================================================
+# PPTX
+# =============================================================================
+
+def render_pptx(slides: list, output, title: str = None) -> dict:
+    """Build the deck with DeckBuilder and save it; returns a timing record."""
+    start = time.perf_counter()
+    import deck_batch  # Pulls in python-pptx; only the PPTX worker pays for it
+    import pptx_base
+
+    deck = pptx_base.DeckBuilder(clone_prototypes=True)
+    for slide in slides:
+        deck_batch.add_slide(deck, {"type": slide.kind, **slide_fields(slide)})
+    if title:
+        deck.prs.core_properties.title = title
+    deck.save(str(output))
+    return {"format": "pptx", "outputs": [str(output)], "slides": deck.slide_count,
+            "sec": round(time.perf_counter() - start, 4), "pid": os.getpid()}
+
+
+# =============================================================================
+# MARP
+# =============================================================================
+
+def marp_front_matter(template=MARP_TEMPLATE, title: str = None) -> str:
+    """
+    marp_base.md's front matter, with :root colors regenerated from brand.PALETTE
+    and, given a `title`, a title directive (the HTML <title>).
+    """
+    source = Path(template).read_text(encoding="utf-8").replace("\r\n", "\n")
+    match = re.match(r"^---[ \t]*\n(.*?\n)---[ \t]*(?:\n|$)", source, re.DOTALL)
+    if not match:
+        raise ValueError(f"{template}: no front matter (a '---' block at the top of the file)")
+    directives = re.sub(r"^([ \t]*):root \{.*?\}", lambda m: brand.css_root(m.group(1)),
+                        match.group(1), count=1, flags=re.DOTALL | re.MULTILINE)
+    if title:
+        directives += "title: '" + title.replace("'", "''") + "'\n"
+    return f"---\n{directives}---\n"
+
+
+def _cell(value) -> str:
+    return str(value).replace("|", "\\|").replace("\n", "<br>")
+
+
+def md_table(data: list) -> str:
+    """Markdown table; the first row is the header."""
+    header, body = data[0], data[1:]
+    lines = ["| " + " | ".join(_cell(c) for c in header) + " |",
+             "|" + "|".join("---" for _ in header) + "|"]
+    lines += ["| " + " | ".join(_cell(c) for c in row) + " |" for row in body]
+    return "\n".join(lines)
+
+
+def md_doc_link(url: str, display_text: str = None) -> str:
+    if display_text is None:
+        display_text = url.replace("https://", "")
+    return f'<div class="docs-link">📚 <a href="{escape(url)}">{escape(display_text)}</a></div>'
+
+
+def _fenced(code: str, language: str = "sql") -> str:
+    return f"```{language}\n{code.rstrip()}\n```"
+
+
+def _content_item(item: dict) -> str:
+    item = dict(item)
+    item_type = item.pop("type")
+    if item_type == "table":
+        return md_table(item["data"])
+    if item_type == "text":
+        return item["content"]
+    if item_type == "code":
+        return _fenced(item["code"], "")
+    if item_type == "doc_link":
+        return md_doc_link(item["url"], item.get("display_text"))
+    raise ValueError(f"Unknown item type {item_type!r}")
+
+
+def slide_markdown(slide) -> str:
+    """One slide as Marp markdown, following the layouts in marp_base.md."""
+    if isinstance(slide, (TitleSlide, SectionSlide)):
+        parts = ["<!-- _class: title -->", f"# {slide.title}" + (f"\n## {slide.subtitle}" if slide.subtitle else "")]
+        if isinstance(slide, TitleSlide):
+            parts += [f"**{slide.event_name}**" if slide.event_name else "", slide.date_presenter]
+    elif isinstance(slide, ContentSlide):
+        parts = [f"# {slide.title}" + (f"\n## {slide.subtitle}" if slide.subtitle else "")]
+        parts += [_content_item(item) for item in slide.items]
+    elif isinstance(slide, BeforeAfterSlide):
+        parts = [f"# {slide.title}", f"**Problem:** {slide.problem}",
+                 "### ❌ BEFORE: Complex, error-prone, slow\n" + _fenced(slide.before_code),
+                 "### ✅ AFTER: Clean, fast, correct\n" + _fenced(slide.after_code)]
+        if slide.comparison_data:
+            parts.append(md_table(slide.comparison_data))
+        if slide.customer_quote:
+            parts.append(f"> 🏆 {slide.customer_quote}")
+        if slide.doc_url:
+            parts.append(md_doc_link(slide.doc_url))
+    elif isinstance(slide, ValuePropSlide):
+        parts = [f"# {slide.title}\n## {slide.subtitle}", md_table(slide.features_table),
+                 "**Struggles We Solve:** " + " • ".join(f"❌ {s}" for s in slide.struggles),
+                 "**Value Delivered:** " + " • ".join(f"✅ {v}" for v in slide.values)]
+        if slide.customer_quote:
+            parts.append(f"> 🏆 {slide.customer_quote}")
+        if slide.doc_url:
+            parts.append(md_doc_link(slide.doc_url))
+    elif isinstance(slide, RoadmapSlide):
+        parts = [f"# {slide.title}", f'> *"{slide.pain_point}"*',
+                 f"**Current Behavior:** {slide.current_behavior}", md_table(slide.roadmap_table)]
+        if slide.planned_syntax:
+            parts.append("### Planned Syntax\n" + _fenced(slide.planned_syntax))
+        if slide.doc_url:
+            parts.append(md_doc_link(slide.doc_url))
+    else:
+        raise TypeError(f"Not a slide: {slide!r}")
+    return "\n\n".join(p for p in parts if p)
+
+
+def to_marp(slides: list, template=MARP_TEMPLATE, title: str = None) -> str:
+    """The whole deck as Marp markdown, themed with marp_base.md's CSS."""
+    body = "\n\n---\n\n".join(slide_markdown(slide) for slide in slides)
+    return f"{marp_front_matter(template, title)}\n{body}\n"
+
+
+def render_marp(slides: list, markdown_output=None, html_output=None, title: str = None) -> dict:
+    """Write Marp markdown and/or HTML; returns a timing record."""
+    start = time.perf_counter()
+    import marp_render
+
+    source = to_marp(slides, title=title)
+    outputs = []
+    if markdown_output:
+        Path(markdown_output).write_text(source, encoding="utf-8")
+        outputs.append(str(markdown_output))
+    if html_output:
+        Path(html_output).write_text(marp_render.render_deck(source), encoding="utf-8")
+        outputs.append(str(html_output))
+    return {"format": "marp", "outputs": outputs, "slides": len(slides),
+            "sec": round(time.perf_counter() - start, 4), "pid": os.getpid()}
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def build(slides: list, pptx=None, marp=None, html=None, jobs: int = 2, title: str = None) -> dict:
+    """
+    Render the requested formats, concurrently unless jobs=1.
+
+    `title` (the deck file's title) becomes the PPTX document title and
+    the Marp title directive.
+
+    Returns {"results": [timing records], "wall_sec", "serial_sec"}, where
+    serial_sec is the sum of the per-format times.
+    """
+    tasks = []
+    if pptx:
+        tasks.append((render_pptx, slides, pptx, title))
+    if marp or html:
+        tasks.append((render_marp, slides, marp, html, title))
+
+    start = time.perf_counter()
+    if jobs == 1 or len(tasks) < 2:
+        results = [fn(*args) for fn, *args in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            futures = [pool.submit(fn, *args) for fn, *args in tasks]
+            results = [future.result() for future in futures]
+    return {
+        "results": results,
+        "wall_sec": round(time.perf_counter() - start, 4),
+        "serial_sec": round(sum(r["sec"] for r in results), 4),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build PPTX and Marp outputs from one deck file.")
+    parser.add_argument("deck", help="JSON or YAML deck file")
+    parser.add_argument("--pptx", default=None, help="PPTX output path")
+    parser.add_argument("--marp", default=None, help="Marp markdown output path")
+    parser.add_argument("--html", default=None, help="Marp HTML output path")
+    parser.add_argument("-j", "--jobs", type=int, default=2, help="1 renders the formats one after another")
+    args = parser.parse_args(argv)
+    if not (args.pptx or args.marp or args.html):
+        parser.error("nothing to build: pass --pptx, --marp and/or --html")
+
+    deck = load_deck(args.deck)
+    summary = build(deck["slides"], args.pptx, args.marp, args.html, args.jobs, deck["title"])
+    for result in summary["results"]:
+        print(f"✅ {result['format']}: {', '.join(result['outputs'])} ({result['slides']} slides, {result['sec']}s)")
+    print(f"   Wall {summary['wall_sec']}s (formats sum to {summary['serial_sec']}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+TPC-DS Batch Report Builder
+
+Renders many TPC-DS reports from one manifest in parallel, instead of one
+copied script per comparison. Each manifest entry is a REPORT_CONFIG dict
+plus its data; reports are rendered across cores with a process pool and a
+per-report timing summary is written next to the outputs.
+
+Usage:
+    uv run python tpcds_batch.py sweep.json
+    uv run python tpcds_batch.py sweep.json --jobs 8 --summary sweep_timings.json
+    uv run python tpcds_batch.py sweep.json --out-dir reports/
+
+Manifest format (JSON):
+    {
+      "defaults": {"benchmark": "TPC-DS 10TB, Warm Runs", "recommendations": []},
+      "backend": {"type": "snowflake", "connection_name": "snowhouse"},
+      "reports": [
+        {
+          "title": "TPC-DS 10TB: SF Gen2 M vs Athena",
+          "subtitle": "...",
+          "output_file": "reports/sf_m_vs_athena.html",
+          "runs": [...], "summary_cards": [...], "key_finding": "...",
+          "run_keys": ["2775574", "3473166"]
+        }
+      ]
+    }
+
+Each report takes its rows from one of:
+    "data"      - inline list of QUERY_DATA rows
+    "data_file" - path to a JSON file holding that list
+    "run_keys"  - [sf_run_key, competitor_run_key], loaded via tpcds_data
+                  using the manifest "backend" (sqlite / duckdb / snowflake)
+Optional per report: "columns" (same shape as COLUMNS), "stream" (bool).
+
+Relative "output_file" paths are resolved against --out-dir when given,
+otherwise against the manifest's directory (as in deck_batch.py);
+relative "data_file" paths against the manifest's directory.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import tpcds_report_base as report
+
+# Per-worker state, set once by _init_worker() and reused for every report
+_BACKEND = None
+_BACKEND_SPEC = None
+
+
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+def load_manifest(path) -> dict:
+    """Load a JSON manifest (YAML too, if PyYAML is installed)."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+        manifest = yaml.safe_load(text)
+    else:
+        manifest = json.loads(text)
+    if isinstance(manifest, list):
+        manifest = {"reports": manifest}
+    base_dir = str(path.parent.resolve())
+    for entry in manifest.get("reports", []):
+        entry.setdefault("_base_dir", base_dir)
+    return manifest
+
+
+def expand_entries(manifest: dict, out_dir=None) -> list:
+    """
+    Merge manifest defaults into each report entry and resolve its output
+    path: relative to `out_dir`, else the manifest's directory (else CWD).
+    """
+    defaults = manifest.get("defaults", {})
+    entries = []
+    for entry in manifest.get("reports", []):
+        merged = {"date": datetime.now().strftime("%B %d, %Y"), **defaults, **entry}
+        output = Path(merged["output_file"])
+        if not output.is_absolute():
+            output = Path(out_dir or merged.get("_base_dir", "."), output)
+        merged["output_file"] = str(output)
+        entries.append(merged)
+    return entries
+
+
+def make_backend(spec: dict):
+    """Build a tpcds_data backend from a manifest "backend" spec."""
+    import tpcds_data
+
+    spec = dict(spec)
+    kind = spec.pop("type")
+    backends = {
+        "snowflake": tpcds_data.SnowflakeBackend,
+        "duckdb": tpcds_data.DuckDBBackend,
+        "sqlite": tpcds_data.SQLiteBackend,
+    }
+    if kind not in backends:
+        raise ValueError(f"Unknown backend type {kind!r}; expected one of {sorted(backends)}")
+    return backends[kind](**spec)
+
+
+def resolve_data(entry: dict):
+    """Return the rows for one manifest entry."""
+    if "data" in entry:
+        return entry["data"]
+    if "data_file" in entry:
+        data_path = Path(entry.get("_base_dir", "."), entry["data_file"])
+        return json.loads(data_path.read_text())
+    if "run_keys" in entry:
+        import tpcds_data
+
+        global _BACKEND
+        if _BACKEND is None:
+            if _BACKEND_SPEC is None:
+                raise ValueError(f"{entry['output_file']}: run_keys needs a manifest 'backend'")
+            _BACKEND = make_backend(_BACKEND_SPEC)
+        sf_run_key, comp_run_key = entry["run_keys"]
+        return tpcds_data.load_comparison(
+            sf_run_key, comp_run_key, _BACKEND,
+            cache_dir=entry.get("cache_dir", tpcds_data.DEFAULT_CACHE_DIR),
+            gaps_only=entry.get("gaps_only", False),
+        )
+    raise ValueError(f"{entry['output_file']}: needs one of 'data', 'data_file' or 'run_keys'")
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def _init_worker(backend_spec):
+    """
+    Process pool initializer.
+
+    The report template is parsed once per worker, when this module imports
+    tpcds_report_base (a forked worker inherits the parent's copy; with the
+    spawn start method, the default on macOS and Windows, each worker
+    re-imports and re-parses it). The backend connection is opened lazily,
+    at most once per worker; any backend left over from an earlier batch
+    (or inherited from the parent by a forked worker) is discarded, never
+    reused.
+    """
+    global _BACKEND, _BACKEND_SPEC
+    _BACKEND = None
+    _BACKEND_SPEC = backend_spec
+
+
+def _close_backend():
+    """Close the in-process backend opened by resolve_data(), if any."""
+    global _BACKEND
+    if _BACKEND is not None:
+        _BACKEND.close()
+        _BACKEND = None
+
+
+def render_entry(entry: dict) -> dict:
+    """Render one report and return its timing record."""
+    start = time.perf_counter()
+    data = resolve_data(entry)
+    loaded = time.perf_counter()
+
+    columns = [tuple(col) for col in entry.get("columns", report.COLUMNS)]
+    output_path = Path(entry["output_file"])
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    config = {**entry, "output_file": str(output_path)}
+
+    report.write_report(config, data, columns, stream=entry.get("stream", False))
+    done = time.perf_counter()
+    return {
+        "output_file": str(output_path),
+        "rows": len(data) if hasattr(data, "__len__") else None,
+        "bytes": output_path.stat().st_size,
+        "load_sec": round(loaded - start, 4),
+        "render_sec": round(done - loaded, 4),
+        "total_sec": round(done - start, 4),
+        "pid": os.getpid(),
+    }
+
+
+def run_batch(manifest: dict, jobs: int = None, out_dir=None) -> dict:
+    """
+    Render every report in the manifest and return a timing summary.
+
+    jobs=1 renders in-process (useful for debugging), closing its backend
+    connection at the end; otherwise a process pool with `jobs` workers
+    (default: all cores) is used. See expand_entries() for `out_dir`.
+    """
+    entries = expand_entries(manifest, out_dir)
+    backend_spec = manifest.get("backend")
+    jobs = jobs or os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(entries) or 1))
+
+    start = time.perf_counter()
+    results = []
+    failures = []
+    if jobs == 1:
+        _init_worker(backend_spec)
+        try:
+            for entry in entries:
+                try:
+                    results.append(render_entry(entry))
+                except Exception as exc:
+                    failures.append({"output_file": entry.get("output_file"), "error": repr(exc)})
+        finally:
+            _close_backend()
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(backend_spec,)) as pool:
+            futures = {pool.submit(render_entry, entry): entry for entry in entries}
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    entry = futures[future]
+                    failures.append({"output_file": entry.get("output_file"), "error": repr(exc)})
+    wall = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["output_file"])
+    busy = sum(r["total_sec"] for r in results)
+    return {
+        "reports": len(results),
+        "failed": len(failures),
+        "jobs": jobs,
+        "wall_sec": round(wall, 4),
+        "cpu_sum_sec": round(busy, 4),
+        "reports_per_sec": round(len(results) / wall, 2) if wall else None,
+        "parallel_efficiency": round(busy / (wall * jobs), 2) if wall else None,
+        "results": results,
+        "failures": failures,
+    }
+
+
+def print_summary(summary: dict):
+    """Print a per-report timing table and the batch totals."""
+    print(f"{'Report':<60} {'Rows':>8} {'Load s':>8} {'Render s':>9}")
+    for r in summary["results"]:
+        rows = "" if r["rows"] is None else r["rows"]
+        print(f"{Path(r['output_file']).name:<60} {rows:>8} {r['load_sec']:>8.3f} {r['render_sec']:>9.3f}")
+    for f in summary["failures"]:
+        print(f"FAILED {f['output_file']}: {f['error']}")
+    print(
+        f"\n{summary['reports']} reports in {summary['wall_sec']:.2f}s "
+        f"with {summary['jobs']} workers ({summary['reports_per_sec']} reports/s, "
+        f"parallel efficiency {summary['parallel_efficiency']})"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render many TPC-DS reports from a manifest.")
+    parser.add_argument("manifest", help="JSON (or YAML) manifest of report configs")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--out-dir", default=None,
+                        help="directory for relative output_file paths (default: the manifest's)")
+    parser.add_argument("--summary", default=None,
+                        help="timing summary path (default: <manifest>_timings.json)")
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    summary = run_batch(manifest, jobs=args.jobs, out_dir=args.out_dir)
+    summary_path = Path(args.summary or Path(args.manifest).with_name(Path(args.manifest).stem + "_timings.json"))
+    summary_path.write_text(json.dumps(summary, indent=2))
+    print_summary(summary)
+    print(f"Timing summary: {summary_path.absolute()}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
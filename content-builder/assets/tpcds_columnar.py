@@ -0,0 +1,228 @@
+"""
+TPC-DS Columnar Severity & Formatting Engine
+
+Whole-column versions of calculate_severity(), format_time() and
+format_ratio() from tpcds_report_base.py. Output is identical to the scalar
+functions; the per-cell Python branching is replaced by NumPy array ops.
+
+Accepted inputs for QUERY_DATA:
+    - pandas DataFrame
+    - pyarrow Table
+    - NumPy structured array
+    - dict of column name -> sequence
+
+Requires numpy (pandas / pyarrow only if you pass those types):
+    uv add numpy
+"""
+
+import numpy as np
+
+BATCH_ROWS = 65536  # Rows formatted per vectorized batch
+
+SEVERITY_ROW_CLASSES = {"severe": ' class="severe"', "moderate": ' class="moderate"'}
+
+
+# =============================================================================
+# INPUT NORMALIZATION
+# =============================================================================
+
+def is_columnar(data) -> bool:
+    """Return True if `data` is a table/array rather than a list of row dicts."""
+    if isinstance(data, dict):
+        return True
+    if hasattr(data, "column_names"):  # pyarrow.Table
+        return True
+    if hasattr(data, "columns") and hasattr(data, "to_numpy"):  # pandas.DataFrame
+        return True
+    return getattr(getattr(data, "dtype", None), "names", None) is not None
+
+
+def to_columns(data) -> dict:
+    """Convert a supported table type to a dict of NumPy arrays."""
+    if hasattr(data, "column_names"):
+        return {name: data.column(name).to_numpy() for name in data.column_names}
+    if hasattr(data, "columns") and hasattr(data, "to_numpy"):
+        return {name: data[name].to_numpy() for name in data.columns}
+    names = getattr(getattr(data, "dtype", None), "names", None)
+    if names is not None:
+        return {name: data[name] for name in names}
+    if isinstance(data, dict):
+        return {name: _column_array(values) for name, values in data.items()}
+    raise TypeError(f"Unsupported columnar input: {type(data).__name__}")
+
+
+def _column_array(values) -> np.ndarray:
+    """
+    Array for one dict column. Text columns stay object dtype: NumPy would
+    otherwise coerce a mixed column like ["n/a", 75.0] to strings and lose
+    the per-cell time/ratio formatting of its numbers.
+    """
+    array = np.asarray(values)
+    if array.dtype.kind in "US":
+        array = np.asarray(values, dtype=object)
+    return array
+
+
+def _is_numeric(values: np.ndarray) -> bool:
+    return values.dtype.kind in "iuf"
+
+
+# =============================================================================
+# COLUMN OPERATIONS
+# =============================================================================
+
+def severity_column(diff, ratio) -> np.ndarray:
+    """
+    Vectorized calculate_severity() over whole diff/ratio columns.
+
+    Same 3x3 matrix as the scalar version: ratio bands <1.5 / 1.5-2.5 / >2.5
+    against time bands <30s / 30-60s / >60s.
+    """
+    diff = np.asarray(diff, dtype=float)
+    ratio = np.asarray(ratio, dtype=float)
+
+    high_ratio = ratio > 2.5
+    medium_ratio = (ratio >= 1.5) & (ratio <= 2.5)
+    low_ratio = ~high_ratio & ~medium_ratio
+
+    high_time = diff > 60
+    medium_time = (diff >= 30) & (diff <= 60)
+
+    return np.select(
+        [
+            high_ratio & (high_time | medium_time),
+            high_ratio,
+            medium_ratio & high_time,
+            medium_ratio & medium_time,
+            low_ratio & high_time,
+        ],
+        ["severe", "moderate", "severe", "moderate", "moderate"],
+        default="minor",
+    )
+
+
+def format_time_column(seconds) -> np.ndarray:
+    """Vectorized format_time(): '12.3s' below a minute, '1.5 min' above."""
+    seconds = np.asarray(seconds, dtype=float)
+    return np.where(
+        seconds >= 60,
+        np.char.mod("%.1f min", seconds / 60),
+        np.char.mod("%.1fs", seconds),
+    )
+
+
+def format_ratio_column(ratio) -> np.ndarray:
+    """Vectorized format_ratio(): '2.98x'."""
+    return np.char.mod("%.2fx", np.asarray(ratio, dtype=float))
+
+
+def format_severity_column(severity) -> np.ndarray:
+    """Vectorized format_severity(): formats each distinct value once."""
+    severity = np.asarray(severity).astype(str)
+    levels, index = np.unique(severity, return_inverse=True)
+    tags = np.array([f'<span class="tag {s}">{s.upper()}</span>' for s in levels], dtype=object)
+    return tags[index.reshape(-1)]
+
+
+def _format_cells(values, fmt: str) -> list:
+    """Format an object-dtype column cell by cell, like the scalar path."""
+    if fmt == "time":
+        return [format_time_column(v).item() if isinstance(v, (int, float)) else str(v) for v in values.tolist()]
+    if fmt == "ratio":
+        return [format_ratio_column(v).item() if isinstance(v, (int, float)) else str(v) for v in values.tolist()]
+    return [str(v) for v in values.tolist()]
+
+
+# =============================================================================
+# ROW RENDERING
+# =============================================================================
+
+def _literal(text: str) -> str:
+    """Escape text for use inside a %-format row template."""
+    return text.replace("%", "%%")
+
+
+def iter_table_rows_columnar(data, columns: list, batch_rows: int = BATCH_ROWS):
+    """
+    Yield table row HTML for columnar data, identical to iter_table_rows().
+
+    Severity, the seconds/minutes split and all per-cell choices are computed
+    as whole-column operations and folded into an integer "shape" code per
+    row. Each distinct shape gets one precompiled %-template, so rendering a
+    row is a single C-level string format with no Python branching.
+    """
+    table = to_columns(data)
+    n_rows = len(next(iter(table.values()))) if table else 0
+
+    for start in range(0, n_rows, batch_rows):
+        batch = {name: values[start:start + batch_rows] for name, values in table.items()}
+        size = len(next(iter(batch.values())))
+
+        if "severity" in batch:
+            severity = np.asarray(batch["severity"]).astype(str)
+        elif "diff" in batch and "ratio" in batch:
+            severity = severity_column(batch["diff"], batch["ratio"])
+        else:
+            severity = np.full(size, "", dtype=str)
+        levels, code = np.unique(severity, return_inverse=True)
+        code = code.reshape(-1).astype(np.int64)
+
+        # Per column: template fragment(s) and the argument column feeding them
+        parts = []   # (open_tag, kind) with kind in "time", "ratio", "severity", "str"
+        args = []
+        n_bits = 0
+        for key, header, align, fmt in columns:
+            values = severity if key == "severity" else batch.get(key)
+            if values is None:
+                values = np.full(size, "", dtype=object)
+            align_class = f' class="{align}"' if align != "left" else ""
+            open_tag = f"<td{align_class}>"
+
+            if fmt == "time" and _is_numeric(values):
+                seconds = values.astype(float)
+                minutes = seconds >= 60
+                code = (code << 1) | minutes
+                n_bits += 1
+                parts.append((open_tag, "time"))
+                args.append(np.where(minutes, seconds / 60, seconds).tolist())
+            elif fmt == "ratio" and _is_numeric(values):
+                parts.append((open_tag, "ratio"))
+                args.append(values.astype(float).tolist())
+            elif fmt == "severity" and key == "severity":
+                parts.append((open_tag, "severity"))
+            elif fmt == "severity":
+                parts.append((open_tag, "str"))
+                args.append(format_severity_column(values).tolist())
+            elif values.dtype.kind == "O" and fmt in ("time", "ratio"):
+                parts.append((open_tag, "str"))
+                args.append(_format_cells(values, fmt))
+            else:
+                parts.append((open_tag, "str"))
+                args.append(values.tolist())
+
+        templates = {}
+        for shape in np.unique(code).tolist():
+            sev = levels[shape >> n_bits] if len(levels) else ""
+            bits = shape & ((1 << n_bits) - 1)
+            bit = n_bits
+            cells = []
+            for open_tag, kind in parts:
+                if kind == "time":
+                    bit -= 1
+                    body = "%.1f min" if (bits >> bit) & 1 else "%.1fs"
+                elif kind == "ratio":
+                    body = "%.2fx"
+                elif kind == "severity":
+                    body = _literal(f'<span class="tag {sev}">{sev.upper()}</span>')
+                else:
+                    body = "%s"
+                cells.append(f"{_literal(open_tag)}{body}</td>")
+            row_class = _literal(SEVERITY_ROW_CLASSES.get(sev, ""))
+            templates[shape] = f"<tr{row_class}>\n                {chr(10).join(cells)}\n            </tr>"
+
+        if args:
+            for shape, row_args in zip(code.tolist(), zip(*args)):
+                yield templates[shape] % row_args
+        else:
+            for shape in code.tolist():
+                yield templates[shape]
@@ -0,0 +1,270 @@
+"""
+TPC-DS Benchmark Data Loader
+
+Fetches per-query timings for two runs from bench_store.publicdata
+sample_batch_pivot and joins them into QUERY_DATA rows for
+tpcds_report_base.py, with `diff` and `ratio` already computed.
+
+Fetched runs are cached on disk keyed by run_key, so regenerating a report
+for a completed run never queries the warehouse again.
+
+Usage:
+    from tpcds_data import SnowflakeBackend, load_comparison
+
+    backend = SnowflakeBackend(connection_name="snowhouse")
+    QUERY_DATA = load_comparison("2775574", "3473166", backend)
+
+Backends:
+    SnowflakeBackend - bench_store.publicdata via snowflake-connector-python
+    DuckDBBackend    - local DuckDB copy of sample_batch_pivot
+    SQLiteBackend    - local SQLite copy of sample_batch_pivot (fixtures)
+"""
+
+import abc
+import json
+import re
+import sqlite3
+import statistics
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(".tpcds_cache")
+
+SF_METRIC = "TOTAL_DURATION_MS"      # Snowflake runs
+COMPETITOR_METRIC = "e2e_latency"    # Competitor runs
+WARM_LABELS = "%warm%"
+
+
+# =============================================================================
+# CONNECTION BACKENDS
+# =============================================================================
+
+class SQLBackend(abc.ABC):
+    """
+    Base backend over a DB-API connection.
+
+    Subclasses only describe their dialect: the fully qualified table name,
+    the parameter placeholder, and how to read a numeric key out of the
+    `metrics` column.
+    """
+    table = "sample_batch_pivot"
+    placeholder = "?"
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @abc.abstractmethod
+    def metric_sql(self) -> str:
+        """SQL expression reading the metric named by the first parameter."""
+
+    def close(self):
+        self.connection.close()
+
+    def fetch_run(self, run_key, metric: str, label_pattern: str = WARM_LABELS) -> list:
+        """Return [(query_label, seconds), ...] for one run."""
+        p = self.placeholder
+        sql = (
+            f"SELECT query_label, {self.metric_sql()} / 1000 AS sec "
+            f"FROM {self.table} "
+            f"WHERE run_key = {p} AND query_label LIKE {p}"
+        )
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, (metric, run_key, label_pattern))
+            return [(label, float(sec)) for label, sec in cursor.fetchall() if sec is not None]
+        finally:
+            cursor.close()
+
+
+class SnowflakeBackend(SQLBackend):
+    """bench_store.publicdata.sample_batch_pivot on Snowhouse."""
+    table = "bench_store.publicdata.sample_batch_pivot"
+    placeholder = "%s"
+
+    def __init__(self, connection=None, **connect_kwargs):
+        if connection is None:
+            import snowflake.connector  # Only needed when actually querying
+            connection = snowflake.connector.connect(**connect_kwargs)
+        super().__init__(connection)
+
+    def metric_sql(self) -> str:
+        return f"GET(metrics, {self.placeholder})::NUMBER"
+
+
+class DuckDBBackend(SQLBackend):
+    """Local DuckDB database with a sample_batch_pivot table (metrics as JSON)."""
+
+    def __init__(self, connection=None, database: str = ":memory:"):
+        if connection is None:
+            import duckdb
+            connection = duckdb.connect(database)
+        super().__init__(connection)
+
+    def metric_sql(self) -> str:
+        return "CAST(json_extract_string(metrics, '$.' || ?) AS DOUBLE)"
+
+
+class SQLiteBackend(SQLBackend):
+    """Local SQLite database with a sample_batch_pivot table (metrics as JSON)."""
+
+    def __init__(self, connection=None, database: str = ":memory:"):
+        if connection is None:
+            connection = sqlite3.connect(database)
+        super().__init__(connection)
+
+    def metric_sql(self) -> str:
+        return "CAST(json_extract(metrics, '$.' || ?) AS REAL)"
+
+
+def create_fixture(connection, runs: dict):
+    """
+    Create and fill a local sample_batch_pivot table.
+
+    `runs` maps run_key -> {query_label: {metric_name: value_ms, ...}}.
+    Works with both sqlite3 and duckdb connections.
+    """
+    cursor = connection.cursor()
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS sample_batch_pivot "
+        "(run_key BIGINT, query_label VARCHAR, metrics VARCHAR)"
+    )
+    cursor.executemany(
+        "INSERT INTO sample_batch_pivot VALUES (?, ?, ?)",
+        [
+            (int(run_key), label, json.dumps(metrics))
+            for run_key, labels in runs.items()
+            for label, metrics in labels.items()
+        ],
+    )
+    connection.commit()
+    cursor.close()
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+class RunCache:
+    """
+    On-disk cache of fetched runs, one JSON file per run_key and metric.
+
+    Layout: <cache_dir>/<run_key>/<metric>.json
+    Entries are only written after a non-empty fetch and never expire; a
+    completed run's results do not change. Pass refresh=True to
+    load_comparison() to re-query a run that was still in progress.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, run_key, metric: str, label_pattern: str) -> Path:
+        name = metric if label_pattern == WARM_LABELS else f"{metric}__{_slug(label_pattern)}"
+        return self.cache_dir / str(run_key) / f"{name}.json"
+
+    def get(self, run_key, metric: str, label_pattern: str = WARM_LABELS):
+        path = self._path(run_key, metric, label_pattern)
+        if not path.exists():
+            return None
+        return [tuple(row) for row in json.loads(path.read_text())["rows"]]
+
+    def put(self, run_key, metric: str, rows: list, label_pattern: str = WARM_LABELS):
+        path = self._path(run_key, metric, label_pattern)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "run_key": str(run_key),
+            "metric": metric,
+            "label_pattern": label_pattern,
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            "rows": rows,
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_") or "all"
+
+
+# =============================================================================
+# LOADING & JOINING
+# =============================================================================
+
+_QUERY_RE = re.compile(r"q(?:uery)?[_-]?0*(\d+)(?:[_-]?(p\d+))?", re.IGNORECASE)
+
+
+def normalize_query_label(label: str) -> str:
+    """Map labels like 'query78_warm' or 'Q23p1_warm_2' to 'q78' / 'q23P1'."""
+    match = _QUERY_RE.search(label)
+    if not match:
+        return label
+    number, part = match.groups()
+    return f"q{int(number):02d}{part.upper() if part else ''}"
+
+
+def fetch_run(backend, run_key, metric: str, label_pattern: str = WARM_LABELS,
+              cache: RunCache = None, refresh: bool = False) -> list:
+    """
+    Fetch one run through the cache; only queries the backend on a miss.
+
+    Empty results are not cached: a mistyped or still-running run_key is
+    re-queried next time instead of staying empty.
+    """
+    if cache is not None and not refresh:
+        rows = cache.get(run_key, metric, label_pattern)
+        if rows is not None:
+            return rows
+    rows = backend.fetch_run(run_key, metric, label_pattern)
+    if cache is not None and rows:
+        cache.put(run_key, metric, rows, label_pattern)
+    return rows
+
+
+def per_query_seconds(rows: list, label_fn=normalize_query_label,
+                      aggregate=statistics.median) -> dict:
+    """Group (label, seconds) rows by query; repeated iterations are aggregated."""
+    grouped = {}
+    for label, sec in rows:
+        grouped.setdefault(label_fn(label), []).append(sec)
+    return {query: aggregate(values) for query, values in grouped.items()}
+
+
+def join_runs(platform1: dict, platform2: dict, gaps_only: bool = False) -> list:
+    """
+    Join two {query: seconds} maps into QUERY_DATA rows.
+
+    diff  = platform1 - platform2 (time lost by platform1)
+    ratio = platform1 / platform2 (omitted when platform2 took 0s)
+    Rows are sorted by diff, largest gap first.
+    """
+    rows = []
+    for query in platform1.keys() & platform2.keys():
+        t1, t2 = platform1[query], platform2[query]
+        if gaps_only and t1 <= t2:
+            continue
+        row = {"query": query, "platform1_time": t1, "platform2_time": t2, "diff": t1 - t2}
+        if t2:
+            row["ratio"] = t1 / t2
+        rows.append(row)
+    rows.sort(key=lambda r: r["diff"], reverse=True)
+    return rows
+
+
+def load_comparison(sf_run_key, comp_run_key, backend,
+                    sf_metric: str = SF_METRIC, comp_metric: str = COMPETITOR_METRIC,
+                    label_pattern: str = WARM_LABELS, cache_dir=DEFAULT_CACHE_DIR,
+                    refresh: bool = False, gaps_only: bool = False,
+                    label_fn=normalize_query_label) -> list:
+    """
+    Load two runs and return joined per-query rows ready for QUERY_DATA.
+
+    Set cache_dir=None to bypass the on-disk cache entirely.
+    """
+    cache = RunCache(cache_dir) if cache_dir is not None else None
+    sf_rows = fetch_run(backend, sf_run_key, sf_metric, label_pattern, cache, refresh)
+    comp_rows = fetch_run(backend, comp_run_key, comp_metric, label_pattern, cache, refresh)
+    return join_runs(
+        per_query_seconds(sf_rows, label_fn),
+        per_query_seconds(comp_rows, label_fn),
+        gaps_only=gaps_only,
+    )
@@ -11,8 +11,12 @@ Usage:
     4. Open the generated HTML file
 """
 
+import hashlib
+import json
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
+from string import Formatter
 
 # =============================================================================
 # REPORT CONFIGURATION - Customize this section
@@ -24,6 +28,8 @@ REPORT_CONFIG = {
     "date": datetime.now().strftime("%B %d, %Y"),
     "benchmark": "TPC-DS 10TB, Warm Runs",
     "output_file": "tpcds_report.html",
+    "stream": False,  # Write rows straight to disk (use for 100k+ row reports)
+    "incremental": False,  # Re-render only changed sections; skip write if unchanged
     
     # Run metadata
     "runs": [
@@ -331,10 +337,46 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
+# =============================================================================
+# TEMPLATE COMPILATION - done once at import
+# =============================================================================
+
+def compile_template(template: str) -> tuple:
+    """
+    Split a str.format template into (static bytes, slot name) segments.
+    
+    Doubled braces are unescaped and every static run is UTF-8 encoded once,
+    so rendering is just concatenating precomputed bytes with slot values.
+    The last segment's slot name is None.
+    """
+    return tuple(
+        (literal.encode(), field)
+        for literal, field, _spec, _conversion in Formatter().parse(template)
+    )
+
+
+def render_template(compiled: tuple, fields: dict) -> bytes:
+    """Render a compiled template by concatenating segments and slot values."""
+    parts = []
+    for literal, slot in compiled:
+        parts.append(literal)
+        if slot is not None:
+            parts.append(str(fields[slot]).encode())
+    return b"".join(parts)
+
+
+COMPILED_TEMPLATE = compile_template(HTML_TEMPLATE)
+
+
 # =============================================================================
 # REPORT GENERATION FUNCTIONS
 # =============================================================================
 
+ROW_SEPARATOR = "\n            "  # Indentation between <tr> elements in <tbody>
+STREAM_CHUNK_ROWS = 1000         # Rows buffered per write in streaming mode
+STREAM_BUFFER_BYTES = 1 << 20    # File buffer size in streaming mode
+INCREMENTAL_BLOCK_ROWS = 500     # Table rows per cached block in incremental mode
+
 def format_time(seconds: float) -> str:
     """Format seconds as human-readable time."""
     if seconds >= 60:
@@ -420,9 +462,29 @@ def generate_table_headers(columns: list) -> str:
     return "\n                ".join(headers)
 
 
-def generate_table_rows(data: list, columns: list) -> str:
-    """Generate table row HTML."""
-    rows = []
+def _is_columnar(data) -> bool:
+    """True for column-oriented tables; checked without importing numpy."""
+    return (
+        isinstance(data, dict)
+        or hasattr(data, "column_names")
+        or (hasattr(data, "columns") and hasattr(data, "to_numpy"))
+        or getattr(getattr(data, "dtype", None), "names", None) is not None
+    )
+
+
+def iter_table_rows(data, columns: list):
+    """
+    Yield table row HTML one row at a time.
+    
+    Accepts any iterable of row dicts (list, generator, DB cursor wrapper),
+    so rows never need to be materialized together. Columnar tables (pandas,
+    pyarrow, NumPy, dict of columns) go through tpcds_columnar instead.
+    """
+    if _is_columnar(data):
+        from tpcds_columnar import iter_table_rows_columnar
+        yield from iter_table_rows_columnar(data, columns)
+        return
+    
     for row in data:
         # Auto-calculate severity if not provided
         if "severity" not in row and "diff" in row and "ratio" in row:
@@ -450,9 +512,12 @@ def generate_table_rows(data: list, columns: list) -> str:
             align_class = f' class="{align}"' if align != "left" else ""
             cells.append(f"<td{align_class}>{value}</td>")
         
-        rows.append(f"<tr{row_class}>\n                {chr(10).join(cells)}\n            </tr>")
-    
-    return "\n            ".join(rows)
+        yield f"<tr{row_class}>\n                {chr(10).join(cells)}\n            </tr>"
+
+
+def generate_table_rows(data: list, columns: list) -> str:
+    """Generate table row HTML."""
+    return ROW_SEPARATOR.join(iter_table_rows(data, columns))
 
 
 def generate_recommendations(recommendations: list) -> str:
@@ -465,26 +530,237 @@ def generate_recommendations(recommendations: list) -> str:
     return "\n    ".join(recs)
 
 
-def generate_report():
-    """Generate the HTML report."""
-    config = REPORT_CONFIG
-    
-    html = HTML_TEMPLATE.format(
-        title=config["title"],
-        subtitle=config["subtitle"],
-        date=config["date"],
-        benchmark=config["benchmark"],
-        run_metadata=generate_run_metadata(config["runs"]),
-        summary_cards=generate_summary_cards(config["summary_cards"]),
-        key_finding=config["key_finding"],
-        table_headers=generate_table_headers(COLUMNS),
-        table_rows=generate_table_rows(QUERY_DATA, COLUMNS),
-        recommendations=generate_recommendations(config["recommendations"]),
-        year=datetime.now().year,
-    )
+def template_fields(config: dict, columns: list) -> dict:
+    """Collect every template field except the table rows."""
+    return {
+        "title": config["title"],
+        "subtitle": config["subtitle"],
+        "date": config["date"],
+        "benchmark": config["benchmark"],
+        "run_metadata": generate_run_metadata(config["runs"]),
+        "summary_cards": generate_summary_cards(config["summary_cards"]),
+        "key_finding": config["key_finding"],
+        "table_headers": generate_table_headers(columns),
+        "recommendations": generate_recommendations(config["recommendations"]),
+        "year": datetime.now().year,
+    }
+
+
+def write_report_stream(out, rows, config: dict, columns: list,
+                        chunk_rows: int = STREAM_CHUNK_ROWS) -> int:
+    """
+    Stream the report to an open binary file handle.
+    
+    Header and summary cards are written first, then table rows in chunks of
+    `chunk_rows`, then the footer. Only one chunk of rows is held in memory,
+    so peak memory stays flat no matter how many rows `rows` yields.
+    Output is byte-identical to the non-streaming render.
+    Returns the number of rows written.
+    """
+    fields = template_fields(config, columns)
+    separator = ROW_SEPARATOR.encode()
+    count = 0
+    for literal, slot in COMPILED_TEMPLATE:
+        out.write(literal)
+        if slot is None:
+            continue
+        if slot != "table_rows":
+            out.write(str(fields[slot]).encode())
+            continue
+        
+        chunk = []
+        for row_html in iter_table_rows(rows, columns):
+            chunk.append(row_html)
+            if len(chunk) >= chunk_rows:
+                out.write((b"" if count == 0 else separator) + ROW_SEPARATOR.join(chunk).encode())
+                count += len(chunk)
+                chunk.clear()
+        if chunk:
+            out.write((b"" if count == 0 else separator) + ROW_SEPARATOR.join(chunk).encode())
+            count += len(chunk)
+    return count
+
+
+def write_report(config: dict, data, columns: list, stream: bool = False) -> Path:
+    """Render one report to config["output_file"] and return its path."""
+    output_path = Path(config["output_file"])
+    if stream:
+        with output_path.open("wb", buffering=STREAM_BUFFER_BYTES) as out:
+            write_report_stream(out, data, config, columns)
+    else:
+        fields = template_fields(config, columns)
+        fields["table_rows"] = generate_table_rows(data, columns)
+        output_path.write_bytes(render_template(COMPILED_TEMPLATE, fields))
+    return output_path
+
+
+# =============================================================================
+# INCREMENTAL REGENERATION
+# =============================================================================
+
+TEMPLATE_HASH = hashlib.sha256(HTML_TEMPLATE.encode()).hexdigest()[:16]
+
+
+def _hash_inputs(*inputs) -> str:
+    """Stable content hash of a section's inputs."""
+    payload = json.dumps(inputs, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()[:24]
+
+
+def _report_sections(config: dict, data, columns: list, block_rows: int):
+    """
+    Yield (section_hash, render_fn) for every section of the report.
+    
+    render_fn returns {slot: html}. Table rows are split into blocks of
+    `block_rows`, each with its own hash, under the "table_rows" slot;
+    columnar data is split into column slices of `block_rows` rows.
+    """
+    meta = (config["title"], config["subtitle"], config["date"], config["benchmark"], config["runs"])
+    yield _hash_inputs("meta", *meta), lambda: {
+        "title": config["title"],
+        "subtitle": config["subtitle"],
+        "date": config["date"],
+        "benchmark": config["benchmark"],
+        "run_metadata": generate_run_metadata(config["runs"]),
+    }
+    yield _hash_inputs("cards", config["summary_cards"]), lambda: {
+        "summary_cards": generate_summary_cards(config["summary_cards"]),
+    }
+    yield _hash_inputs("key_finding", config["key_finding"]), lambda: {
+        "key_finding": config["key_finding"],
+    }
+    yield _hash_inputs("headers", columns), lambda: {
+        "table_headers": generate_table_headers(columns),
+    }
+    yield _hash_inputs("recommendations", config["recommendations"]), lambda: {
+        "recommendations": generate_recommendations(config["recommendations"]),
+    }
+    year = datetime.now().year
+    yield _hash_inputs("year", year), lambda: {"year": year}
+    
+    if _is_columnar(data):
+        # Column slices render through tpcds_columnar, like the whole table would
+        from tpcds_columnar import to_columns
+        table = to_columns(data)
+        n_rows = len(next(iter(table.values()))) if table else 0
+        for start in range(0, n_rows, block_rows):
+            block = {name: values[start:start + block_rows] for name, values in table.items()}
+            yield _hash_inputs("columns", columns, {name: values.tolist() for name, values in block.items()}), (
+                lambda block=block: {"table_rows": generate_table_rows(block, columns)}
+            )
+        return
+    
+    rows = iter(data)
+    while True:
+        block = list(islice(rows, block_rows))
+        if not block:
+            break
+        yield _hash_inputs("rows", columns, block), (
+            lambda block=block: {"table_rows": generate_table_rows(block, columns)}
+        )
+
+
+def write_report_incremental(config: dict, data, columns: list, cache_dir=None,
+                             block_rows: int = INCREMENTAL_BLOCK_ROWS) -> dict:
+    """
+    Render a report, re-rendering only sections whose inputs changed.
     
+    Each section's inputs (run metadata, summary cards, key finding, table
+    rows in blocks, recommendations) are hashed; rendered fragments live in
+    a sidecar cache next to the output (<output>.parts/). If every hash
+    matches the previous build and the output file is untouched, nothing is
+    written. `data` may be row dicts or a columnar table. Returns
+    {"sections", "rerendered", "written", "output_file"}.
+    """
     output_path = Path(config["output_file"])
-    output_path.write_text(html)
+    cache_dir = Path(cache_dir) if cache_dir else output_path.with_name(output_path.name + ".parts")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / "manifest.json"
+    previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    
+    sections = list(_report_sections(config, data, columns, block_rows))
+    hashes = [section_hash for section_hash, _render in sections]
+    stats = {"sections": len(hashes), "rerendered": 0, "written": False,
+             "output_file": str(output_path)}
+    
+    # Fast path: nothing changed, so no fragment is even read back
+    output_stat = output_path.stat() if output_path.exists() else None
+    if (
+        output_stat is not None
+        and previous.get("template") == TEMPLATE_HASH
+        and previous.get("sections") == hashes
+        and previous.get("output") == [output_stat.st_size, output_stat.st_mtime_ns]
+    ):
+        return stats
+    
+    fields = {}
+    row_blocks = []
+    for section_hash, render in sections:
+        fragment_path = cache_dir / f"{section_hash}.json"
+        if fragment_path.exists():
+            fragment = json.loads(fragment_path.read_text())
+        else:
+            fragment = render()
+            fragment_path.write_text(json.dumps(fragment))
+            stats["rerendered"] += 1
+        if "table_rows" in fragment:
+            row_blocks.append(fragment["table_rows"])
+        else:
+            fields.update(fragment)
+    
+    fields["table_rows"] = ROW_SEPARATOR.join(row_blocks)
+    output_path.write_bytes(render_template(COMPILED_TEMPLATE, fields))
+    output_stat = output_path.stat()
+    manifest_path.write_text(json.dumps({
+        "template": TEMPLATE_HASH,
+        "sections": hashes,
+        "output": [output_stat.st_size, output_stat.st_mtime_ns],
+    }))
+    
+    # Drop fragments no longer referenced by this build
+    live = {f"{h}.json" for h in hashes}
+    for stale in cache_dir.glob("*.json"):
+        if stale.name != "manifest.json" and stale.name not in live:
+            stale.unlink()
+    stats["written"] = True
+    return stats
+
+
+def generate_report(config: dict = None, data=None, columns: list = None, stream: bool = None,
+                    incremental: bool = None):
+    """
+    Generate the HTML report.
+    
+    Defaults to the module-level REPORT_CONFIG, QUERY_DATA and COLUMNS.
+    `data` may be any iterable of row dicts; with `stream=True` (or
+    REPORT_CONFIG["stream"]) rows are written to disk as they are produced.
+    With `incremental=True` (or REPORT_CONFIG["incremental"]) only changed
+    sections are re-rendered and an unchanged report is not rewritten, for
+    row dicts and columnar data alike. Incremental builds assemble the page
+    from cached fragments in memory, so they take precedence over `stream`
+    (a note is printed when both are set).
+    """
+    config = REPORT_CONFIG if config is None else config
+    data = QUERY_DATA if data is None else data
+    columns = COLUMNS if columns is None else columns
+    if stream is None:
+        stream = config.get("stream", False)
+    if incremental is None:
+        incremental = config.get("incremental", False)
+    
+    if incremental:
+        if stream:
+            print("Note: stream is ignored for incremental builds; the report is assembled in memory")
+        stats = write_report_incremental(config, data, columns)
+        output_path = Path(stats["output_file"])
+        if not stats["written"]:
+            print(f"Report unchanged: {output_path.absolute()}")
+        else:
+            print(f"Report generated: {output_path.absolute()} "
+                  f"({stats['rerendered']}/{stats['sections']} sections re-rendered)")
+        return output_path
+    
+    output_path = write_report(config, data, columns, stream)
     print(f"Report generated: {output_path.absolute()}")
     return output_path
 
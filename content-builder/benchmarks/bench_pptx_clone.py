@@ -0,0 +1,68 @@
+"""
+Microbenchmark: DeckBuilder prototype cloning.
+
+Builds the same deck (default 200 slides: title, section and content
+slides repeated, as in a long briefing or appendix) with the normal
+python-pptx path and with DeckBuilder(clone_prototypes=True), checks the
+slide XML is identical, and reports build times.
+
+Usage:
+    uv run python benchmarks/bench_pptx_clone.py
+    uv run python benchmarks/bench_pptx_clone.py --slides 200 1000 --repeat 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+from lxml import etree  # noqa: E402
+
+from pptx_base import DeckBuilder  # noqa: E402
+
+
+def build_deck(slides: int, clone: bool) -> DeckBuilder:
+    """Title slide, then section / content / content groups until `slides`."""
+    deck = DeckBuilder(clone_prototypes=clone)
+    deck.add_title_slide("Customer Briefing", "Feature Deep Dive", "Summit 2026", "October 2026 | Solutions Team")
+    section = 0
+    while deck.slide_count < slides:
+        section += 1
+        deck.add_section_slide(f"Part {section}", "Overview" if section % 2 else "")
+        for topic in range(2):
+            if deck.slide_count < slides:
+                deck.add_content_slide(f"Part {section}: Topic {topic + 1}", f"Details for topic {topic + 1}")
+    return deck
+
+
+def best_of(fn, repeat: int) -> float:
+    """Best wall time of `repeat` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--slides", type=int, nargs="+", default=[200])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'Slides':>7} {'rebuild ms':>11} {'clone ms':>9} {'speedup':>8}")
+    for n in args.slides:
+        plain = [etree.tostring(s._element) for s in build_deck(n, False).prs.slides]
+        cloned = [etree.tostring(s._element) for s in build_deck(n, True).prs.slides]
+        assert plain == cloned
+
+        before = best_of(lambda: build_deck(n, False), args.repeat)
+        after = best_of(lambda: build_deck(n, True), args.repeat)
+        print(f"{n:>7} {before:>11.1f} {after:>9.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Microbenchmark: paginated PPTX tables.
+
+Times paginate_table() layout alone and the full
+DeckBuilder.add_paginated_table_slides() build for large tables (default
+500, 5,000 and 50,000 rows), and checks that every row lands on exactly
+one page and every page fits the available area.
+
+Usage:
+    uv run python benchmarks/bench_pptx_paginate.py
+    uv run python benchmarks/bench_pptx_paginate.py --rows 5000 --build-max 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+from pptx_base import TABLE_BOTTOM, DeckBuilder, paginate_table  # noqa: E402
+
+TOP = 1.4
+
+
+def make_table(rows: int, seed: int = 42) -> list:
+    """Benchmark-appendix style table; some notes wrap onto several lines."""
+    rng = random.Random(seed)
+    table = [["Query", "Snowflake (s)", "Competitor (s)", "Notes"]]
+    for i in range(rows):
+        note = " ".join(["spill to remote storage"] * rng.choice([0, 0, 0, 1, 2, 4]))
+        table.append([f"q{i % 99 + 1:02d}_{i}", f"{rng.uniform(1, 600):.1f}", f"{rng.uniform(1, 600):.1f}", note])
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 5000, 50000])
+    parser.add_argument("--build-max", type=int, default=5000, help="skip the full build above this many rows")
+    args = parser.parse_args(argv)
+
+    available = TABLE_BOTTOM - TOP
+    print(f"{'Rows':>7} {'Pages':>6} {'layout ms':>10} {'build s':>8}")
+    for n in args.rows:
+        data = make_table(n)
+        start = time.perf_counter()
+        pages = paginate_table(data, available)
+        layout = (time.perf_counter() - start) * 1000
+
+        assert sum(len(rows) - 1 for rows, _ in pages) == n
+        assert all(sum(heights) <= available + 1e-9 or len(rows) == 2 for rows, heights in pages)
+
+        build = ""
+        if n <= args.build_max:
+            start = time.perf_counter()
+            DeckBuilder().add_paginated_table_slides("Appendix: Per-Query Results", data, top=TOP)
+            build = f"{time.perf_counter() - start:.2f}"
+        print(f"{n:>7} {len(pages):>6} {layout:>10.1f} {build:>8}")
+
+
+if __name__ == "__main__":
+    main()
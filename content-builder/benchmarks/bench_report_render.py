@@ -0,0 +1,95 @@
+"""
+Microbenchmark: TPC-DS report template rendering.
+
+Compares the old per-render `HTML_TEMPLATE.format(...)` against the
+precompiled segment template (`render_template(COMPILED_TEMPLATE, ...)`)
+at 20, 1k and 100k table rows. Row HTML is generated once up front so the
+first columns isolate template rendering; the end-to-end columns include
+row generation, which dominates.
+
+Measured results: the template step alone is ~3x faster at 20 rows, but
+that saves ~0.01 ms of a ~0.1 ms render, so end-to-end it is ~1.0x. From
+1k rows both paths copy the same row HTML and results swing between about
+0.6x and 1.6x across runs and machines, i.e. no reliable difference. The
+precompiled template is not a measurable speedup for whole reports.
+
+Usage:
+    uv run python benchmarks/bench_report_render.py
+    uv run python benchmarks/bench_report_render.py --rows 20 1000 100000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+import tpcds_report_base as report  # noqa: E402
+
+
+def make_rows(n: int, seed: int = 42) -> list:
+    """Synthetic QUERY_DATA rows shaped like a real gap table."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        t2 = rng.uniform(1, 600)
+        t1 = t2 * rng.uniform(0.5, 4.0)
+        rows.append({
+            "query": f"q{i % 99 + 1:02d}_{i}",
+            "platform1_time": round(t1, 1),
+            "platform2_time": round(t2, 1),
+            "diff": round(t1 - t2, 1),
+            "ratio": round(t1 / t2, 2),
+        })
+    return rows
+
+
+def best_of(fn, repeat: int) -> float:
+    """Best wall time of `repeat` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[20, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    fields = report.template_fields(report.REPORT_CONFIG, report.COLUMNS)
+    print(f"{'Rows':>8} {'format() ms':>12} {'compiled ms':>12} {'speedup':>8} "
+          f"{'e2e format() ms':>16} {'e2e compiled ms':>16} {'e2e speedup':>12}")
+    for n in args.rows:
+        rows = make_rows(n)
+        rendered = dict(fields, table_rows=report.generate_table_rows(rows, report.COLUMNS))
+
+        before = best_of(lambda: report.HTML_TEMPLATE.format(**rendered).encode(), args.repeat)
+        after = best_of(lambda: report.render_template(report.COMPILED_TEMPLATE, rendered), args.repeat)
+        assert report.HTML_TEMPLATE.format(**rendered).encode() == \
+            report.render_template(report.COMPILED_TEMPLATE, rendered)
+
+        e2e_before = best_of(
+            lambda: report.HTML_TEMPLATE.format(
+                **dict(fields, table_rows=report.generate_table_rows(rows, report.COLUMNS))
+            ).encode(),
+            args.repeat,
+        )
+        e2e_after = best_of(
+            lambda: report.render_template(
+                report.COMPILED_TEMPLATE,
+                dict(fields, table_rows=report.generate_table_rows(rows, report.COLUMNS)),
+            ),
+            args.repeat,
+        )
+        print(f"{n:>8} {before:>12.3f} {after:>12.3f} {before / after:>7.1f}x "
+              f"{e2e_before:>16.3f} {e2e_after:>16.3f} {e2e_before / e2e_after:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Content Builder command-line entry point.
+
+Kept import-light on purpose: nothing here (or in cli.py at import time)
+pulls in python-pptx, lxml or numpy. The asset modules are imported only
+when a subcommand that needs them runs.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,3 @@
+from content_builder.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,226 @@
+"""
+Content Builder CLI
+
+One entry point for the skill's scripts. Heavy dependencies are imported
+only by the subcommand that needs them, so the HTML report path never
+loads python-pptx or lxml.
+
+Usage:
+    uv run content-builder report tpcds_report.py
+    uv run content-builder report report.json --stream
+    uv run content-builder deck create_presentation.py
+    uv run content-builder build deck.json --pptx deck.pptx --html deck.html
+    uv run content-builder decks briefings.json --out-dir decks/
+    uv run content-builder reports sweep.json --jobs 8
+    uv run content-builder watch tpcds_report.py
+    uv run content-builder marp slides.md -o slides.html
+
+Add --import-times (before the subcommand) to print how long each lazily
+imported module took; use `python -X importtime` for the full tree.
+
+The asset modules are loaded from ../assets in a source checkout (`uv run`
+installs the project in editable mode); a built wheel bundles them as
+content_builder/assets.
+
+Cold start of the JSON report path (process start to exit) is ~50 ms for
+the installed script and ~70 ms from a checkout on a fast machine. That
+is the process alone: a launcher in front of it (`uv run` checking the
+environment on each call, pyenv shims) adds its own startup, and through
+one the path has measured ~180 ms, above the 100 ms target. Call the
+installed content-builder script directly when startup time matters.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+_START = time.perf_counter()
+_PACKAGE_DIR = Path(__file__).resolve().parent
+# Installed wheel: bundled copy; source checkout: the skill's assets/ folder
+ASSETS_DIR = str(_PACKAGE_DIR / "assets" if (_PACKAGE_DIR / "assets").is_dir() else _PACKAGE_DIR.parent / "assets")
+
+# Defaults for the content a JSON report may omit. REPORT_CONFIG's values
+# are the template's sample content and must not leak into user reports.
+REPORT_CONTENT_DEFAULTS = {
+    "subtitle": "",
+    "benchmark": "",
+    "runs": [],
+    "summary_cards": [],
+    "key_finding": "",
+    "recommendations": [],
+}
+
+# (module or script, seconds, modules newly loaded) for every lazy import
+# and every user script run
+IMPORT_TIMES = []
+
+
+# =============================================================================
+# LAZY IMPORTS
+# =============================================================================
+
+def timed(label: str, fn, *args, **kwargs):
+    """Call fn, recording its wall time and how many modules it imported."""
+    before = len(sys.modules)
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        IMPORT_TIMES.append((label, time.perf_counter() - start, len(sys.modules) - before))
+
+
+def load(name: str):
+    """Import an asset (or third-party) module on first use, recording its cost."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if ASSETS_DIR not in sys.path:
+        sys.path.insert(0, ASSETS_DIR)
+    timed(name, __import__, name)
+    return sys.modules[name]
+
+
+def print_import_times(stream=sys.stderr):
+    """Print the lazy-import breakdown and total time since the CLI started."""
+    total = time.perf_counter() - _START
+    print(f"\n{'Import / run':<32} {'ms':>8} {'modules':>8}", file=stream)
+    for name, seconds, modules in IMPORT_TIMES:
+        print(f"{name:<32} {seconds * 1000:>8.1f} {modules:>8}", file=stream)
+    print(f"{'(cli start -> exit)':<32} {total * 1000:>8.1f} {len(sys.modules):>8}", file=stream)
+
+
+# =============================================================================
+# SUBCOMMANDS
+# =============================================================================
+
+def run_script(path: str, **generate_kwargs):
+    """
+    Run a copied report or deck script.
+
+    Report scripts (REPORT_CONFIG + generate_report) are loaded without
+    their __main__ block so --stream/--incremental can be passed through;
+    anything else runs as __main__.
+    """
+    runpy = load("runpy")
+    if ASSETS_DIR not in sys.path:
+        sys.path.insert(0, ASSETS_DIR)  # Deck scripts import brand.py from here
+    script = Path(path)
+    sys.path.insert(0, str(script.parent))
+    source = script.read_text()
+    name = script.name
+    if "REPORT_CONFIG" in source and "def generate_report" in source:
+        namespace = timed(f"{name} (load)", runpy.run_path, path, run_name="__content_builder__")
+        kwargs = {k: v for k, v in generate_kwargs.items() if v is not None}
+        return timed(f"{name} (generate)", namespace["generate_report"], **kwargs)
+    return timed(f"{name} (run)", runpy.run_path, path, run_name="__main__")
+
+
+def cmd_report(args):
+    """Render one TPC-DS report from a script copy or a JSON report entry."""
+    if args.file.endswith(".py"):
+        run_script(args.file, stream=args.stream, incremental=args.incremental)
+        return 0
+
+    json = load("json")
+    report = load("tpcds_report_base")
+    path = Path(args.file)
+    entry = json.loads(path.read_text())
+    if "title" not in entry:
+        raise SystemExit(f"{args.file}: a JSON report needs a 'title'")
+    if "data_file" in entry:
+        entry["data"] = json.loads((path.parent / entry["data_file"]).read_text())
+    config = {
+        "date": report.REPORT_CONFIG["date"],
+        "output_file": report.REPORT_CONFIG["output_file"],
+        **REPORT_CONTENT_DEFAULTS,
+        **entry,
+    }
+    columns = [tuple(col) for col in entry.get("columns", report.COLUMNS)]
+    timed("generate_report", report.generate_report, config, entry.get("data", []), columns,
+          stream=args.stream, incremental=args.incremental)
+    return 0
+
+
+def cmd_deck(args):
+    """Build a PPTX deck from a copied pptx_base.py script."""
+    run_script(args.file)
+    return 0
+
+
+def cmd_marp(args):
+    """
+    Render a Marp markdown deck.
+
+    HTML is rendered in-process by marp_render (no Node); PDF/PNG are
+    rasterized per slide in parallel by marp_export. --marp-cli uses
+    marp-cli instead.
+    """
+    if args.output.endswith(".html") and not args.marp_cli:
+        marp_render = load("marp_render")
+        output = timed("render_file", marp_render.render_file, args.file, args.output)
+        print(f"✅ Rendered: {output.absolute()}")
+        return 0
+    if args.output.endswith((".pdf", ".png")) and not args.marp_cli:
+        marp_export = load("marp_export")
+        summary = timed("export", marp_export.export, args.file, args.output, jobs=args.jobs)
+        print(f"✅ Exported {len(summary['pngs'])} slides ({summary['rendered']} rendered, "
+              f"{summary['cached']} cached) in {summary['wall_sec']}s")
+        return 0
+    subprocess = load("subprocess")
+    command = ["npx", "--yes", "@marp-team/marp-cli", args.file, "-o", args.output]
+    if args.output.endswith(".pdf"):
+        command.append("--allow-local-files")
+    return subprocess.run(command).returncode
+
+
+# Subcommands that hand their arguments to an asset module's own main()
+DELEGATED = {
+    "build": ("slide_model", "Build PPTX and Marp outputs from one deck file"),
+    "decks": ("deck_batch", "Build many PPTX decks from a manifest"),
+    "reports": ("tpcds_batch", "Render many TPC-DS reports from a manifest"),
+    "watch": ("watch", "Rebuild a report or deck script on every change"),
+}
+
+
+def build_parser():
+    argparse = load("argparse")
+    parser = argparse.ArgumentParser(prog="content-builder", description="Snowflake-branded decks and reports.")
+    parser.add_argument("--import-times", action="store_true", help="print the lazy-import time breakdown")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="render a TPC-DS HTML report (.py script or .json entry)")
+    report.add_argument("file")
+    report.add_argument("--stream", action="store_true", default=None, help="write rows as they are produced")
+    report.add_argument("--incremental", action="store_true", default=None, help="re-render changed sections only")
+    report.set_defaults(handler=cmd_report)
+
+    deck = commands.add_parser("deck", help="build a PPTX deck script")
+    deck.add_argument("file")
+    deck.set_defaults(handler=cmd_deck)
+
+    marp = commands.add_parser("marp", help="render a Marp deck to HTML or PDF")
+    marp.add_argument("file")
+    marp.add_argument("-o", "--output", required=True)
+    marp.add_argument("-j", "--jobs", type=int, default=None, help="PDF/PNG worker processes")
+    marp.add_argument("--marp-cli", action="store_true", help="use npx @marp-team/marp-cli instead")
+    marp.set_defaults(handler=cmd_marp)
+
+    for name, (module, description) in DELEGATED.items():
+        delegated = commands.add_parser(name, help=description.lower(), add_help=False)
+        delegated.set_defaults(module=module)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args, rest = build_parser().parse_known_args(argv)
+    try:
+        if hasattr(args, "module"):
+            sys.argv[0] = f"content-builder {args.command}"
+            return load(args.module).main(rest) or 0
+        if rest:
+            build_parser().error(f"unrecognized arguments: {' '.join(rest)}")
+        return args.handler(args) or 0
+    finally:
+        if args.import_times:
+            print_import_times()
@@ -0,0 +1,70 @@
+"""
+Tests for pptx_base: the bulk table writer and prototype cloning produce
+the same slide XML as the python-pptx object-model paths they replaced.
+
+Usage:
+    uv run pytest tests/
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pptx")
+from lxml import etree  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "assets"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import pptx_base  # noqa: E402
+from bench_pptx_table import add_table_cellwise, make_table  # noqa: E402
+from pptx_base import DeckBuilder  # noqa: E402
+
+
+def c14n(element) -> bytes:
+    return etree.tostring(element, method="c14n")
+
+
+def table_slide(add_table, data):
+    slide = DeckBuilder().new_slide()
+    add_table(slide, data)
+    return slide
+
+
+def test_bulk_table_matches_cellwise():
+    data = [
+        ["Feature", "Share %", "Notes"],
+        ["Bells\x07 & <whistles>", "100%", "tab\there"],
+        ["Escape\x1b", "50%s", "two\nparagraphs\n\nand a gap"],
+        ["Line\vbreak", 42, ""],
+    ]
+    bulk = c14n(table_slide(pptx_base.add_table, data)._element)
+    assert bulk == c14n(table_slide(add_table_cellwise, data)._element)
+    assert b"_x0007_" in bulk and b"50%s" in bulk
+
+    # 100 rows, and seven columns so the frame width does not split evenly
+    data = make_table(100, 7)
+    assert c14n(table_slide(pptx_base.add_table, data)._element) == \
+        c14n(table_slide(add_table_cellwise, data)._element)
+
+
+def build_deck(clone: bool) -> DeckBuilder:
+    """Repeated title/section/content slides, with text the token swap must not mangle."""
+    deck = DeckBuilder(clone_prototypes=clone)
+    deck.add_title_slide("Briefing 100%", "Q&A <live>", "Summit\x07", "Oct | 50%s")
+    for i in range(6):
+        deck.add_section_slide(f"Part {i} & <more>", "Overview %d" if i % 2 else "")
+        slide = deck.add_content_slide(f"Topic {i}\tdetails", "{{title}}" if i == 2 else f"{i * 10}% done")
+        deck.add_table(slide, [["Feature", "Status"], [f"f{i}\x1b", "GA"]])
+        deck.add_content_slide(f"Line\nbreak {i}", "")
+    deck.add_title_slide("Briefing 100%", "", "", "Thanks\x07")
+    return deck
+
+
+def test_cloned_deck_matches_rebuilt_deck():
+    plain = [c14n(slide._element) for slide in build_deck(clone=False).prs.slides]
+    cloned = [c14n(slide._element) for slide in build_deck(clone=True).prs.slides]
+    assert cloned == plain
+    assert b"{{title}}" in plain[8] and b"_x0007_" in plain[-1]
@@ -0,0 +1,75 @@
+"""
+Tests for tpcds_batch: output paths and the per-batch data backend.
+
+Usage:
+    uv run pytest tests/
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+import deck_batch  # noqa: E402
+import tpcds_batch  # noqa: E402
+from tpcds_data import COMPETITOR_METRIC, SF_METRIC, create_fixture  # noqa: E402
+
+CONTENT = {"title": "T", "subtitle": "", "benchmark": "", "key_finding": "",
+           "runs": [], "summary_cards": [], "recommendations": []}
+
+
+def sqlite_fixture(path: Path, sf_seconds: float):
+    connection = sqlite3.connect(path)
+    create_fixture(connection, {
+        "1": {"query01_warm": {SF_METRIC: sf_seconds * 1000}},
+        "2": {"query01_warm": {COMPETITOR_METRIC: 1000}},
+    })
+    connection.close()
+
+
+def run_keys_manifest(database: Path, output: Path) -> dict:
+    return {
+        "defaults": CONTENT,
+        "backend": {"type": "sqlite", "database": str(database)},
+        "reports": [{"output_file": str(output), "run_keys": ["1", "2"], "cache_dir": None}],
+    }
+
+
+def test_each_batch_uses_its_own_backend(tmp_path):
+    sqlite_fixture(tmp_path / "a.db", 5)
+    sqlite_fixture(tmp_path / "b.db", 9)
+
+    first = tpcds_batch.run_batch(run_keys_manifest(tmp_path / "a.db", tmp_path / "a.html"), jobs=1)
+    second = tpcds_batch.run_batch(run_keys_manifest(tmp_path / "b.db", tmp_path / "b.html"), jobs=1)
+
+    assert not first["failures"] and not second["failures"]
+    assert "5.0s" in (tmp_path / "a.html").read_text()
+    assert "9.0s" in (tmp_path / "b.html").read_text()
+    assert tpcds_batch._BACKEND is None
+
+
+def test_relative_outputs_follow_manifest_dir_or_out_dir(tmp_path):
+    manifest_dir = tmp_path / "manifests"
+    manifest_dir.mkdir()
+    (manifest_dir / "rows.json").write_text(json.dumps(
+        [{"query": "q1", "platform1_time": 2.0, "platform2_time": 1.0, "diff": 1.0, "ratio": 2.0}]))
+    (manifest_dir / "sweep.json").write_text(json.dumps(
+        {"defaults": CONTENT, "reports": [{"output_file": "out/r.html", "data_file": "rows.json"}]}))
+    (manifest_dir / "decks.json").write_text(json.dumps(
+        {"decks": [{"output_file": "out/d.pptx", "slides": [{"type": "section", "title": "S"}]}]}))
+
+    reports = tpcds_batch.expand_entries(tpcds_batch.load_manifest(manifest_dir / "sweep.json"))
+    decks = deck_batch.expand_decks(deck_batch.load_manifest(manifest_dir / "decks.json"))
+    assert Path(reports[0]["output_file"]) == manifest_dir / "out/r.html"
+    assert Path(decks[0]["output_file"]) == manifest_dir / "out/d.pptx"
+
+    out_dir = tmp_path / "elsewhere"
+    reports = tpcds_batch.expand_entries(tpcds_batch.load_manifest(manifest_dir / "sweep.json"), out_dir)
+    decks = deck_batch.expand_decks(deck_batch.load_manifest(manifest_dir / "decks.json"), out_dir)
+    assert Path(reports[0]["output_file"]) == out_dir / "out/r.html"
+    assert Path(decks[0]["output_file"]) == out_dir / "out/d.pptx"
+
+    summary = tpcds_batch.run_batch(tpcds_batch.load_manifest(manifest_dir / "sweep.json"), jobs=1)
+    assert not summary["failures"] and (manifest_dir / "out/r.html").exists()
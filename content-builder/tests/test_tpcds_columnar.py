@@ -0,0 +1,91 @@
+"""
+Tests for tpcds_columnar: every columnar input renders the same table rows
+as the list-of-dicts path.
+
+Usage:
+    uv run pytest tests/
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+import tpcds_report_base as report  # noqa: E402
+
+KEYS = ["query", "platform1_time", "platform2_time", "diff", "ratio"]
+
+
+def make_rows(n: int, seed: int = 11) -> list:
+    """Rows covering every severity band and both time units, with % and control characters in labels."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        t2 = rng.uniform(0.5, 300)
+        t1 = t2 * rng.choice([0.8, 1.2, 2.0, 3.5])
+        rows.append({"query": f"q{i:02d} 100%{'%s' if i % 3 == 0 else ''}\x07\t",
+                     "platform1_time": round(t1, 1), "platform2_time": round(t2, 1),
+                     "diff": round(t1 - t2, 1), "ratio": round(t1 / t2, 2)})
+    return rows
+
+
+def as_columns(rows: list, keys: list) -> dict:
+    return {key: [row[key] for row in rows] for key in keys}
+
+
+def test_dict_of_columns_matches_rows():
+    rows = make_rows(200)
+    expected = report.generate_table_rows(rows, report.COLUMNS)
+    assert "100%%s\x07" in expected
+    assert report.generate_table_rows(as_columns(rows, KEYS), report.COLUMNS) == expected
+
+    # Explicit severity column instead of the derived one
+    for i, row in enumerate(rows):
+        row["severity"] = ["severe", "moderate", "minor"][i % 3]
+    assert report.generate_table_rows(as_columns(rows, KEYS + ["severity"]), report.COLUMNS) == \
+        report.generate_table_rows(rows, report.COLUMNS)
+
+
+def test_structured_array_and_arrow_match_rows():
+    rows = make_rows(200)
+    expected = report.generate_table_rows(rows, report.COLUMNS)
+
+    dtype = [("query", object)] + [(key, float) for key in KEYS[1:]]
+    array = np.array([tuple(row[key] for key in KEYS) for row in rows], dtype=dtype)
+    assert report.generate_table_rows(array, report.COLUMNS) == expected
+
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(as_columns(rows, KEYS))
+    assert report.generate_table_rows(table, report.COLUMNS) == expected
+
+
+def test_text_cells_and_missing_columns_match_rows():
+    # Non-numeric times fall back to str(); columns absent from the data render empty
+    rows = [{"query": "q1 50%\x1b", "platform1_time": "n/a", "platform2_time": 61.0,
+             "diff": 12.5, "ratio": 1.2},
+            {"query": "q2", "platform1_time": 75.0, "platform2_time": "timeout %d",
+             "diff": 90.0, "ratio": 3.0}]
+    columns = report.COLUMNS + [("notes", "Notes", "center", None)]
+    assert report.generate_table_rows(as_columns(rows, KEYS), columns) == \
+        report.generate_table_rows(rows, columns)
+
+
+def test_incremental_columnar_matches_rows(tmp_path):
+    rows = make_rows(200)
+    config = {**report.REPORT_CONFIG, "output_file": str(tmp_path / "rows.html")}
+    expected = report.write_report(config, rows, report.COLUMNS).read_bytes()
+
+    config["output_file"] = str(tmp_path / "columns.html")
+    columns = as_columns(rows, KEYS)
+    stats = report.write_report_incremental(config, columns, report.COLUMNS, block_rows=64)
+    assert stats["written"] and Path(stats["output_file"]).read_bytes() == expected
+
+    # One changed cell re-renders only its block
+    columns["diff"][100] += 1
+    stats = report.write_report_incremental(config, columns, report.COLUMNS, block_rows=64)
+    assert stats["rerendered"] == 1
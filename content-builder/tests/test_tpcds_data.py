@@ -0,0 +1,80 @@
+"""
+Tests for tpcds_data against local fixture databases.
+
+Usage:
+    uv run pytest tests/
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+from tpcds_data import (  # noqa: E402
+    COMPETITOR_METRIC, SF_METRIC, DuckDBBackend, RunCache, SQLiteBackend,
+    create_fixture, fetch_run, load_comparison,
+)
+
+RUNS = {
+    "2775574": {
+        "query78_warm": {SF_METRIC: 12000},
+        "query78_warm_2": {SF_METRIC: 14000},
+        "query23p1_warm": {SF_METRIC: 3000},
+        "query05_cold": {SF_METRIC: 99000},
+    },
+    "3473166": {
+        "query78_warm": {COMPETITOR_METRIC: 4000},
+        "query23p1_warm": {COMPETITOR_METRIC: 5000},
+    },
+}
+
+
+def _sqlite_backend():
+    connection = sqlite3.connect(":memory:")
+    create_fixture(connection, RUNS)
+    return SQLiteBackend(connection)
+
+
+def _duckdb_backend():
+    duckdb = pytest.importorskip("duckdb")
+    connection = duckdb.connect(":memory:")
+    create_fixture(connection, RUNS)
+    return DuckDBBackend(connection)
+
+
+@pytest.fixture(params=[_sqlite_backend, _duckdb_backend], ids=["sqlite", "duckdb"])
+def backend(request):
+    return request.param()
+
+
+def test_fetch_run_reads_warm_rows(backend):
+    rows = backend.fetch_run("2775574", SF_METRIC)
+    assert sorted(rows) == [("query23p1_warm", 3.0), ("query78_warm", 12.0), ("query78_warm_2", 14.0)]
+
+
+def test_load_comparison_joins_runs(backend, tmp_path):
+    rows = load_comparison("2775574", "3473166", backend, cache_dir=tmp_path)
+    assert rows == [
+        {"query": "q78", "platform1_time": 13.0, "platform2_time": 4.0, "diff": 9.0, "ratio": 3.25},
+        {"query": "q23P1", "platform1_time": 3.0, "platform2_time": 5.0, "diff": -2.0, "ratio": 0.6},
+    ]
+    assert load_comparison("2775574", "3473166", backend, cache_dir=tmp_path, gaps_only=True) == rows[:1]
+
+
+def test_cached_run_is_not_queried_again(backend, tmp_path):
+    cache = RunCache(tmp_path)
+    rows = fetch_run(backend, "2775574", SF_METRIC, cache=cache)
+    backend.connection.close()
+    assert fetch_run(backend, "2775574", SF_METRIC, cache=cache) == rows
+
+
+def test_empty_run_is_not_cached(backend, tmp_path):
+    cache = RunCache(tmp_path)
+    assert fetch_run(backend, "9999999", SF_METRIC, cache=cache) == []
+    assert cache.get("9999999", SF_METRIC) is None
+
+    create_fixture(backend.connection, {"9999999": {"query01_warm": {SF_METRIC: 1000}}})
+    assert fetch_run(backend, "9999999", SF_METRIC, cache=cache) == [("query01_warm", 1.0)]
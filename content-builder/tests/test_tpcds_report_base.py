@@ -0,0 +1,60 @@
+"""
+Tests for tpcds_report_base: the streaming render writes the same bytes as
+the buffered one.
+
+Usage:
+    uv run pytest tests/
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+import tpcds_report_base as report  # noqa: E402
+
+CONFIG = {
+    **report.REPORT_CONFIG,
+    "title": "Gaps at 100% load",
+    "key_finding": "q7 is 3x slower (50% of the gap)\x07",
+}
+
+
+def make_rows(n: int, seed: int = 7) -> list:
+    """Gap-table rows covering every severity band, with % and control characters in labels."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        t2 = rng.uniform(0.5, 300)
+        t1 = t2 * rng.choice([0.8, 1.2, 2.0, 3.5])
+        row = {"query": f"q{i:02d} 100%{'%s' if i % 3 == 0 else ''}\x07\t",
+               "platform1_time": round(t1, 1), "platform2_time": round(t2, 1),
+               "diff": round(t1 - t2, 1), "ratio": round(t1 / t2, 2)}
+        if i % 5 == 0:
+            row["severity"] = "severe"
+        rows.append(row)
+    return rows
+
+
+def render(tmp_path: Path, name: str, data, stream: bool) -> bytes:
+    config = {**CONFIG, "output_file": str(tmp_path / name)}
+    return report.write_report(config, data, report.COLUMNS, stream=stream).read_bytes()
+
+
+def test_stream_matches_buffered(tmp_path):
+    rows = make_rows(250)
+    buffered = render(tmp_path, "buffered.html", rows, stream=False)
+    assert render(tmp_path, "streamed.html", (row for row in rows), stream=True) == buffered
+
+    # Small chunks, so the row separator between chunks is exercised
+    with (tmp_path / "chunked.html").open("wb") as out:
+        count = report.write_report_stream(out, iter(rows), CONFIG, report.COLUMNS, chunk_rows=7)
+    assert count == 250
+    assert (tmp_path / "chunked.html").read_bytes() == buffered
+    assert "100%%s\x07".encode() in buffered
+
+
+def test_stream_matches_buffered_without_rows(tmp_path):
+    assert render(tmp_path, "streamed.html", iter([]), stream=True) == \
+        render(tmp_path, "buffered.html", [], stream=False)
@@ -0,0 +1,213 @@
+"""
+Workload Year-in-Review - Single-Scan Cube
+
+Levels 1, 2, 3a and 3b differ only in their GROUP BY keys, so instead of
+one rollup scan per level (eight with the recurring variants) this runs the
+skill.md cube query once - GROUPING SETS over month x product category x
+use case x is_recurrent - and derives every level's result table from it.
+
+Derived tables have the same columns, values and row order as the level
+queries: the same formulas with the same NULLIF and ROUND semantics, and
+the same join semantics (a NULL use case present in both months comes
+back as two one-month rows, as from the query's FULL OUTER JOIN).
+
+Usage:
+    from yir_cube import fetch_cube, level_result
+
+    cube = fetch_cube(backend, ["2025-02", "2025-03", "2026-01"])
+    columns, rows = level_result(cube, "level2_product_category", "2025-02", "2026-01")
+"""
+
+import math
+
+from yir_sql import ACCOUNT_INDEX_TABLE, LEVELS, build_cube_query, parse_month, template_vars
+
+# GROUPING(product_category, use_case, is_recurrent) per cube grouping,
+# without and with the recurring breakdown
+GROUPING_IDS = {
+    "total": (7, 6),
+    "product_category": (3, 2),
+    "use_case": (1, 0),
+}
+
+# Result columns per grouping, in the level queries' order.
+# Month label columns use {p1}/{p2}; values name the derived metric.
+LEVEL_COLUMNS = {
+    "total": [
+        ("scope", "name"), ("{p1} Jobs", "jobs1"), ("{p2} Jobs", "jobs2"),
+        ("Jobs Growth %", "growth"), ("Jobs X", "jobs_x"),
+        ("{p1} Credits", "credits1"), ("{p2} Credits", "credits2"),
+        ("{p1} Cr/1K", "cr1k1"), ("{p2} Cr/1K", "cr1k2"), ("Credits Δ %", "credits_delta"),
+        ("Credits X", "credits_x"), ("{p1} Avg ms", "ms1"), ("{p2} Avg ms", "ms2"),
+        ("Exec Δ %", "exec_delta"), ("Speed X", "speed_x"), ("Jobs/Credit X", "jobs_credit_x"),
+    ],
+    "product_category": [
+        ("product_category", "name"), ("{p1} Jobs", "jobs1"), ("{p2} Jobs", "jobs2"),
+        ("Growth %", "growth"), ("Jobs X", "jobs_x"),
+        ("{p1} Credits", "credits1"), ("{p2} Credits", "credits2"),
+        ("{p1} Cr/1K", "cr1k1"), ("{p2} Cr/1K", "cr1k2"), ("Credits Δ %", "credits_delta"),
+        ("Credits X", "credits_x"), ("{p1} ms", "ms1"), ("{p2} ms", "ms2"),
+        ("Exec Δ %", "exec_delta"), ("Speed X", "speed_x"), ("Jobs/Credit X", "jobs_credit_x"),
+    ],
+    "use_case": [
+        ("use_case", "name"), ("{p1} Jobs", "jobs1"), ("{p2} Jobs", "jobs2"),
+        ("Growth %", "growth"), ("Jobs X", "jobs_x"),
+        ("{p1} Credits", "credits1"), ("{p2} Credits", "credits2"),
+        ("Credits Δ %", "credits_delta"), ("Credits X", "credits_x"),
+        ("Exec Δ %", "exec_delta"), ("Speed X", "speed_x"), ("Jobs/Credit X", "jobs_credit_x"),
+    ],
+}
+
+
+# =============================================================================
+# FETCHING
+# =============================================================================
+
+def fetch_cube(backend, months, account_filter: str = "external-paid", account_index: str = None,
+               index_table: str = ACCOUNT_INDEX_TABLE) -> dict:
+    """
+    Run the cube query once for every month in `months`.
+
+    `account_index` and `index_table` are passed to build_cube_query(). Returns {"sql", "sums"};
+    sums maps (grouping_id, month, product_category, use_case, is_recurrent)
+    -> (total_jobs, total_credits, total_dur_ms).
+    """
+    sql = build_cube_query(months, account_filter, account_index=account_index, index_table=index_table)
+    columns, rows = backend.query(sql)
+    index = {column.lower(): i for i, column in enumerate(columns)}
+    sums = {}
+    for row in rows:
+        key = (
+            int(row[index["grouping_id"]]),
+            str(row[index["month"]])[:10],
+            row[index["product_category"]],
+            row[index["use_case"]],
+            row[index["is_recurrent"]],
+        )
+        sums[key] = (
+            _number(row[index["total_jobs"]], int),
+            _number(row[index["total_credits"]], float),
+            _number(row[index["total_dur_ms"]], int),
+        )
+    return {"sql": sql, "sums": sums}
+
+
+def _number(value, kind):
+    """Plain int/float from driver values (Snowflake returns Decimal)."""
+    return None if value is None else kind(value)
+
+
+# =============================================================================
+# SQL SEMANTICS
+# =============================================================================
+
+def sql_round(value, digits: int = 0):
+    """ROUND(): half away from zero; NULL stays NULL."""
+    if value is None:
+        return None
+    scaled = float(value) * 10.0 ** digits
+    whole = math.floor(abs(scaled))
+    if abs(scaled) - whole >= 0.5:
+        whole += 1
+    return math.copysign(whole, scaled) / 10.0 ** digits
+
+
+def _div(numerator, denominator):
+    """numerator / NULLIF(denominator, 0), with NULL propagation."""
+    if numerator is None or denominator is None or denominator == 0:
+        return None
+    return numerator / denominator
+
+
+def _sub(a, b):
+    return None if a is None or b is None else a - b
+
+
+def _mul(a, b):
+    return None if a is None or b is None else a * b
+
+
+def derive(p1: tuple, p2: tuple) -> dict:
+    """Every level metric for one scope from its two (jobs, credits, dur_ms) sums."""
+    jobs1, credits1, dur1 = p1 or (None, None, None)
+    jobs2, credits2, dur2 = p2 or (None, None, None)
+    cr1k1, cr1k2 = _div(_mul(credits1, 1000), jobs1), _div(_mul(credits2, 1000), jobs2)
+    ms1, ms2 = _div(dur1, jobs1), _div(dur2, jobs2)
+    jobs_x = _div(jobs2, jobs1)
+    credits_x = _div(cr1k1, cr1k2)
+    return {
+        "jobs1": jobs1,
+        "jobs2": jobs2,
+        "growth": sql_round(_div(_mul(_sub(jobs2, jobs1), 100.0), jobs1), 1),
+        "jobs_x": sql_round(jobs_x, 2),
+        "credits1": sql_round(credits1, 0),
+        "credits2": sql_round(credits2, 0),
+        "cr1k1": sql_round(cr1k1, 4),
+        "cr1k2": sql_round(cr1k2, 4),
+        "credits_delta": sql_round(_mul(_div(_sub(cr1k1, cr1k2), cr1k1), 100), 1),
+        "credits_x": sql_round(credits_x, 2),
+        "ms1": sql_round(ms1, 0),
+        "ms2": sql_round(ms2, 0),
+        "exec_delta": sql_round(_mul(_div(_sub(ms1, ms2), ms1), 100), 1),
+        "speed_x": sql_round(_div(ms1, ms2), 2),
+        "jobs_credit_x": sql_round(_mul(jobs_x, credits_x), 2),
+    }
+
+
+# =============================================================================
+# LEVEL TABLES
+# =============================================================================
+
+def _scopes(cube: dict, grouping_id: int, month: str, spec: dict, recurring: bool) -> dict:
+    """{scope name: sums} for one month of one cube grouping."""
+    scopes = {}
+    for (gid, key_month, category, use_case, is_recurrent), sums in cube["sums"].items():
+        if gid != grouping_id or key_month != month or (recurring and is_recurrent is not True):
+            continue
+        if spec["group"] == "total":
+            scopes["All Snowflake"] = sums
+        elif spec["group"] == "product_category":
+            if category is not None:  # Level 2: category IS NOT NULL
+                scopes[category] = sums
+        elif category == spec["category"]:
+            scopes[use_case] = sums
+    return scopes
+
+
+def level_result(cube: dict, level: str, start, end, recurring: bool = False) -> tuple:
+    """
+    One level's (columns, rows), as its skill.md query would return them.
+
+    Level 1 joins the two months (no row unless both exist); Levels 2/3
+    full-outer-join them (NULL names never match) and sort by end-month
+    jobs, largest first.
+    """
+    spec = LEVELS[level]
+    variables = template_vars(start, end)
+    labels = {"p1": variables["start_month_label"], "p2": variables["end_month_label"]}
+    layout = LEVEL_COLUMNS[spec["group"]]
+    columns = [name.format(**labels) for name, _ in layout]
+    grouping_id = GROUPING_IDS[spec["group"]][1 if recurring else 0]
+
+    month1, month2 = parse_month(start).isoformat(), parse_month(end).isoformat()
+    period1 = _scopes(cube, grouping_id, month1, spec, recurring)
+    period2 = _scopes(cube, grouping_id, month2, spec, recurring)
+    if spec["group"] == "total":
+        names = [name for name in period1 if name in period2]
+    else:
+        names = list(dict.fromkeys([*period1, *period2]))
+
+    rows = []
+    for name in names:
+        pairs = [(period1.get(name), period2.get(name))]
+        if name is None and name in period1 and name in period2:
+            # FULL OUTER JOIN ON p1.use_case = p2.use_case never matches NULL to NULL:
+            # the query returns a NULL scope as one row per month
+            pairs = [(period1[name], None), (None, period2[name])]
+        for sums1, sums2 in pairs:
+            metrics = {"name": name, **derive(sums1, sums2)}
+            rows.append(tuple(metrics[key] for _, key in layout))
+    if spec["group"] != "total":
+        # ORDER BY p2.total_jobs DESC (NULLs last); ties keep name order for stable output
+        rows.sort(key=lambda row: (row[2] is None, -(row[2] or 0), str(row[0])))
+    return columns, rows
@@ -0,0 +1,372 @@
+"""
+Workload Year-in-Review - Query Backends and Local Fixture
+
+Runs the rendered skill.md queries against Snowflake, or offline against a
+local DuckDB stand-in for the three source tables:
+
+    job_feature_daily_account_rollup  (ds, deployment, account_id,
+                                       feature_vector, jobs, total_credits,
+                                       dur_xp_executing)
+    dim_accounts_history              (snowflake_deployment,
+                                       snowflake_account_id, general_date,
+                                       snowflake_account_type, agreement_type)
+    spi_tracker_index                 (ds, month_index_xp)
+
+create_fixture() fills them with synthetic data generated in SQL from a
+seeded integer hash, so the same seed and size always produce the same
+rows (and the same results).
+
+Usage:
+    from yir_data import DuckDBBackend, SnowflakeBackend, create_fixture
+
+    backend = DuckDBBackend()
+    create_fixture(backend.connection, accounts=60, seed=7)
+    columns, rows = backend.query(sql)
+
+Backends:
+    SnowflakeBackend   - snowscience tables via snowflake-connector-python
+    DuckDBBackend      - local DuckDB copy (templates rewritten by yir_sql.to_duckdb)
+    SimulatedWarehouse - wraps a backend with round-trip latency and injected
+                         transient failures, to exercise the scheduler offline
+
+clone() returns a backend for another thread (a new Snowflake connection or
+DuckDB cursor on the same database); yir_schedule's pool calls it.
+"""
+
+import json
+import random
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from yir_sql import to_duckdb
+
+FIXTURE_START = date(2025, 1, 1)
+FIXTURE_END = date(2026, 3, 1)       # Exclusive
+RECURRENT_FROM = date(2025, 3, 1)    # is_recurrent key absent before this, as in production
+
+# (product category, use case, jobs per account-day, yearly job growth,
+#  credits per 1K jobs, yearly Cr/1K factor, avg ms, yearly ms factor)
+FEATURES = [
+    ("Analytics", "Business Intelligence", 60000, 2.3, 1.05, 0.54, 1400, 0.55),
+    ("Analytics", "BI Tools (3P)", 9000, 2.9, 1.30, 0.41, 1700, 0.38),
+    ("Analytics", "Interactive and Powered By Analytics", 12000, 1.9, 0.90, 0.66, 900, 0.75),
+    ("Analytics", "Applied Analytics", 2500, 1.5, 2.40, 1.11, 2600, 1.10),
+    ("Analytics", "Lakehouse Analytics", 150, 16.0, 3.10, 0.33, 3900, 0.39),
+    ("Data Engineering", "Transformation", 55000, 2.0, 1.50, 0.60, 2100, 0.68),
+    ("Data Engineering", "Ingestion", 30000, 2.2, 0.70, 0.50, 800, 0.55),
+    ("Data Engineering", "Interoperable Storage", 300, 5.9, 1.90, 0.91, 2500, 0.74),
+    ("AI/ML", None, 700, 4.5, 4.20, 0.64, 5200, 0.39),
+    ("OLTP", None, 1300, 5.4, 0.25, 0.54, 60, 0.50),
+    ("Apps & Collaboration", None, 2600, 2.7, 0.95, 0.59, 1100, 0.58),
+    ("Platform", None, 300, 2.9, 0.60, 0.70, 700, 0.85),
+]
+RECURRENT_SHARE = 0.85  # Fraction of each feature's jobs flagged is_recurrent
+
+# Account mix: share of accounts per (snowflake_account_type, agreement_type)
+ACCOUNT_TYPES = [
+    ("Internal", "Internal", 0.10),
+    ("Customer", "Trial", 0.08),         # Converts to Capacity part-way through
+    ("Customer", "Partner Access", 0.05),
+    ("Customer", "On Demand", 0.22),
+    ("Customer", "Capacity", 0.55),
+]
+DEPLOYMENTS = ["aws_us_west_2", "aws_us_east_1", "azure_westeurope", "gcp_us_central1"]
+
+
+# =============================================================================
+# CONNECTION BACKENDS
+# =============================================================================
+
+class SQLBackend:
+    """
+    Base backend over a DB-API connection.
+
+    Queries are rendered in Snowflake syntax (as documented in skill.md);
+    subclasses translate them to their own dialect.
+    """
+    name = "sql"
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def translate(self, sql: str) -> str:
+        return sql
+
+    def query(self, sql: str) -> tuple:
+        """Run one query; returns (column names, rows)."""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(self.translate(sql))
+            columns = [column[0] for column in cursor.description]
+            return columns, cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def describe(self) -> str:
+        return self.name
+
+    def source_key(self):
+        """Stable id of the data behind this backend (aggregate store key), or None if ephemeral."""
+        return None
+
+    def clone(self):
+        """A backend safe to use from another thread (default: this one)."""
+        return self
+
+    def close(self):
+        self.connection.close()
+
+    def materialize(self, name: str, sql: str):
+        """
+        Store a query's result as a new table `name`, visible to every clone.
+        An existing table of that name is an error, never replaced.
+
+        Returns its row count, or None when the backend cannot share a
+        table between its connections (callers then inline the query).
+        """
+        return None
+
+    def drop(self, name: str):
+        """Drop a table created by materialize() (no-op by default)."""
+
+
+class SnowflakeBackend(SQLBackend):
+    """snowscience tables on Snowhouse."""
+    name = "Snowflake"
+
+    def __init__(self, connection=None, **connect_kwargs):
+        if connection is None:
+            import snowflake.connector  # Only needed when actually querying
+            connection = snowflake.connector.connect(**connect_kwargs)
+        super().__init__(connection)
+        self.connect_kwargs = connect_kwargs
+        self.connection_name = connect_kwargs.get("connection_name", "default")
+
+    def clone(self):
+        # Without connect kwargs the connection is shared; the connector is thread-safe
+        return SnowflakeBackend(**self.connect_kwargs) if self.connect_kwargs else self
+
+    def source_key(self):
+        return f"snowflake-{self.connection_name}"
+
+    def materialize(self, name: str, sql: str):
+        # Transient (not temporary) so every pooled session sees it; no Time Travel or
+        # Fail-safe storage. Created in the connection's current schema, dropped by drop()
+        self.query(f"CREATE TRANSIENT TABLE {name} DATA_RETENTION_TIME_IN_DAYS = 0 AS\n{sql}")
+        return self.query(f"SELECT COUNT(*) FROM {name}")[1][0][0]
+
+    def drop(self, name: str):
+        self.query(f"DROP TABLE IF EXISTS {name}")
+
+
+class DuckDBBackend(SQLBackend):
+    """Local DuckDB database holding the three source tables (unqualified names)."""
+    name = "DuckDB"
+
+    def __init__(self, connection=None, database: str = ":memory:"):
+        if connection is None:
+            import duckdb  # Only needed for local runs
+            connection = duckdb.connect(database)
+        super().__init__(connection)
+        self.database = database
+        self.fixture = None
+
+    def translate(self, sql: str) -> str:
+        return to_duckdb(sql)
+
+    def describe(self) -> str:
+        if self.fixture:
+            return f"DuckDB synthetic fixture ({self.fixture['accounts']} accounts, seed {self.fixture['seed']})"
+        return f"DuckDB ({self.database})"
+
+    def source_key(self):
+        if self.fixture:
+            return f"fixture-a{self.fixture['accounts']}-s{self.fixture['seed']}"
+        if self.database != ":memory:":
+            return f"duckdb-{Path(self.database).stem}"
+        return None
+
+    def clone(self):
+        backend = DuckDBBackend(connection=self.connection.cursor(), database=self.database)
+        backend.fixture = self.fixture
+        return backend
+
+    def materialize(self, name: str, sql: str):
+        # A regular table: DuckDB temp tables are private to one cursor
+        self.connection.execute(f"CREATE TABLE {name} AS {self.translate(sql)}")
+        return self.connection.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+
+    def drop(self, name: str):
+        self.connection.execute(f"DROP TABLE IF EXISTS {name}")
+
+
+class TransientError(RuntimeError):
+    """Injected failure from SimulatedWarehouse (safe to retry)."""
+
+
+class SimulatedWarehouse:
+    """
+    A backend wrapper standing in for a remote warehouse: each query waits
+    `latency` seconds (a network/queueing round trip that does not hold the
+    GIL) and fails with TransientError with probability `failure_rate`.
+    Failures are drawn from a seeded generator shared by all clones.
+    """
+
+    def __init__(self, backend, latency: float = 0.2, failure_rate: float = 0.0, seed: int = 7, _shared=None):
+        self.backend = backend
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._shared = _shared or {"random": random.Random(seed), "lock": threading.Lock()}
+
+    def _round_trip(self):
+        with self._shared["lock"]:
+            fail = self._shared["random"].random() < self.failure_rate
+        time.sleep(self.latency)
+        if fail:
+            raise TransientError("simulated transient warehouse error")
+
+    def query(self, sql: str) -> tuple:
+        self._round_trip()
+        return self.backend.query(sql)
+
+    def materialize(self, name: str, sql: str):
+        self._round_trip()
+        return self.backend.materialize(name, sql)
+
+    def drop(self, name: str):
+        return self.backend.drop(name)
+
+    @property
+    def fixture(self):
+        return getattr(self.backend, "fixture", None)
+
+    def describe(self) -> str:
+        return self.backend.describe()
+
+    def source_key(self):
+        return self.backend.source_key()
+
+    def close(self):
+        self.backend.close()
+
+    def clone(self):
+        return SimulatedWarehouse(self.backend.clone(), self.latency, self.failure_rate, _shared=self._shared)
+
+
+# =============================================================================
+# SYNTHETIC FIXTURE
+# =============================================================================
+
+def _feature_rows() -> list:
+    """One row per feature x recurrence, with its feature_vector JSON before/after RECURRENT_FROM."""
+    rows = []
+    for feature_id, (category, use_case, jobs, growth, cr_1k, cr_factor, ms, ms_factor) in enumerate(FEATURES):
+        for recurrent in (True, False):
+            vector = {"Product Category": category}
+            if use_case:
+                vector[category] = {"use_case": use_case}
+            share = RECURRENT_SHARE if recurrent else 1 - RECURRENT_SHARE
+            rows.append((
+                feature_id * 2 + (0 if recurrent else 1),
+                json.dumps(vector),
+                json.dumps({**vector, "is_recurrent": "true" if recurrent else "false"}),
+                jobs * share, growth, cr_1k, cr_factor, ms, ms_factor,
+            ))
+    return rows
+
+
+def create_fixture(connection, accounts: int = 60, seed: int = 7,
+                   start: date = FIXTURE_START, end: date = FIXTURE_END) -> dict:
+    """
+    Create and fill the three source tables in a DuckDB connection.
+
+    Each account uses each feature on about 70% of days, so the rollup has
+    roughly accounts x days x 17 rows. Volumes grow, and Cr/1K and avg ms
+    move, month over month according to FEATURES. Returns the table row counts.
+    """
+    # Deterministic [0, 1) noise from an integer key: no RNG state, so the
+    # data does not depend on thread count or row order
+    connection.execute(f"""
+        CREATE OR REPLACE MACRO yir_noise(key) AS
+            ((((key) + {seed} * 7919) % 2147483648) * 1103515245 + 12345) % 2147483648 / 2147483648.0
+    """)
+    connection.execute(
+        "CREATE OR REPLACE TABLE yir_features (feature_id INTEGER, fv_before VARCHAR, fv_after VARCHAR, "
+        "jobs DOUBLE, growth DOUBLE, cr_1k DOUBLE, cr_factor DOUBLE, ms DOUBLE, ms_factor DOUBLE)"
+    )
+    connection.executemany("INSERT INTO yir_features VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", _feature_rows())
+
+    cases, lower = [], 0.0
+    for account_type, agreement, share in ACCOUNT_TYPES:
+        cases.append(f"WHEN bucket < {lower + share:.4f} THEN ['{account_type}', '{agreement}']")
+        lower += share
+    deployments = "[" + ", ".join(f"'{d}'" for d in DEPLOYMENTS) + "]"
+    connection.execute(f"""
+        CREATE OR REPLACE TABLE yir_accounts AS
+        SELECT account_id,
+               {deployments}[1 + account_id % {len(DEPLOYMENTS)}] AS deployment,
+               0.2 + 3.0 * yir_noise(account_id * 31) ^ 2 AS weight,
+               CASE {' '.join(cases)} ELSE ['Customer', 'Capacity'] END AS kind,
+               CAST(yir_noise(account_id * 37) * 400 AS INTEGER) AS convert_day
+        FROM (SELECT range AS account_id, yir_noise(range * 17) AS bucket FROM range(1, {accounts + 1}))
+    """)
+    connection.execute(f"""
+        CREATE OR REPLACE TABLE yir_days AS
+        SELECT CAST(d AS DATE) AS ds,
+               datediff('day', DATE '{start}', d) AS day_index,
+               datediff('month', DATE '{start}', d) / 12.0 AS years
+        FROM range(DATE '{start}', DATE '{end}', INTERVAL 1 DAY) t(d)
+    """)
+
+    connection.execute("""
+        CREATE OR REPLACE TABLE dim_accounts_history AS
+        SELECT a.deployment AS snowflake_deployment,
+               a.account_id AS snowflake_account_id,
+               d.ds AS general_date,
+               a.kind[1] AS snowflake_account_type,
+               CASE WHEN a.kind[2] = 'Trial' AND d.day_index >= a.convert_day THEN 'Capacity'
+                    ELSE a.kind[2] END AS agreement_type
+        FROM yir_accounts a CROSS JOIN yir_days d
+    """)
+    connection.execute(f"""
+        CREATE OR REPLACE TABLE job_feature_daily_account_rollup AS
+        WITH grid AS (
+            SELECT d.ds, d.years, a.deployment, a.account_id, a.weight, f.*,
+                   (a.account_id * 100003 + d.day_index * 101 + f.feature_id) AS key
+            FROM yir_accounts a CROSS JOIN yir_days d CROSS JOIN yir_features f
+        ),
+        sized AS (
+            SELECT *, round(jobs * weight * growth ^ years * (0.8 + 0.4 * yir_noise(key * 3))) AS n
+            FROM grid
+            WHERE yir_noise(key) < 0.7
+        )
+        SELECT ds, deployment, account_id,
+               CASE WHEN ds >= DATE '{RECURRENT_FROM}' THEN fv_after ELSE fv_before END AS feature_vector,
+               CAST(n AS BIGINT) AS jobs,
+               n / 1000.0 * cr_1k * cr_factor ^ years * (0.9 + 0.2 * yir_noise(key * 5)) AS total_credits,
+               CAST(round(n * ms * ms_factor ^ years * (0.9 + 0.2 * yir_noise(key * 7))) AS BIGINT) AS dur_xp_executing
+        FROM sized
+        WHERE n > 0
+    """)
+    connection.execute("""
+        CREATE OR REPLACE TABLE spi_tracker_index AS
+        SELECT ds, -45.0 - 14.0 * years + 2.0 * (yir_noise(day_index * 11) - 0.5) AS month_index_xp
+        FROM yir_days
+    """)
+    for table in ("yir_features", "yir_accounts", "yir_days"):
+        connection.execute(f"DROP TABLE {table}")
+
+    return {
+        table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("job_feature_daily_account_rollup", "dim_accounts_history", "spi_tracker_index")
+    }
+
+
+def fixture_backend(accounts: int = 60, seed: int = 7, database: str = ":memory:") -> DuckDBBackend:
+    """A DuckDBBackend with a freshly generated fixture."""
+    backend = DuckDBBackend(database=database)
+    counts = create_fixture(backend.connection, accounts=accounts, seed=seed)
+    backend.fixture = {"accounts": accounts, "seed": seed, "rows": counts}
+    return backend
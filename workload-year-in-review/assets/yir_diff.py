@@ -0,0 +1,438 @@
+"""
+Workload Year-in-Review - Cross-Run Diff
+
+Loads any set of result runs, aligns them by level, recurring, scope and
+metric, and flags cells whose value moved beyond a tolerance between runs
+of the same data source, period and account filter (e.g. the three
+Feb 2025 → Jan 2026 external-paid runs in results/). Runs over the synthetic
+fixture and over Snowhouse are never compared with each other.
+
+A run is read from its Parquet level files when it has them (yir_results)
+and from its markdown otherwise: current and legacy pipe tables, the
+box-drawing tables and the transposed Level 1 layout, with values such as
+"98.1B", "+127.1%", "1,516 ms" or "**2.27x** cheaper". A printed value is
+only as exact as its rounding ("+127%" is anything from 126.5 to 127.5), so
+differences within the two cells' rounding are not reported.
+
+Runs are read one at a time in run-name (date) order; each cell is diffed
+against the previous run of its (source, filter, period) group that has
+it, or the first with --against first. Only that baseline per group is
+kept in memory, so any number of archived runs can be streamed through;
+findings are printed as they are found.
+
+Usage:
+    # Every run in results/, each against the previous run of its group
+    uv run python assets/yir_diff.py
+
+    uv run python assets/yir_diff.py results/2026-01-16_* results/2026-02-12_* --rel-tol 0.005
+    uv run python assets/yir_diff.py /archive/results --against first --json > drift.jsonl
+
+Exits 1 when any cell moved or a scope was added or removed (usable as a
+regression check).
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from yir_results import CONTEXT_COLUMNS, RESULTS_DIR, arrow_available, read_manifest
+from yir_sql import FILTERS, LEVELS, RECURRING_START, parse_month
+
+_RUN_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_([a-z]{3}\d{2})-([a-z]{3}\d{2})_(.+)$")
+_PERIOD_RE = re.compile(r"^\*\*Period:\*\*\s*(\w+ \d{4})\s*→\s*(\w+ \d{4})")
+_NUMBER_RE = re.compile(r"^([+-]?)(\d[\d,]*)(?:\.(\d+))?\s*([KMB](?![a-z]))?")
+_SCALES = {None: 1, "K": 1e3, "M": 1e6, "B": 1e9}
+# Source of folders without a manifest: they predate the runner and came from Snowhouse
+LEGACY_SOURCE = "Snowflake"
+_MONTH_ABBREVIATIONS = {datetime(2000, m, 1).strftime("%b").lower() for m in range(1, 13)}
+
+# Header (lowercase, no bold) -> metric, for the columns that are not per period
+METRIC_HEADERS = {
+    "growth": "growth", "growth %": "growth", "jobs growth": "growth", "jobs growth %": "growth",
+    "jobs x": "jobs_x",
+    "credits δ": "credits_delta", "credits δ %": "credits_delta", "cr/1k δ %": "credits_delta",
+    "credits x": "credits_x", "cr/1k x": "credits_x",
+    "exec δ": "exec_delta", "exec δ %": "exec_delta",
+    "speed x": "speed_x",
+    "jobs/credit x": "jobs_credit_x",
+    "point δ": "point_delta", "% improvement": "pct_improvement",
+}
+# "<month> <base>" headers (Feb Jobs, Jan 2026 Cr/1K) -> metric prefix, suffixed 1 / 2 by period
+PERIOD_HEADERS = {"jobs": "jobs", "credits": "credits", "cr/1k": "cr1k", "avg ms": "ms", "ms": "ms"}
+# Transposed Level 1 tables (row label, column header) -> metric
+TRANSPOSED_ROWS = {"jobs": "jobs", "credits": "credits", "cr/1k jobs": "cr1k", "cr/1k": "cr1k",
+                   "avg ms": "ms", "jobs/credit": "jobs_credit"}
+TRANSPOSED_HEADERS = {
+    ("jobs", "growth %"): "growth", ("jobs", "jobs x"): "jobs_x",
+    ("cr1k", "δ %"): "credits_delta", ("cr1k", "x"): "credits_x",
+    ("ms", "δ %"): "exec_delta", ("ms", "x"): "speed_x",
+    ("jobs_credit", "x"): "jobs_credit_x",
+}
+
+
+@dataclass(frozen=True)
+class Run:
+    name: str
+    path: Path
+    account_filter: str
+    start: object  # date
+    end: object  # date
+    source: str = LEGACY_SOURCE  # manifest "backend", e.g. "DuckDB synthetic fixture (60 accounts, seed 7)"
+
+    @property
+    def group(self) -> str:
+        return f"{self.source}: {self.account_filter} {self.start:%b %Y} → {self.end:%b %Y}"
+
+
+# =============================================================================
+# VALUES
+# =============================================================================
+
+def parse_value(text: str):
+    """
+    Printed cell -> (value, resolution), or None for "-" / text.
+
+    The resolution is half a unit of the last printed digit: "1.149" is
+    (1.149, 0.0005), "98.1B" is (98.1e9, 0.05e9).
+    """
+    match = _NUMBER_RE.match(text.replace("**", "").replace("−", "-").strip())
+    if not match:
+        return None
+    sign, whole, fraction, unit = match.groups()
+    scale = _SCALES[unit]
+    value = float(whole.replace(",", "") + ("." + fraction if fraction else "")) * scale
+    return (-value if sign == "-" else value), 0.5 * 10.0 ** -len(fraction or "") * scale
+
+
+def moved(a: tuple, b: tuple, rel_tol: float, abs_tol: float) -> bool:
+    """Whether b differs from a by more than both cells' rounding plus the tolerance."""
+    (value_a, resolution_a), (value_b, resolution_b) = a, b
+    slack = resolution_a + resolution_b + max(abs_tol, rel_tol * max(abs(value_a), abs(value_b)))
+    return abs(value_b - value_a) > slack
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+def _fixed_scope(level: str):
+    """The single row's scope of Level 1 and SPI (labelled differently across runs), else None."""
+    spec = LEVELS[level]
+    if spec.get("spi"):
+        return spec["title"]
+    return "All Snowflake" if spec["group"] == "total" else None
+
+
+def _tables(text: str):
+    """Each markdown pipe or box-drawing table as (header, rows) of stripped cells."""
+    table = []
+    for line in text.splitlines() + [""]:
+        line = line.strip()
+        if line.startswith(("┌", "├", "└")) or re.fullmatch(r"\|[\s:|-]+\|", line):
+            continue
+        if line.startswith(("|", "│")):
+            table.append([cell.strip() for cell in re.split(r"[|│]", line)[1:-1]])
+        elif table:
+            yield table[0], table[1:]
+            table = []
+
+
+def _side(label: str, start, end, order: dict, base: str):
+    """1 / 2 for a month header label ("Feb", "Jan 2026"), by the file's period or column order."""
+    try:
+        month = parse_month(label)
+    except ValueError:
+        month = None
+    if month in (start, end):
+        return 1 if month == start else 2
+    abbreviation = label[:3]
+    if month is None and abbreviation in _MONTH_ABBREVIATIONS and f"{start:%b}" != f"{end:%b}":
+        if abbreviation in (f"{start:%b}".lower(), f"{end:%b}".lower()):
+            return 1 if abbreviation == f"{start:%b}".lower() else 2
+    order[base] = order.get(base, 0) + 1
+    return order[base] if order[base] <= 2 else None
+
+
+def _header_metric(header: str, level: str, start, end, order: dict):
+    """Metric for one column header, or None."""
+    if header in METRIC_HEADERS:
+        return METRIC_HEADERS[header]
+    if LEVELS[level].get("spi") and header[:3] in _MONTH_ABBREVIATIONS:
+        side = _side(header, start, end, order, "index")
+        return f"index{side}" if side else None
+    label, _, base = header.rpartition(" ")
+    if base == "ms" and label.endswith(" avg"):
+        label, base = label[:-4], "avg ms"
+    if base in PERIOD_HEADERS:
+        if label[:3] in _MONTH_ABBREVIATIONS:
+            side = _side(label, start, end, order, base)
+            return f"{PERIOD_HEADERS[base]}{side}" if side else None
+    return None
+
+
+def _table_cells(header: list, rows: list, level: str, start, end):
+    """(scope, metric, (value, resolution)) of one table."""
+    header = [cell.replace("*", "").strip().lower() for cell in header]
+    fixed = _fixed_scope(level)
+    if header[0] == "":
+        # Transposed Level 1: one row per measure, months and comparisons as columns
+        if LEVELS[level].get("group") != "total":
+            return
+        for row in rows:
+            base = TRANSPOSED_ROWS.get(row[0].replace("*", "").strip().lower())
+            order = {}
+            for title, cell in zip(header[1:], row[1:]):
+                metric = TRANSPOSED_HEADERS.get((base, title))
+                if metric is None and base in PERIOD_HEADERS.values() and title[:3] in _MONTH_ABBREVIATIONS:
+                    side = _side(title, start, end, order, base)
+                    metric = f"{base}{side}" if side else None
+                value = parse_value(cell)
+                if metric and value:
+                    yield fixed, metric, value
+        return
+
+    order = {}
+    metrics = [_header_metric(title, level, start, end, order) for title in header]
+    has_scope = metrics[0] is None
+    if not has_scope and fixed is None:
+        return
+    if has_scope:
+        metrics[0] = None
+    if not any(metrics):
+        return
+    for row in rows:
+        scope = fixed if fixed or not has_scope else row[0].replace("*", "").strip()
+        if scope == "(none)":
+            scope = None
+        for metric, cell in zip(metrics, row):
+            value = parse_value(cell) if metric else None
+            if value:
+                yield scope, metric, value
+
+
+def markdown_cells(text: str, level: str, start, end) -> dict:
+    """{(scope, metric): (value, resolution)} of one level's markdown (its SQL block is skipped)."""
+    text = text.split("## SQL Query")[0]
+    for line in text.splitlines():
+        match = _PERIOD_RE.match(line.strip())
+        if match:
+            start, end = parse_month(match.group(1)), parse_month(match.group(2))
+            break
+    cells = {}
+    for header, rows in _tables(text):
+        for scope, metric, value in _table_cells(header, rows, level, start, end):
+            cells.setdefault((scope, metric), value)
+    return cells
+
+
+def parquet_cells(path, level: str) -> dict:
+    """{(scope, metric): (value, 0.0)} of one level's Parquet file (raw values, no rounding)."""
+    import pyarrow.parquet as pq  # Only needed for Parquet results
+
+    table = pq.read_table(path, memory_map=True)
+    fixed = _fixed_scope(level)
+    metrics = [name for name in table.column_names if name not in CONTEXT_COLUMNS]
+    cells = {}
+    for row in table.to_pylist():
+        scope = fixed or row["scope"]
+        for metric in metrics:
+            if row[metric] is not None:
+                cells[scope, metric] = (float(row[metric]), 0.0)
+    return cells
+
+
+def read_run(run: Run) -> dict:
+    """{(level, recurring, scope, metric): (value, resolution)} of every level file in a run."""
+    parquet = arrow_available()
+    cells = {}
+    for recurring, folder in ((False, run.path), (True, run.path / "recurring")):
+        if not folder.is_dir():
+            continue
+        start = max(run.start, RECURRING_START) if recurring else run.start
+        for level in LEVELS:
+            if parquet and (folder / f"{level}.parquet").exists():
+                level_cells = parquet_cells(folder / f"{level}.parquet", level)
+            elif (folder / f"{level}.md").exists():
+                level_cells = markdown_cells((folder / f"{level}.md").read_text(encoding="utf-8"),
+                                             level, start, run.end)
+            else:
+                continue
+            for (scope, metric), value in level_cells.items():
+                cells[level, recurring, scope, metric] = value
+    return cells
+
+
+# =============================================================================
+# RUNS
+# =============================================================================
+
+def as_run(path):
+    """Run for a results folder, or None (trend runs, unrecognized folders)."""
+    path = Path(path)
+    manifest = read_manifest(path) if path.is_dir() else None
+    if manifest and "months" in manifest:
+        return None  # Trend run: one series, not a two-month comparison
+    if manifest and {"filter", "start_month", "end_month"} <= manifest.keys():
+        return Run(path.name, path, manifest["filter"], parse_month(manifest["start_month"]),
+                   parse_month(manifest["end_month"]), manifest.get("backend", LEGACY_SOURCE))
+    match = _RUN_RE.match(path.name)
+    if not match or not path.is_dir():
+        return None
+    _, start, end, rest = match.groups()
+    # "external-paid-v2" is a second run of external-paid
+    account_filter = next((key for key in FILTERS if rest == key or rest.startswith(key + "-")), rest)
+    return Run(path.name, path, account_filter,
+               datetime.strptime(start, "%b%y").date(), datetime.strptime(end, "%b%y").date())
+
+
+def discover_runs(paths: list) -> list:
+    """Runs for run folders or results directories holding them, ordered by run name (date first)."""
+    runs = {}
+    for path in map(Path, paths):
+        run = as_run(path)
+        candidates = [run] if run else [as_run(child) for child in sorted(path.iterdir()) if child.is_dir()]
+        for run in filter(None, candidates):
+            runs[run.path.resolve()] = run
+    return sorted(runs.values(), key=lambda run: (run.name, str(run.path)))
+
+
+def _scope_changes(baseline: dict, cells: dict):
+    """(change, level, recurring, scope, baseline run) for scopes added to / removed from a level both sides have."""
+    before, after = {}, {key[:3] for key in cells}
+    for key, (base, _) in baseline.items():
+        before.setdefault(key[:3], base)
+    levels_before, levels_after = {key[:2] for key in before}, {key[:2] for key in after}
+    for scope in sorted(after - before.keys(), key=str):
+        if scope[:2] in levels_before:
+            yield ("added", *scope, None)
+    for scope in sorted(before.keys() - after, key=str):
+        if scope[:2] in levels_after:
+            yield ("removed", *scope, before[scope])
+
+
+def diff_runs(runs, against: str = "previous", rel_tol: float = 0.01, abs_tol: float = 0.0, stats: dict = None):
+    """
+    Yield one finding per moved cell or added / removed scope, reading one run at a time.
+
+    Within a (source, filter, period) group each cell is compared with its value in
+    the latest earlier run that has it (or the first, against="first"), so
+    a run without recurring levels does not hide drift in the next one.
+    Only that baseline (run name and value per cell) is held per group.
+    `stats` (when given) is updated with runs / comparisons / compared /
+    unmatched (cells on one side only) / flagged / scopes counts.
+    """
+    stats = stats if stats is not None else {}
+    for key in ("runs", "comparisons", "compared", "unmatched", "flagged", "scopes"):
+        stats.setdefault(key, 0)
+    baselines = {}
+    for run in runs:
+        cells = read_run(run)
+        stats["runs"] += 1
+        baseline = baselines.get(run.group)
+        if baseline is None:
+            baselines[run.group] = {key: (run.name, value) for key, value in cells.items()}
+            continue
+        stats["comparisons"] += 1
+        stats["unmatched"] += len(cells.keys() ^ baseline.keys())
+        for key in sorted(cells.keys() & baseline.keys(), key=str):
+            stats["compared"] += 1
+            base, value = baseline[key]
+            if not moved(value, cells[key], rel_tol, abs_tol):
+                continue
+            stats["flagged"] += 1
+            level, recurring, scope, metric = key
+            before, after = value[0], cells[key][0]
+            yield {
+                "group": run.group,
+                "baseline": base,
+                "run": run.name,
+                "change": "moved",
+                "level": level,
+                "recurring": recurring,
+                "scope": scope,
+                "metric": metric,
+                "baseline_value": before,
+                "value": after,
+                "delta": after - before,
+                "delta_pct": (after - before) * 100.0 / abs(before) if before else None,
+            }
+        removed = set()
+        for change, level, recurring, scope, base in _scope_changes(baseline, cells):
+            stats["scopes"] += 1
+            if change == "removed":
+                removed.add((level, recurring, scope))
+            yield {
+                "group": run.group,
+                "baseline": base,
+                "run": run.name,
+                "change": change,
+                "level": level,
+                "recurring": recurring,
+                "scope": scope,
+            }
+        if against == "previous":
+            for key in [key for key in baseline if key[:3] in removed]:
+                del baseline[key]
+        for key, value in cells.items():
+            if against == "previous" or key not in baseline:
+                baseline[key] = (run.name, value)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def format_finding(finding: dict) -> str:
+    level = ("recurring/" if finding["recurring"] else "") + finding["level"]
+    scope = finding["scope"] if finding["scope"] is not None else "(none)"
+    if finding["change"] == "added":
+        return f"  {level:<44} {scope:<36} scope added"
+    if finding["change"] == "removed":
+        return f"  {level:<44} {scope:<36} scope removed (last in {finding['baseline']})"
+    pct = "" if finding["delta_pct"] is None else f" ({finding['delta_pct']:+.1f}%)"
+    return (f"  {level:<44} {scope:<36} {finding['metric']:<15} "
+            f"{finding['baseline_value']:>14,.4g} → {finding['value']:<14,.4g}{pct:<10} vs {finding['baseline']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flag result cells that moved between runs of the same period.")
+    parser.add_argument("paths", nargs="*", default=[str(RESULTS_DIR)],
+                        help="run folders or results directories (default: results/)")
+    parser.add_argument("--against", default="previous", choices=["previous", "first"],
+                        help="compare each cell with the previous run of its group that has it, or the first")
+    parser.add_argument("--rel-tol", type=float, default=0.01, help="relative tolerance beyond rounding (default 0.01)")
+    parser.add_argument("--abs-tol", type=float, default=0.0, help="absolute tolerance beyond rounding")
+    parser.add_argument("--json", action="store_true", help="one JSON finding per line")
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not Path(path).is_dir():
+            parser.error(f"not a directory: {path}")
+    runs = discover_runs(args.paths)
+    stats = {}
+    current = None
+    for finding in diff_runs(runs, args.against, args.rel_tol, args.abs_tol, stats):
+        if args.json:
+            print(json.dumps(finding, ensure_ascii=False))
+            continue
+        if current != finding["run"]:
+            current = finding["run"]
+            print(f"\n{finding['run']} ({finding['group']})")
+        print(format_finding(finding))
+
+    summary = (f"{stats['runs']} runs, {stats['comparisons']} comparisons, {stats['compared']:,} cells compared, "
+               f"{stats['unmatched']:,} without a counterpart")
+    output = sys.stderr if args.json else sys.stdout
+    if stats["flagged"] or stats["scopes"]:
+        print(f"\n❌ {stats['flagged']:,} cells moved beyond tolerance, {stats['scopes']} scopes added or removed; "
+              f"{summary}", file=output)
+        raise SystemExit(1)
+    print(f"\n✅ No cells moved beyond tolerance and no scope changes; {summary}", file=output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Workload Year-in-Review - Vectorized Metrics
+
+Column-wise versions of the skill.md Improvement Formulas and X
+multipliers: Growth %, Jobs X, Cr/1K, Credits Δ %, Credits X, Avg ms,
+Exec Δ %, Speed X, Jobs/Credit X and the SPI Point Δ / % Improvement.
+
+Every metric is computed for whole arrays of scopes and period pairs at
+once, with the level queries' semantics: x / NULLIF(y, 0) is NaN where y is
+0 or missing, NaN propagates like NULL, and ROUND() rounds half away from
+zero. Values are identical to the scalar yir_cube.derive(); NULL is NaN.
+
+Usage:
+    from yir_metrics import compare_pairs, cube_arrays
+
+    arrays = cube_arrays(cube)                     # every scope x month in the cube
+    table = compare_pairs(arrays, [(0, 11), (0, 12), (11, 12)])
+    table["jobs_credit_x"]                         # shape (scopes, pairs)
+
+Requires numpy:
+    uv sync --extra columnar
+"""
+
+import numpy as np
+
+from yir_sql import parse_month
+
+# Derived metric names, in yir_cube.derive() order
+METRICS = (
+    "jobs1", "jobs2", "growth", "jobs_x", "credits1", "credits2", "cr1k1", "cr1k2",
+    "credits_delta", "credits_x", "ms1", "ms2", "exec_delta", "speed_x", "jobs_credit_x",
+)
+
+
+# =============================================================================
+# SQL SEMANTICS
+# =============================================================================
+
+def sql_round(values, digits: int = 0) -> np.ndarray:
+    """ROUND() over an array: half away from zero, NaN stays NaN."""
+    scaled = np.asarray(values, dtype=float) * 10.0 ** digits
+    whole = np.floor(np.abs(scaled))
+    whole += (np.abs(scaled) - whole) >= 0.5
+    return np.copysign(whole, scaled) / 10.0 ** digits
+
+
+def nullif_zero(values) -> np.ndarray:
+    """NULLIF(values, 0) with NaN as NULL."""
+    values = np.asarray(values, dtype=float)
+    return np.where(values == 0, np.nan, values)
+
+
+def _div(numerator, denominator) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(numerator, dtype=float) / nullif_zero(denominator)
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def derive_columns(jobs1, credits1, dur1, jobs2, credits2, dur2) -> dict:
+    """
+    Every level metric for arrays of (jobs, credits, dur_ms) sums.
+
+    Inputs broadcast against each other (NaN = scope missing in that
+    month); returns {metric: array} keyed by METRICS.
+    """
+    jobs1, credits1, dur1, jobs2, credits2, dur2 = (
+        np.asarray(values, dtype=float) for values in (jobs1, credits1, dur1, jobs2, credits2, dur2)
+    )
+    cr1k1, cr1k2 = _div(credits1 * 1000, jobs1), _div(credits2 * 1000, jobs2)
+    ms1, ms2 = _div(dur1, jobs1), _div(dur2, jobs2)
+    jobs_x = _div(jobs2, jobs1)
+    credits_x = _div(cr1k1, cr1k2)
+    return {
+        "jobs1": jobs1,
+        "jobs2": jobs2,
+        "growth": sql_round(_div((jobs2 - jobs1) * 100.0, jobs1), 1),
+        "jobs_x": sql_round(jobs_x, 2),
+        "credits1": sql_round(credits1, 0),
+        "credits2": sql_round(credits2, 0),
+        "cr1k1": sql_round(cr1k1, 4),
+        "cr1k2": sql_round(cr1k2, 4),
+        "credits_delta": sql_round(_div(cr1k1 - cr1k2, cr1k1) * 100, 1),
+        "credits_x": sql_round(credits_x, 2),
+        "ms1": sql_round(ms1, 0),
+        "ms2": sql_round(ms2, 0),
+        "exec_delta": sql_round(_div(ms1 - ms2, ms1) * 100, 1),
+        "speed_x": sql_round(_div(ms1, ms2), 2),
+        "jobs_credit_x": sql_round(jobs_x * credits_x, 2),
+    }
+
+
+def spi_columns(index1, index2) -> dict:
+    """SPI Execution Index columns: both months, Point Δ and % Improvement."""
+    index1, index2 = np.asarray(index1, dtype=float), np.asarray(index2, dtype=float)
+    point = np.abs(index2) - np.abs(index1)
+    return {
+        "index1": sql_round(index1, 1),
+        "index2": sql_round(index2, 1),
+        "point_delta": sql_round(point, 1),
+        "pct_improvement": sql_round(_div(point, np.abs(index1)) * 100, 0),
+    }
+
+
+# =============================================================================
+# CUBE ARRAYS
+# =============================================================================
+
+def cube_arrays(cube: dict) -> dict:
+    """
+    Pivot cube sums into dense (scope x month) arrays.
+
+    Scopes are the cube keys without the month: (grouping_id,
+    product_category, use_case, is_recurrent). Missing cells are NaN.
+    Returns {"scopes", "months", "jobs", "credits", "dur_ms"}.
+    """
+    scopes = sorted({key[:1] + key[2:] for key in cube["sums"]},
+                    key=lambda s: (s[0], s[1] or "", s[2] or "", s[3] is True))
+    months = sorted({key[1] for key in cube["sums"]})
+    scope_index = {scope: i for i, scope in enumerate(scopes)}
+    month_index = {month: i for i, month in enumerate(months)}
+
+    values = np.full((3, len(scopes), len(months)), np.nan)
+    for (gid, month, category, use_case, recurrent), sums in cube["sums"].items():
+        cell = (slice(None), scope_index[(gid, category, use_case, recurrent)], month_index[month])
+        values[cell] = [np.nan if value is None else value for value in sums]
+    return {
+        "scopes": scopes,
+        "months": [parse_month(month) for month in months],
+        "jobs": values[0],
+        "credits": values[1],
+        "dur_ms": values[2],
+    }
+
+
+def compare_pairs(arrays: dict, pairs) -> dict:
+    """
+    Metrics for every scope and every (baseline, comparison) month-index pair.
+
+    `pairs` is a sequence of (i, j) indexes into arrays["months"]; each
+    returned metric has shape (scopes, pairs).
+    """
+    pairs = np.asarray(pairs, dtype=int).reshape(-1, 2)
+    first, second = pairs[:, 0], pairs[:, 1]
+    return derive_columns(
+        arrays["jobs"][:, first], arrays["credits"][:, first], arrays["dur_ms"][:, first],
+        arrays["jobs"][:, second], arrays["credits"][:, second], arrays["dur_ms"][:, second],
+    )
+
+
+def all_pairs(month_count: int) -> np.ndarray:
+    """Every (earlier, later) month-index pair."""
+    first, second = np.triu_indices(month_count, k=1)
+    return np.column_stack([first, second])
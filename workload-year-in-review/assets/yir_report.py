@@ -0,0 +1,212 @@
+"""
+Workload Year-in-Review - Markdown Results
+
+Formats one level's query result as a results/ markdown file in the
+existing layout: title, period/filter/run-date metadata, results table,
+key observations, and the full SQL that produced it.
+
+Values use the same human formatting as the hand-written results:
+"98.1B" / "621M" jobs, "+127.1%" deltas, "1,516 ms", Cr/1K to 4 decimals.
+"""
+
+import math
+
+from yir_sql import FILTERS, LEVELS
+
+# Columns shown per level ({p1}/{p2} are the month labels); the remaining
+# query columns (raw credits, Credits X, ...) are left out of the table
+DISPLAY_COLUMNS = {
+    "level1_all_snowflake": [
+        "{p1} Jobs", "{p2} Jobs", "Jobs Growth %", "{p1} Cr/1K", "{p2} Cr/1K", "Credits Δ %",
+        "{p1} Avg ms", "{p2} Avg ms", "Exec Δ %", "Jobs/Credit X",
+    ],
+    "level2_product_category": [
+        "{p1} Jobs", "{p2} Jobs", "Growth %", "{p1} Cr/1K", "{p2} Cr/1K", "Credits Δ %",
+        "Exec Δ %", "Speed X", "Jobs/Credit X",
+    ],
+    "level3a_analytics_use_case": [
+        "{p1} Jobs", "{p2} Jobs", "Growth %", "Credits Δ %", "Exec Δ %", "Speed X", "Jobs/Credit X",
+    ],
+    "level3b_data_engineering_use_case": [
+        "{p1} Jobs", "{p2} Jobs", "Growth %", "Credits Δ %", "Exec Δ %", "Speed X", "Jobs/Credit X",
+    ],
+    "spi_execution_index": ["{p1}", "{p2}", "Point Δ", "% Improvement"],
+}
+
+SPI_NOTES = [
+    "Baseline = 0",
+    "More negative = faster (improvement)",
+    "Point Δ positive = improved (index got more negative/faster)",
+]
+
+
+# =============================================================================
+# VALUE FORMATTING
+# =============================================================================
+
+def _missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def format_count(value) -> str:
+    """98.1B, 621M, 12K: billions to one decimal, smaller units whole."""
+    if _missing(value):
+        return "-"
+    value = float(value)
+    if abs(value) >= 1e9:
+        return f"{value / 1e9:.1f}B"
+    if abs(value) >= 1e6:
+        return f"{value / 1e6:.0f}M"
+    if abs(value) >= 1e3:
+        return f"{value / 1e3:.0f}K"
+    return f"{value:.0f}"
+
+
+def format_pct(value, decimals: int = 1) -> str:
+    """+127.1%, -10.8%, +1,547%."""
+    if _missing(value):
+        return "-"
+    return f"{float(value):+,.{decimals}f}%"
+
+
+def format_ms(value) -> str:
+    return "-" if _missing(value) else f"{float(value):,.0f} ms"
+
+
+def format_x(value) -> str:
+    return "-" if _missing(value) else f"{float(value):.2f}x"
+
+
+def format_value(column: str, value) -> str:
+    """Format one cell by its column name."""
+    if column.endswith("Jobs") or column.endswith("Credits"):
+        return format_count(value)
+    if column == "Growth %" or column == "% Improvement":
+        return format_pct(value, 0)
+    if column.endswith("%"):
+        return format_pct(value)
+    if column.endswith(" X"):
+        return format_x(value)
+    if column.endswith("Cr/1K"):
+        return "-" if _missing(value) else f"{float(value):.4f}"
+    if column.endswith(" ms"):
+        return format_ms(value)
+    if column == "Point Δ":
+        return "-" if _missing(value) else f"{float(value):+.1f}"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return "-" if _missing(value) else f"{float(value):.1f}"
+    return "-" if value is None else str(value)
+
+
+# =============================================================================
+# TABLES & OBSERVATIONS
+# =============================================================================
+
+def display_columns(level: str, variables: dict) -> list:
+    labels = {"p1": variables["start_month_label"], "p2": variables["end_month_label"]}
+    return [column.format(**labels) for column in DISPLAY_COLUMNS[level]]
+
+
+def results_table(level: str, columns: list, rows: list, variables: dict) -> str:
+    """Markdown table of the display columns; the top Jobs/Credit X value is bolded."""
+    shown = [c for c in display_columns(level, variables) if c in columns]
+    index = {column: i for i, column in enumerate(columns)}
+    best = None
+    if len(rows) > 1 and "Jobs/Credit X" in index:
+        values = [row[index["Jobs/Credit X"]] for row in rows if not _missing(row[index["Jobs/Credit X"]])]
+        best = max(values, default=None)
+
+    header = [LEVELS[level]["scope"]] + shown
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join("-" * (len(h) + 2) for h in header) + "|",
+    ]
+    for row in rows:
+        name = row[0] if row[0] is not None else "(none)"
+        cells = [f"**{name}**" if len(rows) == 1 else str(name)]
+        for column in shown:
+            value = row[index[column]]
+            cell = format_value(column, value)
+            if column == "Jobs/Credit X" and best is not None and value == best:
+                cell = f"**{cell}**"
+            cells.append(cell)
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def _leader(rows: list, index: dict, column: str):
+    ranked = [row for row in rows if column in index and not _missing(row[index[column]])]
+    if not ranked:
+        return None
+    return max(ranked, key=lambda row: float(row[index[column]]))
+
+
+def observations(level: str, columns: list, rows: list) -> list:
+    """Key observation bullets derived from the result rows."""
+    index = {column: i for i, column in enumerate(columns)}
+    if not rows:
+        return ["No rows returned for this period and filter"]
+
+    if LEVELS[level].get("spi"):
+        row = rows[0]
+        point, pct = row[index["Point Δ"]], row[index["% Improvement"]]
+        if _missing(point):
+            return ["SPI index missing for one of the months"]
+        verdict = "improved" if point > 0 else "regressed" if point < 0 else "unchanged"
+        return [f"Execution index {verdict} by **{format_value('Point Δ', point)}** points "
+                f"({format_value('% Improvement', pct)})"] + SPI_NOTES
+
+    growth = "Jobs Growth %" if "Jobs Growth %" in index else "Growth %"
+    if len(rows) == 1:
+        row = rows[0]
+        return [
+            f"Jobs grew **{format_value(growth, row[index[growth]])}** "
+            f"({format_x(row[index['Jobs X']])})",
+            f"Credits per 1K jobs improved **{format_pct(row[index['Credits Δ %']])}** "
+            f"({format_x(row[index['Credits X']])} cheaper)",
+            f"Average execution time improved **{format_pct(row[index['Exec Δ %']])}** "
+            f"({format_x(row[index['Speed X']])} faster)",
+            f"Jobs per credit: **{format_x(row[index['Jobs/Credit X']])}**",
+        ]
+
+    bullets = []
+    for label, column in (("Fastest growth", growth), ("Best credit efficiency", "Credits Δ %"),
+                          ("Best execution improvement", "Exec Δ %"), ("Best Jobs/Credit X", "Jobs/Credit X")):
+        row = _leader(rows, index, column)
+        if row is not None:
+            bullets.append(f"**{label}:** {row[0]} ({format_value(column, row[index[column]])})")
+    regressions = [
+        row[0] for row in rows
+        if any(not _missing(row[index[c]]) and row[index[c]] < 0 for c in ("Credits Δ %", "Exec Δ %"))
+    ]
+    if regressions:
+        bullets.append(f"**Regression:** {', '.join(map(str, regressions))} got less efficient or slower")
+    else:
+        bullets.append("**All scopes improved** on both credits per job and execution time")
+    return bullets
+
+
+# =============================================================================
+# DOCUMENT
+# =============================================================================
+
+def level_markdown(level: str, columns: list, rows: list, sql: str, variables: dict,
+                   account_filter: str, recurring: bool, run_date: str, source: str = None) -> str:
+    """The full results/<run>/<level>.md document."""
+    spec, filter_spec = LEVELS[level], FILTERS[account_filter]
+    title = spec["title"] if spec.get("spi") else f"{spec['title']} ({filter_spec['label']})"
+    if recurring:
+        title = "Recurring " + title
+    meta = [f"**Period:** {variables['start_month_label']} → {variables['end_month_label']}"]
+    if not spec.get("spi"):
+        meta.append(f"**Filter:** {filter_spec['recurring_description' if recurring else 'description']}")
+    meta.append(f"**Run Date:** {run_date}")
+    if source:
+        meta.append(f"**Source:** {source}")
+
+    lines = [f"# {title}", "", "  \n".join(meta), "", "## Results", "",
+             results_table(level, columns, rows, variables), "",
+             "## Key Observations", ""]
+    lines += [f"- {bullet}" for bullet in observations(level, columns, rows)]
+    lines += ["", "## SQL Query", "", "```sql", sql.rstrip(), "```", ""]
+    return "\n".join(lines)
@@ -0,0 +1,221 @@
+"""
+Workload Year-in-Review - Machine-Readable Results
+
+Next to each level's markdown, a run writes <level>.parquet: one row per
+scope with the raw query values (jobs as int64, every other metric as
+float64, NULL for missing) under stable metric names (jobs1, cr1k2,
+jobs_credit_x, ...; see yir_cube.LEVEL_COLUMNS), plus the run context
+(run, run_date, level, recurring, filter, start_month, end_month) so each
+file is self-describing. The run folder's manifest.json lists periods,
+filter, per-level SQL hashes, row counts and timings.
+
+Comparing runs is then a scan over every results/*/**.parquet file with
+pyarrow.dataset (memory-mapped, only the requested columns are read)
+instead of parsing markdown.
+
+Usage:
+    # Jobs/Credit X of every run, level and scope
+    uv run --extra arrow python assets/yir_results.py --metric jobs_credit_x
+
+    from yir_results import scan
+    table = scan(columns=["run", "scope", "jobs_credit_x"], level="level2_product_category")
+
+Requires pyarrow:
+    uv sync --extra arrow
+"""
+
+import argparse
+import hashlib
+import json
+from datetime import date
+from pathlib import Path
+
+from yir_cube import LEVEL_COLUMNS
+from yir_sql import LEVELS
+
+RESULTS_DIR = Path(__file__).resolve().parent.parent / "results"
+MANIFEST = "manifest.json"
+MANIFEST_FORMAT = 1
+
+SPI_METRICS = ["index1", "index2", "point_delta", "pct_improvement"]  # yir_metrics.spi_columns() names
+INTEGER_METRICS = {"jobs1", "jobs2"}
+CONTEXT_COLUMNS = ["run", "run_date", "level", "recurring", "filter", "start_month", "end_month", "scope"]
+
+
+# =============================================================================
+# SCHEMA
+# =============================================================================
+
+def sql_hash(sql: str) -> str:
+    """Short hash of a query's text (manifest / Parquet metadata)."""
+    return hashlib.sha256(sql.encode()).hexdigest()[:16]
+
+
+def metric_names(level: str) -> list:
+    """Stable names of a level's value columns, in query column order (after the scope)."""
+    spec = LEVELS[level]
+    if spec.get("spi"):
+        return list(SPI_METRICS)
+    return [key for _, key in LEVEL_COLUMNS[spec["group"]][1:]]
+
+
+def _schema(metrics: list):
+    import pyarrow as pa  # Only needed for Parquet results
+    types = [pa.string(), pa.date32(), pa.string(), pa.bool_(), pa.string(), pa.date32(), pa.date32(), pa.string()]
+    fields = list(zip(CONTEXT_COLUMNS, types))
+    fields += [(metric, pa.int64() if metric in INTEGER_METRICS else pa.float64()) for metric in metrics]
+    return pa.schema(fields)
+
+
+def dataset_schema():
+    """Superset schema of every level's file (columns a level lacks read as NULL)."""
+    metrics = []
+    for level in LEVELS:
+        metrics += [metric for metric in metric_names(level) if metric not in metrics]
+    return _schema(metrics)
+
+
+def arrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+def _typed(value, integer: bool):
+    """Driver value (Decimal, numpy, float) -> int / float; None and NaN stay NULL."""
+    if value is None:
+        return None
+    value = float(value)
+    if value != value:
+        return None
+    return int(value) if integer else value
+
+
+def write_level_table(path, level: str, columns: list, rows: list, run: str, run_date: str,
+                      account_filter: str, recurring: bool, start, end, sql: str) -> int:
+    """
+    Write one level's (columns, rows) as Parquet; returns the row count.
+
+    Values are matched to metric_names() by position (the level queries'
+    column order). The query's own column names and SQL hash are kept in
+    the schema metadata.
+    """
+    import pyarrow as pa  # Only needed for Parquet results
+    import pyarrow.parquet as pq
+
+    metrics = metric_names(level)
+    if len(columns) != len(metrics) + 1:
+        raise ValueError(f"{level}: expected {len(metrics) + 1} columns, got {len(columns)}")
+    context = {
+        "run": run,
+        "run_date": date.fromisoformat(run_date),
+        "level": level,
+        "recurring": recurring,
+        "filter": account_filter,
+        "start_month": start,
+        "end_month": end,
+    }
+    data = {name: [value] * len(rows) for name, value in context.items()}
+    data["scope"] = [None if row[0] is None else str(row[0]) for row in rows]
+    for i, metric in enumerate(metrics, start=1):
+        data[metric] = [_typed(row[i], metric in INTEGER_METRICS) for row in rows]
+
+    schema = _schema(metrics).with_metadata({
+        "yir.columns": json.dumps(list(columns), ensure_ascii=False),
+        "yir.sql_sha256": sql_hash(sql),
+    })
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    pq.write_table(pa.Table.from_pydict(data, schema=schema), tmp)
+    tmp.replace(path)
+    return len(rows)
+
+
+def write_manifest(run_dir, summary: dict):
+    """Write the run summary (periods, filter, SQL hashes, rows, timings) as manifest.json."""
+    run_dir = Path(run_dir)
+    payload = {"format": MANIFEST_FORMAT, "run": run_dir.name, **summary}
+    tmp = run_dir / f"{MANIFEST}.tmp"
+    tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp.replace(run_dir / MANIFEST)
+
+
+def read_manifest(run_dir):
+    """A run folder's manifest.json, or None (legacy folders have none)."""
+    path = Path(run_dir) / MANIFEST
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+
+
+# =============================================================================
+# SCANNING
+# =============================================================================
+
+def parquet_files(results_dir=RESULTS_DIR) -> list:
+    """Every level Parquet file under results_dir (recurring/ included), in run order."""
+    return sorted(str(path) for path in Path(results_dir).glob("**/*.parquet"))
+
+
+def scan(results_dir=RESULTS_DIR, columns: list = None, level: str = None, recurring: bool = None,
+         account_filter: str = None, runs: list = None):
+    """
+    One Arrow table over every run's level files, read memory-mapped.
+
+    Only `columns` are read (default: all); level / recurring / filter /
+    runs are pushed down as row filters.
+    """
+    import pyarrow.dataset as ds  # Only needed for Parquet results
+    from pyarrow import fs
+
+    dataset = ds.dataset(parquet_files(results_dir), schema=dataset_schema(), format="parquet",
+                         filesystem=fs.LocalFileSystem(use_mmap=True))
+    conditions = []
+    if level is not None:
+        conditions.append(ds.field("level") == level)
+    if recurring is not None:
+        conditions.append(ds.field("recurring") == recurring)
+    if account_filter is not None:
+        conditions.append(ds.field("filter") == account_filter)
+    if runs is not None:
+        conditions.append(ds.field("run").isin(list(runs)))
+    condition = None
+    for item in conditions:
+        condition = item if condition is None else condition & item
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare one metric across every results/ run with Parquet files.")
+    parser.add_argument("--results-dir", default=str(RESULTS_DIR))
+    parser.add_argument("--metric", default="jobs_credit_x", help="metric column, e.g. jobs_credit_x, cr1k2, growth")
+    parser.add_argument("--level", default=None, choices=sorted(LEVELS))
+    parser.add_argument("--filter", default=None, help="account filter (default: all)")
+    parser.add_argument("--recurring", action=argparse.BooleanOptionalAction, default=None,
+                        help="only recurring levels (--no-recurring: only all-query levels; default: both)")
+    args = parser.parse_args(argv)
+
+    if args.metric not in dataset_schema().names:
+        parser.error(f"unknown metric '{args.metric}'")
+    table = scan(args.results_dir, ["run", "level", "recurring", "scope", "start_month", "end_month", args.metric],
+                 args.level, args.recurring, args.filter)
+    rows = sorted((row for row in table.to_pylist() if args.metric in metric_names(row["level"])),
+                  key=lambda row: (row["recurring"], row["level"], str(row["scope"]), row["run"]))
+    print(f"{'Run':<44} {'Level':<44} {'Scope':<36} {args.metric:>14}")
+    for row in rows:
+        level = f"recurring/{row['level']}" if row["recurring"] else row["level"]
+        value = "-" if row[args.metric] is None else f"{row[args.metric]:,.4g}"
+        print(f"{row['run']:<44} {level:<44} {str(row['scope']):<36} {value:>14}")
+    print(f"{len(rows)} rows from {len({row['run'] for row in rows})} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+"""
+Workload Year-in-Review - Runner
+
+Renders the skill.md queries for a start and end month, runs them on a
+backend, and writes results/<run date>_<period>_<filter>/ in the documented
+layout, with a recurring/ subfolder unless --no-recurring. Runs on the
+synthetic fixture go to results-fixture/ instead, so offline runs never
+overwrite or mix with real runs. Next to each level's markdown goes
+<level>.parquet with the raw values (when pyarrow is installed;
+--no-parquet skips it, see yir_results.py). Every level is timed; periods,
+SQL hashes, row counts and timings are printed and saved as manifest.json
+in the run folder.
+
+Queries are independent, so they run concurrently (--jobs, one pooled
+connection each) with per-query retries and exponential backoff
+(--retries, --backoff). After a failed run, --resume reruns only the
+levels that have no result file yet. The summary compares wall-clock time
+with the serial baseline (the sum of every query's own time).
+
+By default the rollup is scanned once: the single-scan cube query (saved as
+cube.sql) feeds Levels 1-3b and their recurring variants, and only the SPI
+index is queried separately. --per-level runs each level's own query
+instead. Result files show each level's own SQL either way; the numbers
+are the same.
+
+Cube aggregates of closed months are kept in the aggregate store
+(.yir_cache/, see yir_store.py), so a rerun or a new end month only scans
+the months not stored yet. --refresh re-fetches them; --no-cache skips it.
+
+The account filter is applied through the eligible-accounts index (see
+skill.md): built once per run as run-length intervals per account and
+joined instead of the daily dim_accounts_history rows. It is materialized
+for the run under its own name (a TRANSIENT table on Snowflake, a table in
+the DuckDB database) and dropped when the run ends; backends that cannot share a
+table between connections get it inlined as a CTE. --daily-join keeps
+the documented join.
+
+--trend writes a monthly time series instead of the two-month comparison:
+every month from --start to --end, month over month and against --anchor
+(default: --start), derived from one cube load (see yir_trend.py).
+
+Usage:
+    # Offline: synthetic DuckDB fixture (reproducible for a given seed/size)
+    uv run --extra local python assets/yir_run.py --start 2025-02 --end 2026-01
+
+    # Snowhouse
+    uv run --extra snowflake python assets/yir_run.py --start 2025-02 --end 2026-01 \\
+        --backend snowflake --connection-name snowhouse
+
+    # With Parquet results for cross-run comparison (yir_results.py)
+    uv run --extra local --extra arrow python assets/yir_run.py --start 2025-02 --end 2026-01
+
+    # Local DuckDB file that already holds the three tables
+    uv run --extra local python assets/yir_run.py --start "Feb 2025" --end "Jan 2026" \\
+        --backend duckdb --database yir.duckdb
+
+    # Monthly trend: every month Jan 2025 - Feb 2026, MoM and vs Jan 2025
+    uv run --extra local --extra columnar python assets/yir_run.py --start 2025-01 --end 2026-02 --trend
+
+    # Scheduler test: per-level queries, 0.5s simulated round trips, 20% failures
+    uv run --extra local python assets/yir_run.py --start 2025-02 --end 2026-01 --per-level \\
+        --jobs 8 --simulate-latency 0.5 --simulate-failures 0.2 --backoff 0.1
+"""
+
+import argparse
+import time
+from datetime import date
+from pathlib import Path
+
+from yir_cube import level_result
+from yir_data import DuckDBBackend, SimulatedWarehouse, SnowflakeBackend, fixture_backend
+from yir_report import level_markdown
+from yir_results import arrow_available, read_manifest, sql_hash, write_level_table, write_manifest
+from yir_schedule import ConnectionPool, Task, run_task, schedule
+from yir_sql import (
+    ACCOUNT_INDEX_TABLE, FILTERS, LEVELS, RECURRING_START, build_index_query, build_queries, index_table_name,
+    load_templates, parse_month, period_slug, template_vars,
+)
+from yir_store import DEFAULT_CACHE_DIR, AggregateStore, load_cube
+
+RESULTS_DIR = Path(__file__).resolve().parent.parent / "results"
+# Synthetic-fixture runs: same folder names as real runs, fake numbers
+FIXTURE_RESULTS_DIR = Path(__file__).resolve().parent.parent / "results-fixture"
+
+
+# =============================================================================
+# RUNNING
+# =============================================================================
+
+def default_results_dir(backend) -> Path:
+    """results/ for real data, results-fixture/ for the synthetic fixture."""
+    return FIXTURE_RESULTS_DIR if getattr(backend, "fixture", None) else RESULTS_DIR
+
+
+def run_dir_name(run_date: str, start, end, account_filter: str) -> str:
+    """'2026-02-12_feb25-jan26_external-paid'."""
+    return f"{run_date}_{period_slug(start, end)}_{account_filter}"
+
+
+def _write_atomic(path: Path, text: str):
+    """Write via a temp file so an interrupted run never leaves a partial result (resume trusts files)."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+def level_tasks(start, end, out_dir, account_filter: str = "external-paid", recurring: bool = False,
+                run_date: str = None, templates: dict = None, cube: dict = None, spi_only: bool = False,
+                rollup_only: bool = False, account_index: str = None, run_name: str = None,
+                parquet: bool = False, index_table: str = ACCOUNT_INDEX_TABLE) -> list:
+    """
+    One scheduler Task per level for one period pair, each writing its markdown
+    file (and with parquet=True its Parquet table, tagged with `run_name`).
+
+    With `cube` (a dict that receives the load_cube() result as cube["value"]),
+    rollup levels are derived from it instead of querying; spi_only /
+    rollup_only restrict the task list to one kind of level. `account_index`
+    and `index_table` (the run's materialized index) are passed to
+    build_queries(); result files show the self-contained (inline) form of
+    a query that reads the materialized index.
+    """
+    run_date = run_date or date.today().isoformat()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    variables = template_vars(start, end)
+    queries = build_queries(start, end, account_filter, recurring, templates, account_index, index_table)
+    shown = queries
+    if account_index == "table":
+        shown = build_queries(start, end, account_filter, recurring, templates, "inline")
+
+    tasks = []
+    for level, sql in queries.items():
+        spi = bool(LEVELS[level].get("spi"))
+        if (spi_only and not spi) or (rollup_only and spi):
+            continue
+        path = out_dir / f"{level}.md"
+        name = f"recurring/{level}" if recurring else level
+
+        def run_level(backend, level=level, sql=sql, path=path, spi=spi, name=name):
+            if cube is not None and not spi:
+                if "value" not in cube:
+                    raise RuntimeError("cube query failed; nothing to derive from")
+                columns, rows = level_result(cube["value"], level, start, end, recurring)
+                source = f"{backend.describe()}, single-scan cube (cube.sql)"
+            else:
+                columns, rows = backend.query(sql)
+                source = backend.describe()
+            result = {"rows": len(rows), "markdown": f"{name}.md", "parquet": None,
+                      "sql_sha256": sql_hash(shown[level])}
+            if parquet:
+                # Before the markdown: resume treats a level with markdown as complete
+                write_level_table(path.with_suffix(".parquet"), level, columns, rows, run_name or out_dir.name,
+                                  run_date, account_filter, recurring, parse_month(start), parse_month(end),
+                                  shown[level])
+                result["parquet"] = f"{name}.parquet"
+            _write_atomic(path, level_markdown(level, columns, rows, shown[level], variables, account_filter,
+                                               recurring, run_date, source))
+            return result
+
+        tasks.append(Task(name, run_level, output=path))
+    return tasks
+
+
+def build_account_index(pool: ConnectionPool, table: str, start, end, account_filter: str = "external-paid",
+                        retries: int = 2, backoff: float = 1.0) -> tuple:
+    """
+    Materialize the eligible-accounts index for months `start`..`end` once,
+    as table `table` (a per-run index_table_name()).
+
+    Returns (account index mode, task result): "table" when the backend
+    stored it, "inline" when it cannot (or building it failed), in which
+    case every query carries it as a CTE.
+    """
+    variables = template_vars(start, end)
+    index_sql = build_index_query(variables["start_date"], variables["end_date"], account_filter)
+
+    def build_index(backend):
+        return {"rows": backend.materialize(table, index_sql)}
+
+    result = run_task(Task("account_index", build_index), pool, retries, backoff)
+    return ("table" if result.get("rows") is not None else "inline"), result
+
+
+def drop_account_index(pool: ConnectionPool, table: str, retries: int = 2, backoff: float = 1.0) -> dict:
+    """Drop the run's materialized index so it does not outlive the run (never raises)."""
+    def drop_index(backend):
+        backend.drop(table)
+
+    return run_task(Task("drop_account_index", drop_index), pool, retries, backoff)
+
+
+def run(backend, start, end, results_dir=None, account_filter: str = "external-paid",
+        include_recurring: bool = True, run_date: str = None, single_scan: bool = True,
+        store: AggregateStore = None, refresh: bool = False, concurrency: int = 4,
+        retries: int = 2, backoff: float = 1.0, resume: bool = False, pool: ConnectionPool = None,
+        account_index: bool = True, parquet: bool = True) -> dict:
+    """
+    Full year-in-review run: all levels, then the recurring variants.
+
+    Recurring levels start at Mar 2025 at the earliest (is_recurrent is not
+    populated before then). With a store, the cube only scans months it
+    does not hold yet.
+
+    Queries run concurrently through yir_schedule (at most `concurrency`
+    connections, `retries` retries with exponential `backoff`); with
+    resume=True, levels whose markdown already exists are skipped. In
+    single-scan mode the cube and SPI queries run in parallel, then the
+    rollup levels are derived from the cube.
+
+    With account_index=True the eligible-accounts index is built first,
+    once, and every rollup query joins its intervals (materialized where
+    the backend supports it, inlined otherwise); if building it fails, the
+    queries inline it. A materialized index is dropped when the queries
+    finish.
+
+    With parquet=True (and pyarrow installed) every level also writes its
+    Parquet table. `results_dir` defaults to default_results_dir(backend).
+    Returns the run summary, saved as manifest.json.
+    """
+    started = time.perf_counter()
+    run_date = run_date or date.today().isoformat()
+    start, end = parse_month(start), parse_month(end)
+    results_dir = results_dir or default_results_dir(backend)
+    run_dir = Path(results_dir) / run_dir_name(run_date, start, end, account_filter)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    templates = load_templates()
+    recurring_start = max(start, RECURRING_START)
+    include_recurring = include_recurring and recurring_start < end
+    parquet = parquet and arrow_available()
+    own_pool = pool is None  # Its clones are closed when the run ends; a passed-in pool is the caller's
+    pool = pool or ConnectionPool(backend.clone, concurrency, initial=[backend])
+    periods = [(start, run_dir, False)]
+    if include_recurring:
+        periods.append((recurring_start, run_dir / "recurring", True))
+
+    index_table = index_table_name()
+    index_mode, index_result = (build_account_index(pool, index_table, start, end, account_filter, retries, backoff)
+                                if account_index else (None, None))
+
+    def tasks_for(**kwargs):
+        return [
+            task for period_start, out_dir, recurring in periods
+            for task in level_tasks(period_start, end, out_dir, account_filter, recurring, run_date, templates,
+                                    account_index=index_mode, run_name=run_dir.name, parquet=parquet,
+                                    index_table=index_table, **kwargs)
+        ]
+
+    cube = None
+    try:
+        if single_scan:
+            cube = {}
+            derived = tasks_for(cube=cube, rollup_only=True)
+            queries = tasks_for(spi_only=True)
+            if not (resume and all(Path(task.output).exists() for task in derived)):
+                months = [start, end] + ([recurring_start] if include_recurring else [])
+
+                def fetch(backend):
+                    cube["value"] = load_cube(backend, months, account_filter, store, refresh, index_mode,
+                                              index_table)
+                    _write_atomic(run_dir / "cube.sql", cube["value"]["sql"])
+                    return {"fetched": cube["value"]["fetched"], "cached": cube["value"]["cached"],
+                            "sql_sha256": sql_hash(cube["value"]["sql"])}
+
+                queries.insert(0, Task("cube", fetch))
+            phases = [schedule(queries, pool, concurrency, retries, backoff, resume),
+                      schedule(derived, pool, 1, 0, backoff, resume)]
+        else:
+            phases = [schedule(tasks_for(), pool, concurrency, retries, backoff, resume)]
+    finally:
+        if index_mode == "table":
+            drop_account_index(pool, index_table, retries, backoff)
+        if own_pool:
+            pool.close()
+
+    results = [result for phase in phases for result in phase["tasks"]]
+    cube_result = next((result for result in results if result["name"] == "cube"), None)
+    # Skipped (resumed) levels keep their files' row counts and hashes from the previous manifest
+    previous = {level["name"]: level for level in (read_manifest(run_dir) or {}).get("levels", [])} if resume else {}
+    levels = [
+        {**previous.get(result["name"], {}), **result} if result["status"] == "skipped" else result
+        for result in results if result["name"] != "cube"
+    ]
+    wall = time.perf_counter() - started
+    index_sec = index_result["sec"] if index_result else 0.0
+    serial = sum(phase["serial_sec"] for phase in phases) + index_sec
+    summary = {
+        "run_dir": str(run_dir),
+        "backend": backend.describe(),
+        "start_month": start.isoformat(),
+        "end_month": end.isoformat(),
+        "periods": [
+            {"start_month": period_start.isoformat(), "end_month": end.isoformat(), "recurring": recurring}
+            for period_start, _, recurring in periods
+        ],
+        "filter": account_filter,
+        "run_date": run_date,
+        "single_scan": single_scan,
+        "parquet": parquet,
+        "concurrency": concurrency,
+        "account_index": index_mode,
+        "index_sec": index_sec,
+        "index_rows": index_result.get("rows") if index_result else None,
+        "cube_sec": cube_result["sec"] if cube_result else 0.0,
+        "cube_sql_sha256": cube_result.get("sql_sha256") if cube_result else None,
+        "fetched_months": cube["value"]["fetched"] if cube and "value" in cube else [],
+        "cached_months": cube["value"]["cached"] if cube and "value" in cube else [],
+        "levels": levels,
+        "skipped": sum(phase["skipped"] for phase in phases),
+        "failed": [failure for phase in phases for failure in phase["failed"]],
+        "serial_sec": round(serial, 4),
+        "wall_sec": round(wall, 4),
+        "speedup": round(serial / wall, 2) if wall and serial else None,
+    }
+    write_manifest(run_dir, summary)
+    return summary
+
+
+# =============================================================================
+# TIME SERIES
+# =============================================================================
+
+def run_trend(backend, start, end, results_dir=None, account_filter: str = "external-paid",
+              include_recurring: bool = True, run_date: str = None, anchor=None,
+              store: AggregateStore = None, refresh: bool = False, retries: int = 2, backoff: float = 1.0,
+              account_index: bool = True, pool: ConnectionPool = None) -> dict:
+    """
+    Monthly trend run: every month from `start` to `end` for every rollup level.
+
+    One cube load covers all months (through the store, so stored months
+    are not scanned again); yir_trend derives the month-over-month and
+    vs-anchor series and writes results/<run date>_trend_<period>_<filter>/.
+    Returns the run summary (run() layout), saved as manifest.json.
+    """
+    from yir_trend import month_range, time_series, trend_markdown  # Needs numpy (--extra columnar)
+
+    started = time.perf_counter()
+    run_date = run_date or date.today().isoformat()
+    start, end = parse_month(start), parse_month(end)
+    anchor = parse_month(anchor) if anchor else start
+    months = month_range(start, end)
+    if anchor not in months:
+        raise ValueError(f"Anchor month {anchor:%b %Y} is outside {start:%b %Y} - {end:%b %Y}")
+    results_dir = results_dir or default_results_dir(backend)
+    run_dir = Path(results_dir) / f"{run_date}_trend_{period_slug(start, end)}_{account_filter}"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    own_pool = pool is None  # Its clones are closed when the run ends; a passed-in pool is the caller's
+    pool = pool or ConnectionPool(backend.clone, 1, initial=[backend])
+    periods = [(months, run_dir, False)]
+    recurring_months = [month for month in months if month >= RECURRING_START]
+    if include_recurring and len(recurring_months) > 1:
+        periods.append((recurring_months, run_dir / "recurring", True))
+
+    index_table = index_table_name()
+    index_mode, index_result = (build_account_index(pool, index_table, start, end, account_filter, retries, backoff)
+                                if account_index else (None, None))
+    cube = {}
+
+    def fetch(backend):
+        cube["value"] = load_cube(backend, months, account_filter, store, refresh, index_mode, index_table)
+        _write_atomic(run_dir / "cube.sql", cube["value"]["sql"])
+        return {"fetched": cube["value"]["fetched"], "cached": cube["value"]["cached"]}
+
+    try:
+        cube_result = run_task(Task("cube", fetch), pool, retries, backoff)
+    finally:
+        if index_mode == "table":
+            drop_account_index(pool, index_table, retries, backoff)
+        if own_pool:
+            pool.close()
+    levels, failed = [], [cube_result] if cube_result["status"] == "failed" else []
+    if "value" in cube:
+        source = f"{backend.describe()}, single-scan cube (cube.sql)"
+        for period_months, out_dir, recurring in periods:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            for level, spec in LEVELS.items():
+                if spec.get("spi"):
+                    continue
+                level_started = time.perf_counter()
+                series = time_series(cube["value"], level, period_months, recurring, max(anchor, period_months[0]))
+                path = out_dir / f"{level}.md"
+                _write_atomic(path, trend_markdown(level, series, cube["value"]["sql"], account_filter,
+                                                   recurring, run_date, source))
+                levels.append({"name": f"recurring/{level}" if recurring else level, "status": "done",
+                               "attempts": 1, "sec": round(time.perf_counter() - level_started, 4),
+                               "rows": len(series["scopes"]), "markdown": str(path.relative_to(run_dir))})
+
+    index_sec = index_result["sec"] if index_result else 0.0
+    wall = time.perf_counter() - started
+    serial = index_sec + cube_result["sec"] + sum(level["sec"] for level in levels)
+    summary = {
+        "run_dir": str(run_dir),
+        "backend": backend.describe(),
+        "start_month": start.isoformat(),
+        "end_month": end.isoformat(),
+        "anchor_month": anchor.isoformat(),
+        "months": len(months),
+        "periods": [
+            {"start_month": period_months[0].isoformat(), "end_month": end.isoformat(), "recurring": recurring}
+            for period_months, _, recurring in periods
+        ],
+        "filter": account_filter,
+        "run_date": run_date,
+        "single_scan": True,
+        "parquet": False,
+        "concurrency": 1,
+        "account_index": index_mode,
+        "index_sec": index_sec,
+        "index_rows": index_result.get("rows") if index_result else None,
+        "cube_sec": cube_result["sec"],
+        "cube_sql_sha256": sql_hash(cube["value"]["sql"]) if "value" in cube else None,
+        "fetched_months": cube["value"]["fetched"] if "value" in cube else [],
+        "cached_months": cube["value"]["cached"] if "value" in cube else [],
+        "levels": levels,
+        "skipped": 0,
+        "failed": failed,
+        "serial_sec": round(serial, 4),
+        "wall_sec": round(wall, 4),
+        "speedup": round(serial / wall, 2) if wall and serial else None,
+    }
+    write_manifest(run_dir, summary)
+    return summary
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def make_backend(args):
+    if args.backend == "snowflake":
+        return SnowflakeBackend(connection_name=args.connection_name)
+    if args.database:
+        return DuckDBBackend(database=args.database)
+    return fixture_backend(accounts=args.fixture_accounts, seed=args.seed)
+
+
+def print_summary(summary: dict, setup_sec: float):
+    print(f"{'Task':<44} {'Status':>8} {'Tries':>5} {'Rows':>5} {'Sec':>8}")
+    if summary["account_index"]:
+        rows = summary["index_rows"]
+        label = f"account index ({summary['account_index']}" + (f", {rows} intervals)" if rows is not None else ")")
+        print(f"{label:<44} {'':>8} {'':>5} {'':>5} {summary['index_sec']:>8.4f}")
+    if summary["single_scan"]:
+        label = f"cube ({len(summary['fetched_months'])} months scanned, {len(summary['cached_months'])} stored)"
+        print(f"{label:<44} {'':>8} {'':>5} {'':>5} {summary['cube_sec']:>8.4f}")
+    for level in summary["levels"]:
+        print(f"{level['name']:<44} {level['status']:>8} {level['attempts']:>5} "
+              f"{level.get('rows', ''):>5} {level['sec']:>8.4f}")
+    done = sum(level["status"] == "done" for level in summary["levels"])
+    print(f"{'✅' if not summary['failed'] else '❌'} {done} levels written, {summary['skipped']} skipped, "
+          f"{len(summary['failed'])} failed in {summary['wall_sec']}s wall vs {summary['serial_sec']}s serial "
+          f"({summary['speedup'] or '-'}x, {summary['concurrency']} concurrent; "
+          f"{setup_sec:.2f}s backend setup) on {summary['backend']}")
+    for failure in summary["failed"]:
+        print(f"   Failed: {failure['name']}: {failure['error']}")
+    print(f"   Output: {summary['run_dir']} (markdown{' + parquet' if summary['parquet'] else ''}, manifest.json)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the workload year-in-review levels and write results/.")
+    parser.add_argument("--start", required=True, help="baseline month (YYYY-MM or 'Feb 2025')")
+    parser.add_argument("--end", required=True, help="comparison month (YYYY-MM or 'Jan 2026')")
+    parser.add_argument("--filter", default="external-paid", choices=sorted(FILTERS), help="account filter")
+    parser.add_argument("--backend", default="duckdb", choices=["duckdb", "snowflake"])
+    parser.add_argument("--database", default=None,
+                        help="DuckDB file holding the source tables (default: generate the synthetic fixture)")
+    parser.add_argument("--connection-name", default="snowhouse", help="Snowflake connection name")
+    parser.add_argument("--fixture-accounts", type=int, default=60, help="synthetic fixture size")
+    parser.add_argument("--seed", type=int, default=7, help="synthetic fixture seed")
+    parser.add_argument("--run-date", default=None, help="date in the folder name (default: today)")
+    parser.add_argument("--results-dir", default=None,
+                        help="default: results/, or results-fixture/ for the synthetic fixture")
+    parser.add_argument("--no-recurring", action="store_true", help="skip the recurring/ variants")
+    parser.add_argument("--trend", action="store_true",
+                        help="monthly time series for every month from --start to --end (needs --extra columnar)")
+    parser.add_argument("--anchor", default=None, help="trend: month the 'vs' series compare with (default: --start)")
+    parser.add_argument("--per-level", action="store_true",
+                        help="run each level's own query instead of one cube scan")
+    parser.add_argument("--daily-join", action="store_true",
+                        help="filter accounts with the documented daily join instead of the interval index")
+    parser.add_argument("--no-parquet", action="store_true", help="write markdown only (no <level>.parquet)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="monthly aggregate store")
+    parser.add_argument("--no-cache", action="store_true", help="scan every month, store nothing")
+    parser.add_argument("--refresh", action="store_true", help="re-fetch stored months")
+    parser.add_argument("-j", "--jobs", type=int, default=4, help="concurrent queries (connection pool size)")
+    parser.add_argument("--retries", type=int, default=2, help="retries per query after a failure")
+    parser.add_argument("--backoff", type=float, default=1.0, help="first retry delay in seconds (doubles)")
+    parser.add_argument("--resume", action="store_true", help="skip levels already written in the run folder")
+    parser.add_argument("--simulate-latency", type=float, default=None,
+                        help="testing: add this many seconds of warehouse round trip per query")
+    parser.add_argument("--simulate-failures", type=float, default=0.0,
+                        help="testing: fail this fraction of queries with a transient error")
+    args = parser.parse_args(argv)
+    if args.trend and (args.per_level or args.resume):
+        parser.error("--trend derives every level from one cube; --per-level and --resume do not apply")
+
+    started = time.perf_counter()
+    backend = make_backend(args)
+    if args.simulate_latency is not None or args.simulate_failures:
+        backend = SimulatedWarehouse(backend, args.simulate_latency or 0.0, args.simulate_failures, args.seed)
+    setup_sec = time.perf_counter() - started
+    store = None if args.no_cache else AggregateStore(args.cache_dir)
+    if args.trend:
+        summary = run_trend(backend, args.start, args.end, args.results_dir, args.filter, not args.no_recurring,
+                            args.run_date, args.anchor, store, args.refresh, args.retries, args.backoff,
+                            account_index=not args.daily_join)
+    else:
+        summary = run(backend, args.start, args.end, args.results_dir, args.filter,
+                      not args.no_recurring, args.run_date, not args.per_level, store, args.refresh,
+                      args.jobs, args.retries, args.backoff, args.resume, account_index=not args.daily_join,
+                      parquet=not args.no_parquet)
+    print_summary(summary, setup_sec)
+    if summary["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Workload Year-in-Review - Query Scheduler
+
+Runs independent level tasks concurrently on a thread pool, each task
+borrowing a backend from a fixed-size connection pool:
+
+    - concurrency cap: at most `concurrency` tasks (and connections) at once
+    - retries: a failing task is retried with exponential backoff
+      (backoff, 2 x backoff, 4 x backoff, ... seconds) on a fresh
+      connection; the one its failed attempt used is discarded
+    - resume: tasks whose output file already exists are skipped, so a
+      rerun after a failure only repeats what did not finish
+    - timing: wall-clock time is reported against the serial baseline
+      (the sum of every task's own run time)
+
+One task failing does not stop the others; failures are reported in the
+summary after their last retry.
+
+Usage:
+    from yir_schedule import ConnectionPool, Task, schedule
+
+    pool = ConnectionPool(backend.clone, size=4, initial=[backend])
+    summary = schedule([Task("level1", fn, output=path), ...], pool, concurrency=4)
+    pool.close()
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class ConnectionPool:
+    """
+    Fixed-size pool of backends, created on demand by `factory`.
+
+    A task holds one backend for the duration of one attempt; when all
+    `size` backends are busy, the next task waits for one to be returned.
+    A backend whose attempt raised is discarded rather than returned (its
+    session may be dead) and closed; the factory creates a fresh one when
+    needed. close() closes the idle backends. Only backends the factory
+    created are closed: `initial` ones belong to the caller.
+    """
+
+    def __init__(self, factory: Callable, size: int = 4, initial: list = None):
+        self.factory = factory
+        self.size = max(1, size)
+        self._initial = list((initial or [])[:self.size])
+        self._idle = list(self._initial)
+        self._created = len(self._idle)
+        self._available = threading.Condition()
+
+    def _acquire(self):
+        with self._available:
+            while not self._idle and self._created >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            return self.factory()
+        except Exception:
+            self._discard()
+            raise
+
+    def _release(self, backend):
+        with self._available:
+            self._idle.append(backend)
+            self._available.notify()
+
+    def _discard(self, backend=None):
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+        if backend is not None:
+            self._close(backend)
+
+    def _close(self, backend):
+        # A clone may be the caller's backend itself (a shared connection)
+        if any(backend is owned for owned in self._initial):
+            return
+        try:
+            backend.close()
+        except Exception:
+            pass  # A dead session may fail to close; it is dropped either way
+
+    def close(self):
+        """Close every idle backend the factory created."""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._available.notify_all()
+        for backend in idle:
+            self._close(backend)
+
+    @contextmanager
+    def connection(self):
+        backend = self._acquire()
+        try:
+            yield backend
+        except BaseException:
+            self._discard(backend)
+            raise
+        self._release(backend)
+
+
+# =============================================================================
+# TASKS
+# =============================================================================
+
+@dataclass
+class Task:
+    """One schedulable unit: `run(backend)` returns a dict merged into its result."""
+    name: str
+    run: Callable
+    output: Path = None  # Resume: the task is skipped when this file exists
+
+
+def run_task(task: Task, pool: ConnectionPool, retries: int = 2, backoff: float = 1.0,
+             retry_on: tuple = (Exception,), sleep: Callable = time.sleep) -> dict:
+    """
+    Run one task with retries; never raises for errors in `retry_on`.
+
+    Returns {"name", "status": "done"|"failed", "attempts", "sec", ...};
+    "sec" is the successful attempt's run time (the serial-baseline share).
+    """
+    error = None
+    for attempt in range(retries + 1):
+        started = time.perf_counter()
+        try:
+            with pool.connection() as backend:
+                result = task.run(backend) or {}
+            return {"name": task.name, "status": "done", "attempts": attempt + 1,
+                    "sec": round(time.perf_counter() - started, 4), **result}
+        except retry_on as exc:
+            error = exc
+            if attempt < retries:
+                sleep(backoff * 2 ** attempt)
+    return {"name": task.name, "status": "failed", "attempts": retries + 1, "sec": 0.0, "error": repr(error)}
+
+
+def schedule(tasks: list, pool: ConnectionPool, concurrency: int = 4, retries: int = 2,
+             backoff: float = 1.0, resume: bool = False, retry_on: tuple = (Exception,)) -> dict:
+    """
+    Run tasks concurrently (at most `concurrency` at a time).
+
+    With resume=True, tasks whose output already exists are skipped.
+    Returns {"tasks": [result per task, in task order], "done", "skipped",
+    "failed", "wall_sec", "serial_sec", "speedup"}.
+    """
+    started = time.perf_counter()
+    results = [None] * len(tasks)
+    pending = []
+    for i, task in enumerate(tasks):
+        if resume and task.output is not None and Path(task.output).exists():
+            results[i] = {"name": task.name, "status": "skipped", "attempts": 0, "sec": 0.0}
+        else:
+            pending.append(i)
+
+    if pending:
+        workers = max(1, min(concurrency, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {i: executor.submit(run_task, tasks[i], pool, retries, backoff, retry_on) for i in pending}
+            for i, future in futures.items():
+                results[i] = future.result()
+
+    wall = time.perf_counter() - started
+    serial = sum(result["sec"] for result in results)
+    return {
+        "tasks": results,
+        "done": sum(result["status"] == "done" for result in results),
+        "skipped": sum(result["status"] == "skipped" for result in results),
+        "failed": [result for result in results if result["status"] == "failed"],
+        "wall_sec": round(wall, 4),
+        "serial_sec": round(serial, 4),
+        "speedup": round(serial / wall, 2) if wall and serial else None,
+    }
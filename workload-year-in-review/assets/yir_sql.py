@@ -0,0 +1,336 @@
+"""
+Workload Year-in-Review - SQL Templates
+
+Reads the Level 1/2/3a/3b and SPI queries straight out of skill.md (the
+documented SQL stays the single source of truth), fills in the
+`{{placeholder}}` template variables from a start and end month, and applies
+the account filter and the recurring-only filter, optionally through the
+eligible-accounts index instead of the daily account join.
+
+Usage:
+    from yir_sql import build_queries
+
+    queries = build_queries("2025-02", "2026-01")                  # {level: sql}
+    recurring = build_queries("2025-03", "2026-01", recurring=True)
+"""
+
+import re
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+
+SKILL_PATH = Path(__file__).resolve().parent.parent / "skill.md"
+
+# Level key -> skill.md heading, result title, first-column label, and the
+# cube grouping (plus category filter) the level is derived from.
+# Keys double as result file names (<key>.md).
+LEVELS = {
+    "level1_all_snowflake": {
+        "heading": "Level 1: All Snowflake",
+        "title": "Level 1: All Snowflake",
+        "scope": "Scope",
+        "group": "total",
+    },
+    "level2_product_category": {
+        "heading": "Level 2: By Product Category",
+        "title": "Level 2: By Product Category",
+        "scope": "Product Category",
+        "group": "product_category",
+    },
+    "level3a_analytics_use_case": {
+        "heading": "Level 3a: Analytics by Use Case",
+        "title": "Level 3a: Analytics by Use Case",
+        "scope": "Use Case",
+        "group": "use_case",
+        "category": "Analytics",
+    },
+    "level3b_data_engineering_use_case": {
+        "heading": "Level 3b: Data Engineering by Use Case",
+        "title": "Level 3b: Data Engineering by Use Case",
+        "scope": "Use Case",
+        "group": "use_case",
+        "category": "Data Engineering",
+    },
+    "spi_execution_index": {
+        "heading": "SPI Execution Index",
+        "title": "SPI Execution Index",
+        "scope": "Metric",
+        "spi": True,  # Separate data source: no account or recurring filter
+    },
+}
+CUBE_HEADING = "Single-Scan Cube (All Levels)"
+ACCOUNT_INDEX_HEADING = "Eligible Accounts Index"
+
+ACCOUNT_FILTER_SQL = (
+    "AND a.snowflake_account_type <> 'Internal'",
+    "AND a.agreement_type NOT IN ('Trial', 'Partner Access')",
+)
+ACCOUNT_JOIN_SQL = "JOIN snowscience.dimensions.dim_accounts_history a"
+ACCOUNT_INDEX_TABLE = "eligible_accounts"
+
+
+def index_join_sql(table: str = ACCOUNT_INDEX_TABLE) -> tuple:
+    """The join on the index intervals, reading them from `table`."""
+    return (
+        f"JOIN {table} e",
+        "  ON r.deployment = e.deployment",
+        "  AND r.account_id = e.account_id",
+        "  AND r.ds BETWEEN e.valid_from AND e.valid_to",
+    )
+
+
+ACCOUNT_INDEX_JOIN_SQL = index_join_sql()
+# How rollup queries apply the account filter: None = the documented daily
+# join, "inline" = eligible-accounts intervals as a CTE, "table" = intervals
+# materialized once per run, under a per-run name (index_table_name())
+ACCOUNT_INDEX_MODES = ("inline", "table")
+RECURRING_FILTER_SQL = "AND r.feature_vector:is_recurrent::STRING = 'true'"
+RECURRING_START = date(2025, 3, 1)  # is_recurrent is only populated from Mar 2025
+
+FILTERS = {
+    "external-paid": {
+        "label": "External Paid",
+        "description": "External accounts only (excludes Internal, Trial, Partner Access)",
+        "recurring_description": "Recurring queries only, External accounts (excludes Internal, Trial, Partner Access)",
+    },
+    "all-accounts": {
+        "label": "All Accounts",
+        "description": "All accounts (includes Internal, Trial, Partner Access)",
+        "recurring_description": "Recurring queries only, All accounts (includes Internal, Trial, Partner Access)",
+    },
+}
+
+_MONTH_FORMATS = ("%Y-%m-%d", "%Y-%m", "%b %Y", "%B %Y")
+_VARIABLE_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+# =============================================================================
+# TEMPLATES
+# =============================================================================
+
+def _sql_block(text: str, heading: str, path) -> str:
+    """The first ```sql block under a '## heading' in skill.md."""
+    match = re.search(
+        rf"^## {re.escape(heading)}\s*$.*?^```sql\n(.*?)^```",
+        text, re.MULTILINE | re.DOTALL,
+    )
+    if not match:
+        raise ValueError(f"No SQL block under '## {heading}' in {path}")
+    return match.group(1).rstrip() + "\n"
+
+
+def load_templates(path=SKILL_PATH) -> dict:
+    """Return {level: sql template} for every LEVELS heading found in skill.md."""
+    text = Path(path).read_text(encoding="utf-8")
+    return {level: _sql_block(text, spec["heading"], path) for level, spec in LEVELS.items()}
+
+
+def load_cube_template(path=SKILL_PATH) -> str:
+    """The single-scan cube query template from skill.md."""
+    return _sql_block(Path(path).read_text(encoding="utf-8"), CUBE_HEADING, path)
+
+
+def load_index_template(path=SKILL_PATH) -> str:
+    """The eligible-accounts index query template from skill.md."""
+    return _sql_block(Path(path).read_text(encoding="utf-8"), ACCOUNT_INDEX_HEADING, path)
+
+
+def render(template: str, variables: dict) -> str:
+    """Substitute {{name}} placeholders; raises KeyError for an unknown name."""
+    def substitute(match):
+        name = match.group(1)
+        if name not in variables:
+            raise KeyError(f"Template variable '{{{{{name}}}}}' has no value")
+        return str(variables[name])
+    return _VARIABLE_RE.sub(substitute, template)
+
+
+# =============================================================================
+# PERIODS
+# =============================================================================
+
+def parse_month(value) -> date:
+    """First day of the month for '2025-02', '2025-02-01', 'Feb 2025' or a date."""
+    if isinstance(value, date):
+        return value.replace(day=1)
+    for fmt in _MONTH_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date().replace(day=1)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized month: {value!r} (use YYYY-MM or 'Feb 2025')")
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_label(month: date) -> str:
+    return month.strftime("%b %Y")
+
+
+def template_vars(start, end) -> dict:
+    """The skill.md template variables for comparing month `start` with `end`."""
+    start, end = parse_month(start), parse_month(end)
+    if end <= start:
+        raise ValueError(f"End month {month_label(end)} must be after start month {month_label(start)}")
+    return {
+        "start_date": start.isoformat(),
+        "end_date": add_months(end, 1).isoformat(),
+        "start_month": start.isoformat(),
+        "end_month": end.isoformat(),
+        "start_month_label": month_label(start),
+        "end_month_label": month_label(end),
+    }
+
+
+def period_slug(start, end) -> str:
+    """'feb25-jan26', as used in results folder names."""
+    start, end = parse_month(start), parse_month(end)
+    return f"{start.strftime('%b%y').lower()}-{end.strftime('%b%y').lower()}"
+
+
+# =============================================================================
+# FILTERS
+# =============================================================================
+
+def apply_filters(sql: str, account_filter: str = "external-paid", recurring: bool = False) -> str:
+    """Adjust the template's WHERE clause for the account filter and recurrence."""
+    if account_filter not in FILTERS:
+        raise ValueError(f"Unknown filter '{account_filter}'; choose from {', '.join(FILTERS)}")
+    lines = sql.splitlines()
+    anchor = next((i for i, line in enumerate(lines) if line.strip() == ACCOUNT_FILTER_SQL[-1]), None)
+    if anchor is None:
+        return sql  # SPI: no rollup/account filter to adjust
+    indent = lines[anchor][:len(lines[anchor]) - len(lines[anchor].lstrip())]
+    if recurring:
+        lines.insert(anchor + 1, indent + RECURRING_FILTER_SQL)
+    if account_filter == "all-accounts":
+        lines = [line for line in lines if line.strip() not in ACCOUNT_FILTER_SQL]
+    return "\n".join(lines) + "\n"
+
+
+def build_index_query(start_date, end_date, account_filter: str = "external-paid", template: str = None) -> str:
+    """
+    Render the eligible-accounts index for days in [start_date, end_date).
+
+    One row per (deployment, account_id) and run of consecutive days that
+    pass the account filter: (deployment, account_id, valid_from, valid_to).
+    """
+    variables = {"start_date": str(start_date), "end_date": str(end_date)}
+    return apply_filters(render(template or load_index_template(), variables), account_filter)
+
+
+def index_table_name() -> str:
+    """
+    A fresh table name for one run's materialized index, so it never
+    replaces a user's table or another concurrent run's index.
+    """
+    return f"{ACCOUNT_INDEX_TABLE}_{uuid.uuid4().hex[:12]}"
+
+
+def use_account_index(sql: str, index_sql: str = None, table: str = ACCOUNT_INDEX_TABLE) -> str:
+    """
+    Replace the daily dim_accounts_history join with a join on the index intervals.
+
+    An account's intervals never overlap, so every rollup row matches at
+    most one of them and the join acts as a semi-join. The account filter
+    is already applied in the index, so its WHERE lines are dropped. With
+    `index_sql` the index is inlined as a CTE named ACCOUNT_INDEX_TABLE;
+    otherwise the query reads the materialized index `table`. Queries
+    without the join (SPI) are returned unchanged.
+    """
+    lines = sql.splitlines()
+    anchor = next((i for i, line in enumerate(lines) if line.strip() == ACCOUNT_JOIN_SQL), None)
+    if anchor is None:
+        return sql
+    end = anchor + 1
+    while end < len(lines) and lines[end].lstrip().startswith(("ON r.", "AND r.")):
+        end += 1
+    indent = lines[anchor][:len(lines[anchor]) - len(lines[anchor].lstrip())]
+    join = ACCOUNT_INDEX_JOIN_SQL if index_sql is not None else index_join_sql(table)
+    lines[anchor:end] = [indent + line for line in join]
+    lines = [line for line in lines if line.strip() not in ACCOUNT_FILTER_SQL]
+    sql = "\n".join(lines) + "\n"
+    if index_sql is not None:
+        if not sql.startswith("WITH "):
+            raise ValueError("Cannot inline the account index: query does not start with WITH")
+        cte = "\n".join("    " + line if line else line for line in index_sql.rstrip().splitlines())
+        sql = f"WITH {ACCOUNT_INDEX_TABLE} AS (\n{cte}\n),\n{sql[len('WITH '):]}"
+    return sql
+
+
+def _account_index(sql: str, start_date, end_date, account_filter: str, account_index: str = None,
+                   index_table: str = ACCOUNT_INDEX_TABLE) -> str:
+    """Apply an ACCOUNT_INDEX_MODES mode (None keeps the daily join)."""
+    if account_index is None:
+        return sql
+    if account_index not in ACCOUNT_INDEX_MODES:
+        raise ValueError(f"Unknown account index mode '{account_index}'; choose from {', '.join(ACCOUNT_INDEX_MODES)}")
+    if account_index == "table":
+        return use_account_index(sql, table=index_table)
+    return use_account_index(sql, build_index_query(start_date, end_date, account_filter))
+
+
+def build_queries(start, end, account_filter: str = "external-paid", recurring: bool = False,
+                  templates: dict = None, account_index: str = None,
+                  index_table: str = ACCOUNT_INDEX_TABLE) -> dict:
+    """
+    Render every level's query for one period pair.
+
+    Recurring runs skip the SPI index (it has no recurrence breakdown).
+    `account_index` is one of ACCOUNT_INDEX_MODES, or None for the
+    documented daily join; "table" mode reads `index_table`. Returns
+    {level: sql} in LEVELS order.
+    """
+    templates = templates or load_templates()
+    variables = template_vars(start, end)
+    queries = {}
+    for level, template in templates.items():
+        if recurring and LEVELS[level].get("spi"):
+            continue
+        sql = apply_filters(render(template, variables), account_filter, recurring)
+        queries[level] = _account_index(sql, variables["start_date"], variables["end_date"],
+                                        account_filter, account_index, index_table)
+    return queries
+
+
+def build_cube_query(months, account_filter: str = "external-paid", template: str = None,
+                     account_index: str = None, index_table: str = ACCOUNT_INDEX_TABLE) -> str:
+    """Render the cube query covering every month in `months` (one scan)."""
+    months = sorted({parse_month(month) for month in months})
+    variables = {
+        "start_date": months[0].isoformat(),
+        "end_date": add_months(months[-1], 1).isoformat(),
+        "months": ", ".join(f"'{month.isoformat()}'" for month in months),
+    }
+    sql = apply_filters(render(template or load_cube_template(), variables), account_filter)
+    return _account_index(sql, variables["start_date"], variables["end_date"], account_filter, account_index,
+                          index_table)
+
+
+# =============================================================================
+# DIALECTS
+# =============================================================================
+
+_DUCKDB_REWRITES = (
+    # r.feature_vector['Analytics']['use_case']::STRING
+    (re.compile(r"(\w+)\.feature_vector\['([^']+)'\]\['([^']+)'\]::STRING"),
+     r"""json_extract_string(\1.feature_vector, '$."\2"."\3"')"""),
+    # r.feature_vector:"Product Category"::STRING
+    (re.compile(r'(\w+)\.feature_vector:"([^"]+)"::STRING'),
+     r"""json_extract_string(\1.feature_vector, '$."\2"')"""),
+    # r.feature_vector:is_recurrent::STRING
+    (re.compile(r"(\w+)\.feature_vector:(\w+)::STRING"),
+     r"json_extract_string(\1.feature_vector, '$.\2')"),
+    # snowscience.job_analytics.job_feature_daily_account_rollup -> local table
+    (re.compile(r"\bsnowscience\.\w+\.(\w+)"), r"\1"),
+)
+
+
+def to_duckdb(sql: str) -> str:
+    """Rewrite the Snowflake-only syntax in the templates for a local DuckDB copy."""
+    for pattern, replacement in _DUCKDB_REWRITES:
+        sql = pattern.sub(replacement, sql)
+    return sql
@@ -0,0 +1,173 @@
+"""
+Workload Year-in-Review - Monthly Aggregate Store
+
+Closed months never change, so their cube aggregates (SUM of jobs, credits
+and dur_xp_executing per product category x use case x recurrence) are kept
+on disk and reused by later runs. A new comparison only scans the months
+that are not stored yet - adding a new end month costs one month of
+scanning - and every ratio is derived from the stored sums.
+
+Layout: <cache_dir>/<source>/<filter>/<YYYY-MM>.json
+    source - the backend's source_key() (Snowflake connection, DuckDB file
+             or fixture size/seed), so synthetic and real data never mix
+    filter - account filter (external-paid, all-accounts)
+
+Each entry records a hash of the cube query template, the eligible-accounts
+index template and the account filter lines; when any of them changes,
+stored months are treated as missing and re-fetched. A month is only
+stored once it has settled, SETTLE_DAYS after it ends (the rollup for its
+last days may land late, and a partial month would be served forever),
+and never when it returned no rows.
+
+Usage:
+    from yir_store import AggregateStore, load_cube
+
+    cube = load_cube(backend, ["2025-02", "2025-03", "2026-01"], store=AggregateStore())
+    cube["fetched"], cube["cached"]   # months scanned / reused
+"""
+
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from yir_cube import fetch_cube
+from yir_sql import (
+    ACCOUNT_FILTER_SQL, ACCOUNT_INDEX_JOIN_SQL, ACCOUNT_INDEX_TABLE, ACCOUNT_JOIN_SQL, build_cube_query,
+    add_months, load_cube_template, load_index_template, parse_month,
+)
+
+DEFAULT_CACHE_DIR = Path(".yir_cache")
+SETTLE_DAYS = 3  # Days after a month ends before its rollup rows are treated as final
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def template_hash(template: str = None) -> str:
+    """
+    Short hash of everything that decides a month's sums (the store's schema
+    version): the cube query template, the index template and the account
+    filter / join lines that apply_filters() and use_account_index() edit.
+    """
+    parts = [
+        template or load_cube_template(),
+        load_index_template(),
+        *ACCOUNT_FILTER_SQL,
+        ACCOUNT_JOIN_SQL,
+        *ACCOUNT_INDEX_JOIN_SQL,
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+class AggregateStore:
+    """
+    On-disk monthly cube aggregates, one JSON file per source, filter and month.
+
+    Entries are only written after a successful fetch, via a temp file and
+    rename, so an interrupted run never leaves a partial month behind.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, source: str, account_filter: str, month: date) -> Path:
+        return self.cache_dir / source / account_filter / f"{month:%Y-%m}.json"
+
+    def get(self, source: str, account_filter: str, month: date, schema: str):
+        """Stored {sums key: sums} for one month, or None on a miss."""
+        path = self._path(source, account_filter, month)
+        if not path.exists():
+            return None
+        payload = json.loads(path.read_text())
+        if payload.get("template_hash") != schema:
+            return None
+        key_month = month.isoformat()
+        return {
+            (gid, key_month, category, use_case, recurrent): (jobs, credits, dur)
+            for gid, category, use_case, recurrent, jobs, credits, dur in payload["rows"]
+        }
+
+    def put(self, source: str, account_filter: str, month: date, sums: dict, schema: str):
+        path = self._path(source, account_filter, month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "source": source,
+            "filter": account_filter,
+            "month": month.isoformat(),
+            "template_hash": schema,
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            "rows": [
+                [gid, category, use_case, recurrent, *values]
+                for (gid, _, category, use_case, recurrent), values in sorted(sums.items(), key=_sort_key)
+            ],
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+    def months(self, source: str, account_filter: str) -> list:
+        """Months stored for a source and filter, oldest first."""
+        folder = self.cache_dir / source / account_filter
+        return sorted(parse_month(path.stem) for path in folder.glob("*.json")) if folder.exists() else []
+
+
+def _sort_key(item):
+    (gid, month, category, use_case, recurrent), _ = item
+    return (month, gid, category or "", use_case or "", recurrent is True)
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def is_closed(month: date, today: date = None, settle_days: int = SETTLE_DAYS) -> bool:
+    """True once the month ended at least `settle_days` ago (its rollup rows are final)."""
+    today = today or date.today()
+    return today >= add_months(month, 1) + timedelta(days=settle_days)
+
+
+def load_cube(backend, months, account_filter: str = "external-paid", store: AggregateStore = None,
+              refresh: bool = False, account_index: str = None, index_table: str = ACCOUNT_INDEX_TABLE,
+              today: date = None) -> dict:
+    """
+    fetch_cube() through the aggregate store: only missing months are scanned.
+
+    Returns the fetch_cube() shape ({"sql", "sums"}, where "sql" is the
+    equivalent one-scan query over every month) plus "fetched" and "cached"
+    month lists. Without a store, or for a backend with no stable
+    source_key(), every month is fetched. Only closed months (is_closed()
+    as of `today`) with rows are stored. The account index mode does not
+    change the sums, so stored months are shared between modes.
+    """
+    months = sorted({parse_month(month) for month in months})
+    source = backend.source_key() if store is not None else None
+    schema = template_hash()
+
+    sums, cached, missing = {}, [], []
+    for month in months:
+        stored = None if source is None or refresh else store.get(source, account_filter, month, schema)
+        if stored is None:
+            missing.append(month)
+        else:
+            sums.update(stored)
+            cached.append(month)
+
+    if missing:
+        fetched = fetch_cube(backend, missing, account_filter, account_index, index_table)["sums"]
+        sums.update(fetched)
+        if source is not None:
+            for month in missing:
+                key_month = month.isoformat()
+                month_sums = {key: value for key, value in fetched.items() if key[1] == key_month}
+                # No rows usually means the month's rollup has not landed yet: fetch it again next time
+                if is_closed(month, today) and month_sums:
+                    store.put(source, account_filter, month, month_sums, schema)
+
+    return {
+        "sql": build_cube_query(months, account_filter, account_index="inline" if account_index else None),
+        "sums": sums,
+        "fetched": [month.isoformat() for month in missing],
+        "cached": [month.isoformat() for month in cached],
+    }
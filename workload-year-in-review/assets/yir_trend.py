@@ -0,0 +1,202 @@
+"""
+Workload Year-in-Review - Monthly Time Series
+
+The level queries compare two months; a trend line used to take one run per
+month. This derives every month of a range at once from the single-scan
+cube (one scan, or none when the aggregate store holds the months): per
+scope and month the Jobs, Cr/1K and Avg ms, plus Growth %, Credits X,
+Speed X and Jobs/Credit X both month over month and against an anchor
+month (the first month by default).
+
+Series use the level queries' formulas and rounding (yir_metrics), so a
+month's "vs anchor" values equal the two-month level query for the anchor
+and that month. The SPI index is a separate source and has no trend here.
+
+Usage:
+    from yir_trend import time_series, trend_markdown
+
+    cube = load_cube(backend, months)                  # every month in the range
+    series = time_series(cube, "level2_product_category")
+    series["vs_anchor"]["jobs_credit_x"]               # shape (scopes, months)
+
+Requires numpy:
+    uv sync --extra columnar
+"""
+
+import numpy as np
+
+from yir_cube import GROUPING_IDS
+from yir_metrics import compare_pairs, cube_arrays
+from yir_report import format_value, format_x
+from yir_sql import FILTERS, LEVELS, add_months, month_label, parse_month
+
+# Trend table columns: (title, series, metric). {anchor} is the anchor month label.
+TREND_COLUMNS = [
+    ("Jobs", "vs_anchor", "jobs2"),
+    ("Cr/1K", "vs_anchor", "cr1k2"),
+    ("Avg ms", "vs_anchor", "ms2"),
+    ("MoM Growth %", "mom", "growth"),
+    ("MoM Credits X", "mom", "credits_x"),
+    ("MoM Speed X", "mom", "speed_x"),
+    ("MoM Jobs/Credit X", "mom", "jobs_credit_x"),
+    ("vs {anchor} Credits X", "vs_anchor", "credits_x"),
+    ("vs {anchor} Speed X", "vs_anchor", "speed_x"),
+    ("vs {anchor} Jobs/Credit X", "vs_anchor", "jobs_credit_x"),
+]
+
+
+# =============================================================================
+# SERIES
+# =============================================================================
+
+def month_range(start, end) -> list:
+    """Every month from `start` to `end`, inclusive."""
+    start, end = parse_month(start), parse_month(end)
+    if end <= start:
+        raise ValueError(f"End month {month_label(end)} must be after start month {month_label(start)}")
+    months = [start]
+    while months[-1] < end:
+        months.append(add_months(months[-1], 1))
+    return months
+
+
+def _scope_rows(scopes: list, level: str, recurring: bool) -> tuple:
+    """(row indexes, scope names) of a level's scopes among cube_arrays() scopes."""
+    spec = LEVELS[level]
+    grouping_id = GROUPING_IDS[spec["group"]][1 if recurring else 0]
+    rows, names = [], []
+    for i, (gid, category, use_case, recurrent) in enumerate(scopes):
+        if gid != grouping_id or (recurring and recurrent is not True):
+            continue
+        if spec["group"] == "total":
+            name = "All Snowflake"
+        elif spec["group"] == "product_category":
+            if category is None:
+                continue
+            name = category
+        elif category == spec["category"]:
+            name = use_case
+        else:
+            continue
+        rows.append(i)
+        names.append(name)
+    return rows, names
+
+
+def time_series(cube: dict, level: str, months=None, recurring: bool = False, anchor=None) -> dict:
+    """
+    Every month's values and comparisons for one rollup level's scopes.
+
+    `months` defaults to every month in the cube; `anchor` to the first of
+    them. Returns {"months", "anchor", "scopes", "mom", "vs_anchor"}: mom and
+    vs_anchor map yir_metrics.METRICS names to (scopes x months) arrays
+    ("jobs2", "cr1k2", "ms2" are the month's own values; the first month
+    has no MoM comparison). Months without cube rows are NaN throughout
+    (rendered "-"). Scopes are sorted by last-month jobs, largest first.
+    """
+    if LEVELS[level].get("spi"):
+        raise ValueError(f"{level} is not derived from the cube; time series cover the rollup levels")
+    arrays = cube_arrays(cube)
+    month_index = {month: i for i, month in enumerate(arrays["months"])}
+    months = sorted({parse_month(month) for month in months}) if months else arrays["months"]
+    anchor = parse_month(anchor) if anchor else months[0]
+    if anchor not in months:
+        raise ValueError(f"Anchor {month_label(anchor)} is outside the series months")
+
+    # Months the cube has no rows for (no data yet, or none for the filter) stay NaN
+    rows, names = _scope_rows(arrays["scopes"], level, recurring)
+    present = [j for j, month in enumerate(months) if month in month_index]
+    cells = np.ix_(rows, [month_index[months[j]] for j in present])
+    sums = {}
+    for key in ("jobs", "credits", "dur_ms"):
+        sums[key] = np.full((len(rows), len(months)), np.nan)
+        sums[key][:, present] = arrays[key][cells]
+
+    count, base = len(months), months.index(anchor)
+    vs_anchor = compare_pairs(sums, [(base, j) for j in range(count)])
+    mom = {
+        metric: np.hstack([np.full((len(rows), 1), np.nan), values])
+        for metric, values in compare_pairs(sums, [(j - 1, j) for j in range(1, count)]).items()
+    }
+
+    last = vs_anchor["jobs2"][:, -1] if count else np.zeros(len(rows))
+    order = sorted(range(len(rows)), key=lambda i: (np.isnan(last[i]), -np.nan_to_num(last[i]), str(names[i])))
+    return {
+        "months": months,
+        "anchor": anchor,
+        "scopes": [names[i] for i in order],
+        "mom": {metric: values[order] for metric, values in mom.items()},
+        "vs_anchor": {metric: values[order] for metric, values in vs_anchor.items()},
+    }
+
+
+# =============================================================================
+# MARKDOWN
+# =============================================================================
+
+def _value(value):
+    """Array cell -> float, NaN -> None (formatted as "-")."""
+    return None if np.isnan(value) else float(value)
+
+
+def trend_table(series: dict, scope: int) -> str:
+    """Markdown table for one scope: one row per month."""
+    anchor = month_label(series["anchor"])
+    header = ["Month"] + [title.format(anchor=anchor) for title, _, _ in TREND_COLUMNS]
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join("-" * (len(h) + 2) for h in header) + "|",
+    ]
+    for j, month in enumerate(series["months"]):
+        cells = [month_label(month)]
+        for title, kind, metric in TREND_COLUMNS:
+            cells.append(format_value(title, _value(series[kind][metric][scope, j])))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def trend_observations(series: dict) -> list:
+    """Per scope: Jobs/Credit X against the anchor, best month and MoM regressions."""
+    if not series["scopes"] or not series["months"]:
+        return ["No rows returned for this period and filter"]
+    anchor, last = month_label(series["anchor"]), month_label(series["months"][-1])
+    bullets = []
+    for i, name in enumerate(series["scopes"]):
+        overall = _value(series["vs_anchor"]["jobs_credit_x"][i, -1])
+        mom = series["mom"]["jobs_credit_x"][i]
+        text = f"**{name if name is not None else '(none)'}:** Jobs/Credit X {format_x(overall)} " \
+               f"in {last} vs {anchor}"
+        if not np.all(np.isnan(mom)):
+            best = int(np.nanargmax(mom))
+            text += f"; best month {month_label(series['months'][best])} ({format_x(mom[best])} MoM)"
+            down = [month_label(series["months"][j]) for j in range(len(mom)) if mom[j] < 1]
+            if down:
+                text += f"; below 1.00x MoM in {', '.join(down)}"
+        bullets.append(text)
+    return bullets
+
+
+def trend_markdown(level: str, series: dict, sql: str, account_filter: str, recurring: bool,
+                   run_date: str, source: str = None) -> str:
+    """The full results/<trend run>/<level>.md document."""
+    spec, filter_spec = LEVELS[level], FILTERS[account_filter]
+    title = f"{spec['title']} ({filter_spec['label']}) - Monthly Trend"
+    if recurring:
+        title = "Recurring " + title
+    months = series["months"]
+    meta = [
+        f"**Period:** {month_label(months[0])} → {month_label(months[-1])} ({len(months)} months)",
+        f"**Anchor:** {month_label(series['anchor'])}",
+        f"**Filter:** {filter_spec['recurring_description' if recurring else 'description']}",
+        f"**Run Date:** {run_date}",
+    ]
+    if source:
+        meta.append(f"**Source:** {source}")
+
+    lines = [f"# {title}", "", "  \n".join(meta), "", "## Results", ""]
+    for i, name in enumerate(series["scopes"]):
+        lines += [f"### {name if name is not None else '(none)'}", "", trend_table(series, i), ""]
+    lines += ["## Key Observations", ""]
+    lines += [f"- {bullet}" for bullet in trend_observations(series)]
+    lines += ["", "## SQL Query", "", "```sql", sql.rstrip(), "```", ""]
+    return "\n".join(lines)
@@ -0,0 +1,125 @@
+"""
+Benchmark: account filter as a daily join vs the eligible-accounts index.
+
+Builds the synthetic DuckDB fixture (about 7,100 rollup rows per account:
+1,500 accounts is ~10.7M rows), then times the Level 1 query (account
+filter dominated) and the single-scan cube query (feature_vector parsing
+dominated) four ways:
+
+    no filter    - no account filter at all (the scan's own cost)
+    daily join   - the documented join to dim_accounts_history per row
+    index inline - the eligible-accounts intervals as a CTE in the query
+    index table  - the intervals materialized once, as yir_run.py does
+
+Checks that the filtered variants return the same rows and reports the
+index size and build time.
+
+Usage:
+    uv run --extra local python benchmarks/bench_account_index.py
+    uv run --extra local python benchmarks/bench_account_index.py --accounts 3000 --repeat 5
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+from yir_data import fixture_backend  # noqa: E402
+from yir_sql import (  # noqa: E402
+    ACCOUNT_INDEX_JOIN_SQL, ACCOUNT_INDEX_TABLE, build_cube_query, build_index_query, build_queries,
+    template_vars,
+)
+
+START, END = "2025-02", "2026-01"
+
+
+def best_of(fn, repeat: int) -> float:
+    """Best wall time of `repeat` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def without_filter(sql: str) -> str:
+    """The table-mode query minus its index join: no account filter."""
+    join = {line.strip() for line in ACCOUNT_INDEX_JOIN_SQL}
+    return "\n".join(line for line in sql.splitlines() if line.strip() not in join) + "\n"
+
+
+def queries(name: str) -> dict:
+    """{variant: sql} for "level1" or "cube"."""
+    def build(account_index):
+        if name == "cube":
+            return build_cube_query([START, "2025-03", END], account_index=account_index)
+        return build_queries(START, END, account_index=account_index)["level1_all_snowflake"]
+
+    return {
+        "no filter": without_filter(build("table")),
+        "daily join": build(None),
+        "index inline": build("inline"),
+        "index table": build("table"),
+    }
+
+
+def same_rows(a: list, b: list) -> bool:
+    """Equal rows, with float sums compared to 1e-9 (summation order differs by plan)."""
+    if len(a) != len(b):
+        return False
+    for row_a, row_b in zip(sorted(a, key=str), sorted(b, key=str)):
+        for x, y in zip(row_a, row_b):
+            if isinstance(x, float) and isinstance(y, float):
+                if not math.isclose(x, y, rel_tol=1e-9):
+                    return False
+            elif x != y:
+                return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=1500, help="fixture size (~7,100 rollup rows each)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    backend = fixture_backend(accounts=args.accounts, seed=args.seed)
+    rows = backend.fixture["rows"]
+    print(f"Fixture: {rows['job_feature_daily_account_rollup']:,} rollup rows, "
+          f"{rows['dim_accounts_history']:,} account-days ({time.perf_counter() - started:.1f}s)")
+
+    variables = template_vars(START, END)
+    index_sql = build_index_query(variables["start_date"], variables["end_date"])
+    def rebuild():
+        backend.drop(ACCOUNT_INDEX_TABLE)
+        return backend.materialize(ACCOUNT_INDEX_TABLE, index_sql)
+
+    build_ms = best_of(rebuild, args.repeat)
+    intervals = rebuild()
+    days = backend.connection.execute(
+        "SELECT COUNT(*) FROM dim_accounts_history WHERE general_date >= ? AND general_date < ?",
+        [variables["start_date"], variables["end_date"]],
+    ).fetchone()[0]
+    print(f"Index: {intervals:,} intervals for {days:,} account-days ({days / intervals:,.0f}x smaller), "
+          f"built in {build_ms:.1f} ms")
+
+    print(f"\n{'Query':<8} {'Variant':<13} {'ms':>9} {'vs join':>8} {'filter ms':>10}")
+    for name in ("level1", "cube"):
+        variants = queries(name)
+        expected = backend.query(variants["daily join"])[1]
+        for variant in ("index inline", "index table"):
+            assert same_rows(backend.query(variants[variant])[1], expected), (name, variant)
+        times = {variant: best_of(lambda sql=sql: backend.query(sql), args.repeat) for variant, sql in variants.items()}
+        for variant, ms in times.items():
+            print(f"{name:<8} {variant:<13} {ms:>9.1f} {times['daily join'] / ms:>7.2f}x "
+                  f"{ms - times['no filter']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
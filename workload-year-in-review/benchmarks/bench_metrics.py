@@ -0,0 +1,95 @@
+"""
+Microbenchmark: vectorized year-in-review metric derivation.
+
+Derives every level metric (Growth %, Cr/1K, Credits Δ %, Speed X,
+Jobs/Credit X, ...) for all scopes x all (earlier, later) month pairs of
+synthetic monthly sums, once with the scalar yir_cube.derive() loop and
+once with yir_metrics.compare_pairs(), checks the values match and
+reports both times.
+
+Usage:
+    uv run --extra columnar python benchmarks/bench_metrics.py
+    uv run --extra columnar python benchmarks/bench_metrics.py --scopes 60 500 --months 24 --repeat 3
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+import numpy as np  # noqa: E402
+
+from yir_cube import derive  # noqa: E402
+from yir_metrics import METRICS, all_pairs, compare_pairs  # noqa: E402
+
+
+def make_arrays(scopes: int, months: int, seed: int = 7) -> dict:
+    """Monthly sums with growth, some zero-job and missing cells."""
+    rng = np.random.default_rng(seed)
+    growth = rng.uniform(1.0, 1.15, size=(scopes, 1)) ** np.arange(months)
+    jobs = np.round(rng.uniform(1e5, 1e9, size=(scopes, 1)) * growth)
+    credits = jobs / 1000 * rng.uniform(0.2, 4.0, size=(scopes, months))
+    dur = np.round(jobs * rng.uniform(50, 5000, size=(scopes, months)))
+    jobs[rng.random((scopes, months)) < 0.01] = 0
+    missing = rng.random((scopes, months)) < 0.02
+    for values in (jobs, credits, dur):
+        values[missing] = np.nan
+    return {"jobs": jobs, "credits": credits, "dur_ms": dur}
+
+
+def scalar_pairs(arrays: dict, pairs) -> list:
+    """yir_cube.derive() per scope and pair, from plain Python values."""
+    def sums(scope, month):
+        jobs = arrays["jobs"][scope, month]
+        if math.isnan(jobs):
+            return None
+        return int(jobs), float(arrays["credits"][scope, month]), int(arrays["dur_ms"][scope, month])
+
+    return [
+        derive(sums(scope, i), sums(scope, j))
+        for scope in range(arrays["jobs"].shape[0]) for i, j in pairs
+    ]
+
+
+def best_of(fn, repeat: int) -> float:
+    """Best wall time of `repeat` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def check(arrays: dict, pairs):
+    scalar = scalar_pairs(arrays, pairs)
+    vector = compare_pairs(arrays, pairs)
+    for n, row in enumerate(scalar):
+        scope, pair = divmod(n, len(pairs))
+        for metric in METRICS:
+            value, expected = vector[metric][scope, pair], row[metric]
+            assert (math.isnan(value) if expected is None else value == expected), (metric, value, expected)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scopes", type=int, nargs="+", default=[60, 500])
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pairs = all_pairs(args.months)
+    print(f"{'Scopes':>7} {'Combos':>8} {'scalar ms':>10} {'numpy ms':>9} {'speedup':>8}")
+    for scopes in args.scopes:
+        arrays = make_arrays(scopes, args.months)
+        check(arrays, pairs)
+        before = best_of(lambda: scalar_pairs(arrays, pairs), args.repeat)
+        after = best_of(lambda: compare_pairs(arrays, pairs), args.repeat)
+        print(f"{scopes:>7} {scopes * len(pairs):>8} {before:>10.1f} {after:>9.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: monthly trend from one cube load vs one comparison per month.
+
+On the synthetic DuckDB fixture (Jan 2025 - Feb 2026), times:
+
+    snapshot       - today's single comparison: cube for the first and last month
+    per-month runs - the old way to a trend line: one two-month cube per month
+    trend (cold)   - every month from one cube scan, all series for every level
+    trend (warm)   - the same with the aggregate store holding all but the
+                     last month (a new month was added)
+
+and checks that the trend's vs-anchor values match each per-month run.
+
+Usage:
+    uv run --extra local --extra columnar python benchmarks/bench_trend.py
+    uv run --extra local --extra columnar python benchmarks/bench_trend.py --accounts 300 --repeat 5
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+from yir_cube import LEVEL_COLUMNS, level_result  # noqa: E402
+from yir_data import FIXTURE_END, FIXTURE_START, fixture_backend  # noqa: E402
+from yir_sql import LEVELS, add_months  # noqa: E402
+from yir_store import AggregateStore, load_cube  # noqa: E402
+from yir_trend import month_range, time_series  # noqa: E402
+
+ROLLUP_LEVELS = [level for level, spec in LEVELS.items() if not spec.get("spi")]
+
+
+def best_of(fn, repeat: int) -> float:
+    """Best wall time of `repeat` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def per_month(backend, months: list) -> dict:
+    """{(level, month index): level_result()} from one two-month cube per month."""
+    results = {}
+    for j in range(1, len(months)):
+        cube = load_cube(backend, [months[0], months[j]])
+        for level in ROLLUP_LEVELS:
+            results[level, j] = level_result(cube, level, months[0], months[j])
+    return results
+
+
+def trend(backend, months: list, store: AggregateStore = None) -> dict:
+    cube = load_cube(backend, months, store=store)
+    return {level: time_series(cube, level) for level in ROLLUP_LEVELS}
+
+
+def check(series: dict, results: dict):
+    for (level, j), (_, rows) in results.items():
+        keys = [key for _, key in LEVEL_COLUMNS[LEVELS[level]["group"]]]
+        for row in rows:
+            scope = series[level]["scopes"].index(row[0])
+            for key, value in zip(keys[1:], row[1:]):
+                got = series[level]["vs_anchor"][key][scope, j]
+                assert (math.isnan(got) if value is None else got == value), (level, j, row[0], key)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=200, help="fixture size (~7,100 rollup rows each)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    backend = fixture_backend(accounts=args.accounts)
+    months = month_range(FIXTURE_START, add_months(FIXTURE_END, -1))
+    print(f"Fixture: {backend.fixture['rows']['job_feature_daily_account_rollup']:,} rollup rows, "
+          f"{len(months)} months")
+    check(trend(backend, months), per_month(backend, months))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        load_cube(backend, months[:-1], store=AggregateStore(cache_dir))
+
+        def warm():
+            trend(backend, months, AggregateStore(cache_dir))
+            # Drop the new month again (store layout: <source>/<filter>/<YYYY-MM>.json)
+            (Path(cache_dir) / backend.source_key() / "external-paid" / f"{months[-1]:%Y-%m}.json").unlink()
+
+        times = {
+            "snapshot": best_of(lambda: load_cube(backend, [months[0], months[-1]]), args.repeat),
+            f"per-month runs ({len(months) - 1})": best_of(lambda: per_month(backend, months), args.repeat),
+            "trend (cold)": best_of(lambda: trend(backend, months), args.repeat),
+            "trend (warm)": best_of(warm, args.repeat),
+        }
+
+    print(f"\n{'Variant':<22} {'ms':>9} {'vs snapshot':>12}")
+    for variant, ms in times.items():
+        print(f"{variant:<22} {ms:>9.1f} {ms / times['snapshot']:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
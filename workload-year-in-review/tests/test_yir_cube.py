@@ -0,0 +1,41 @@
+"""
+Tests for yir_cube on the synthetic DuckDB fixture: every level derived from
+the single-scan cube equals its own level query (the --per-level output).
+
+Usage:
+    uv run --extra local pytest tests/
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+pytest.importorskip("duckdb")
+
+from yir_cube import fetch_cube, level_result  # noqa: E402
+from yir_data import fixture_backend  # noqa: E402
+from yir_sql import LEVELS, RECURRING_START, build_queries  # noqa: E402
+
+END = "2026-01"
+
+
+@pytest.fixture(scope="module")
+def backend():
+    return fixture_backend(accounts=30)
+
+
+@pytest.mark.parametrize("account_index", [None, "inline"])
+@pytest.mark.parametrize("start, recurring", [("2025-02", False), (RECURRING_START, True)])
+def test_cube_levels_match_level_queries(backend, start, recurring, account_index):
+    cube = fetch_cube(backend, [start, END], account_index=account_index)
+    queries = build_queries(start, END, recurring=recurring, account_index=account_index)
+    rollup_levels = [level for level in queries if not LEVELS[level].get("spi")]
+    assert len(rollup_levels) == 4
+
+    for level in rollup_levels:
+        columns, rows = backend.query(queries[level])
+        assert rows, level
+        assert level_result(cube, level, start, END, recurring) == (columns, rows), level
@@ -0,0 +1,72 @@
+"""
+Tests for yir_diff: printed values and the table layouts checked in under
+results/ (pipe, box-drawing, transposed Level 1) parse to the right cells.
+
+Usage:
+    uv run pytest tests/
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "assets"))
+
+from yir_diff import markdown_cells, parse_value  # noqa: E402
+
+RESULTS = ROOT / "results"
+
+
+def cells(run: str, level: str) -> dict:
+    # Start/end come from the file's **Period:** line
+    return markdown_cells((RESULTS / run / f"{level}.md").read_text(encoding="utf-8"), level, None, None)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("98.1B", (98.1e9, 0.05e9)),
+    ("621M", (621e6, 0.5e6)),
+    ("+127.1%", (127.1, 0.05)),
+    ("+127%", (127.0, 0.5)),
+    ("−3.2%", (-3.2, 0.05)),
+    ("1,516 ms", (1516.0, 0.5)),
+    ("1.149", (1.149, 0.0005)),
+    ("**2.27x** cheaper", (2.27, 0.005)),
+    ("  1.86x cheaper ", (1.86, 0.005)),
+])
+def test_parse_value(text, expected):
+    value, resolution = parse_value(text)
+    assert value == pytest.approx(expected[0]) and resolution == pytest.approx(expected[1])
+
+
+@pytest.mark.parametrize("text", ["-", "", "n/a", "Business Intelligence", "Mixed"])
+def test_parse_value_text(text):
+    assert parse_value(text) is None
+
+
+def test_transposed_level1():
+    level1 = cells("2026-01-16_feb25-jan26_external-paid-v2", "level1_all_snowflake")
+    expected = {
+        "jobs1": 98.1e9, "jobs2": 222.8e9, "growth": 127, "jobs_x": 2.27,
+        "credits1": 112.7e6, "credits2": 154.4e6, "cr1k1": 1.149, "cr1k2": 0.693,
+        "credits_delta": 39.7, "credits_x": 1.66, "ms1": 1516, "ms2": 946,
+        "exec_delta": 37.6, "speed_x": 1.60, "jobs_credit_x": 3.76,
+    }
+    assert {metric for _, metric in level1} == set(expected)
+    for metric, value in expected.items():
+        assert level1["All Snowflake", metric][0] == pytest.approx(value), metric
+
+
+def test_box_drawing_and_pipe_tables_agree():
+    box = cells("2026-01-16_feb25-jan26_external-paid-v2", "level2_product_category")
+    pipe = cells("2026-01-16_feb25-jan26_external-paid", "level2_product_category")
+
+    assert box["OLTP", "jobs1"] == pytest.approx((621e6, 0.5e6))
+    assert box["OLTP", "credits1"] == pytest.approx((260e3, 500))
+    assert box["OLTP", "credits_x"] == pytest.approx((1.86, 0.005))  # "1.86x cheaper"
+    assert pipe["AI/ML", "exec_delta"] == pytest.approx((60.6, 0.05))  # "**+60.6%**"
+    scopes = {"Data Engineering", "Analytics", "Apps & Collaboration", "OLTP", "AI/ML", "Platform"}
+    assert {scope for scope, _ in pipe} == {scope for scope, _ in box} == scopes
+    for key in pipe.keys() & box.keys():
+        assert pipe[key] == box[key], key
@@ -0,0 +1,60 @@
+"""
+Tests for yir_run on the synthetic DuckDB fixture.
+
+Usage:
+    uv run --extra local pytest tests/
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+pytest.importorskip("duckdb")
+
+from yir_data import DuckDBBackend, create_fixture  # noqa: E402
+from yir_run import run  # noqa: E402
+from yir_sql import ACCOUNT_INDEX_TABLE  # noqa: E402
+
+
+def tables(backend) -> list:
+    return sorted(row[0] for row in backend.connection.execute("SELECT table_name FROM information_schema.tables")
+                  .fetchall())
+
+
+def test_account_index_leaves_user_tables_alone(tmp_path):
+    backend = DuckDBBackend(database=str(tmp_path / "user.duckdb"))
+    create_fixture(backend.connection, accounts=10)
+    backend.connection.execute(f"CREATE TABLE {ACCOUNT_INDEX_TABLE} AS SELECT 42 AS mine")
+    before = tables(backend)
+
+    summary = run(backend, "2025-02", "2026-01", results_dir=tmp_path / "results", parquet=False)
+
+    assert summary["account_index"] == "table" and not summary["failed"]
+    assert tables(backend) == before
+    assert backend.connection.execute(f"SELECT mine FROM {ACCOUNT_INDEX_TABLE}").fetchall() == [(42,)]
+
+
+def test_concurrent_runs_use_their_own_index(tmp_path):
+    backend = DuckDBBackend(database=str(tmp_path / "user.duckdb"))
+    create_fixture(backend.connection, accounts=10)
+    summaries = {}
+
+    def one_run(name, clone):
+        summaries[name] = run(clone, "2025-02", "2026-01", results_dir=tmp_path / name, parquet=False,
+                              single_scan=False)
+
+    threads = [threading.Thread(target=one_run, args=(name, backend.clone())) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for summary in summaries.values():
+        assert summary["account_index"] == "table" and not summary["failed"]
+    assert [level["rows"] for level in summaries["a"]["levels"]] == \
+        [level["rows"] for level in summaries["b"]["levels"]]
+    assert not [table for table in tables(backend) if table.startswith(ACCOUNT_INDEX_TABLE)]
@@ -0,0 +1,188 @@
+"""
+Tests for yir_schedule: retries, resume and the concurrency cap, driven by
+SimulatedWarehouse over an in-memory DuckDB backend.
+
+Usage:
+    uv run --extra local pytest tests/
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+pytest.importorskip("duckdb")
+
+from yir_data import DuckDBBackend, SimulatedWarehouse, TransientError  # noqa: E402
+from yir_schedule import ConnectionPool, Task, schedule  # noqa: E402
+
+
+def warehouse(failure_rate: float = 0.0, seed: int = 7) -> SimulatedWarehouse:
+    return SimulatedWarehouse(DuckDBBackend(), latency=0.01, failure_rate=failure_rate, seed=seed)
+
+
+class CountingFactory:
+    """Pool factory that clones `backend` and records every backend it created and closed."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.created = []
+        self.closed = []
+
+    def __call__(self):
+        clone = self.backend.clone()
+        clone.close = lambda clone=clone: self.closed.append(clone)
+        self.created.append(clone)
+        return clone
+
+
+def select_one(backend):
+    columns, rows = backend.query("SELECT 1 AS x")
+    return {"rows": len(rows)}
+
+
+def test_transient_failures_are_retried():
+    backend = warehouse(failure_rate=0.3)
+    pool = ConnectionPool(backend.clone, size=4, initial=[backend])
+    tasks = [Task(f"q{i}", select_one) for i in range(20)]
+
+    summary = schedule(tasks, pool, concurrency=4, retries=10, backoff=0)
+
+    assert summary["done"] == 20 and not summary["failed"]
+    assert all(result["rows"] == 1 for result in summary["tasks"])
+    assert any(result["attempts"] > 1 for result in summary["tasks"])
+
+
+def test_exhausted_retries_fail_only_that_task():
+    def always_fails(backend):
+        raise TransientError("down")
+
+    backend = warehouse()
+    pool = ConnectionPool(backend.clone, size=2, initial=[backend])
+    tasks = [Task("ok", select_one), Task("broken", always_fails)]
+
+    summary = schedule(tasks, pool, concurrency=2, retries=2, backoff=0)
+
+    assert [result["status"] for result in summary["tasks"]] == ["done", "failed"]
+    assert summary["tasks"][1]["attempts"] == 3
+    assert "TransientError" in summary["tasks"][1]["error"]
+
+
+def test_retry_uses_fresh_connection():
+    backend = warehouse()
+    factory = CountingFactory(backend)
+    pool = ConnectionPool(factory, size=1, initial=[backend])
+    seen = []
+
+    def fails_once(backend):
+        seen.append(backend)
+        if len(seen) == 1:
+            raise TransientError("session expired")
+        return select_one(backend)
+
+    summary = schedule([Task("q", fails_once)], pool, concurrency=1, retries=1, backoff=0)
+
+    assert summary["done"] == 1
+    assert seen[0] is backend and seen[1] is factory.created[0]
+    # The healthy replacement is returned to the pool and reused
+    with pool.connection() as reused:
+        assert reused is factory.created[0]
+    assert len(factory.created) == 1
+
+
+def test_discarded_and_pooled_clones_are_closed():
+    backend = warehouse()
+    backend.close = lambda: pytest.fail("the caller's backend must not be closed")
+    factory = CountingFactory(backend)
+    pool = ConnectionPool(factory, size=1, initial=[backend])
+    attempts = []
+
+    def fails_twice(used):
+        attempts.append(used)
+        if len(attempts) <= 2:
+            raise TransientError("session expired")
+        return select_one(used)
+
+    summary = schedule([Task("q", fails_twice)], pool, concurrency=1, retries=2, backoff=0)
+
+    assert summary["done"] == 1
+    assert attempts == [backend, *factory.created]
+    # The failed clone was closed; the healthy one is pooled until close()
+    assert factory.closed == factory.created[:1]
+    pool.close()
+    assert factory.closed == factory.created
+
+
+def test_concurrency_cap():
+    backend = warehouse()
+    factory = CountingFactory(backend)
+    pool = ConnectionPool(factory, size=3)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def tracked(backend):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        try:
+            return select_one(backend)
+        finally:
+            with lock:
+                active["now"] -= 1
+
+    summary = schedule([Task(f"q{i}", tracked) for i in range(12)], pool, concurrency=3, backoff=0)
+
+    assert summary["done"] == 12
+    assert active["peak"] <= 3
+    assert len(factory.created) <= 3
+
+
+def test_pool_waits_for_returned_connection():
+    backend = warehouse()
+    pool = ConnectionPool(backend.clone, size=1, initial=[backend])
+    tasks = [Task(f"q{i}", select_one) for i in range(6)]
+
+    # More workers than connections: the extra workers block until one is returned
+    summary = schedule(tasks, pool, concurrency=6, backoff=0)
+
+    assert summary["done"] == 6
+
+
+def test_resume_skips_finished_tasks(tmp_path):
+    backend = warehouse()
+    pool = ConnectionPool(backend.clone, size=2, initial=[backend])
+    ran = []
+    attempts = {}
+
+    def write(path):
+        def run(backend):
+            ran.append(path.name)
+            select_one(backend)
+            path.write_text("done")
+        return run
+
+    def flaky_once(path):
+        def run(backend):
+            ran.append(path.name)
+            attempts[path.name] = attempts.get(path.name, 0) + 1
+            if attempts[path.name] == 1:
+                raise TransientError("down")
+            path.write_text("done")
+        return run
+
+    paths = [tmp_path / f"level{i}.md" for i in range(3)]
+    tasks = [Task("level0", write(paths[0]), output=paths[0]),
+             Task("level1", flaky_once(paths[1]), output=paths[1]),
+             Task("level2", write(paths[2]), output=paths[2])]
+
+    first = schedule(tasks, pool, concurrency=2, retries=0, backoff=0, resume=True)
+    assert [result["status"] for result in first["tasks"]] == ["done", "failed", "done"]
+
+    ran.clear()
+    second = schedule(tasks, pool, concurrency=2, retries=0, backoff=0, resume=True)
+    assert [result["status"] for result in second["tasks"]] == ["skipped", "done", "skipped"]
+    assert ran == ["level1.md"]
+    assert second["skipped"] == 2 and second["done"] == 1
@@ -0,0 +1,63 @@
+"""
+Tests for yir_store: which months are stored, with `today` pinned.
+
+Usage:
+    uv run --extra local pytest tests/
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+pytest.importorskip("duckdb")
+
+from yir_data import fixture_backend  # noqa: E402
+from yir_store import SETTLE_DAYS, AggregateStore, is_closed, load_cube  # noqa: E402
+
+JAN, FEB = date(2026, 1, 1), date(2026, 2, 1)
+
+
+@pytest.fixture(scope="module")
+def backend():
+    return fixture_backend(accounts=10)
+
+
+def test_month_settles_after_settle_days():
+    assert SETTLE_DAYS > 0
+    assert not is_closed(FEB, today=date(2026, 2, 28))
+    assert not is_closed(FEB, today=date(2026, 3, 1))
+    assert not is_closed(FEB, today=date(2026, 3, SETTLE_DAYS))
+    assert is_closed(FEB, today=date(2026, 3, 1 + SETTLE_DAYS))
+    assert is_closed(FEB, today=date(2026, 3, 1), settle_days=0)
+
+
+def test_unsettled_month_is_fetched_again(backend, tmp_path):
+    store = AggregateStore(tmp_path)
+    today = date(2026, 3, 2)  # February ended yesterday: rows may still be landing
+
+    first = load_cube(backend, [JAN, FEB], store=store, today=today)
+    assert first["fetched"] == ["2026-01-01", "2026-02-01"]
+
+    second = load_cube(backend, [JAN, FEB], store=store, today=today)
+    assert second["cached"] == ["2026-01-01"]
+    assert second["fetched"] == ["2026-02-01"]
+    assert second["sums"] == first["sums"]
+
+    settled = date(2026, 3, 1 + SETTLE_DAYS)
+    load_cube(backend, [JAN, FEB], store=store, today=settled)
+    assert load_cube(backend, [JAN, FEB], store=store, today=settled)["fetched"] == []
+
+
+def test_empty_month_is_not_stored(backend, tmp_path):
+    store = AggregateStore(tmp_path)
+    empty = date(2023, 1, 1)  # Before the fixture's data
+
+    load_cube(backend, [empty, JAN], store=store, today=date(2026, 6, 1))
+    again = load_cube(backend, [empty, JAN], store=store, today=date(2026, 6, 1))
+
+    assert again["fetched"] == ["2023-01-01"]
+    assert again["cached"] == ["2026-01-01"]
@@ -0,0 +1,51 @@
+"""
+Tests for yir_trend on the synthetic DuckDB fixture: each month's "vs anchor"
+values equal the two-month level query for the anchor and that month.
+
+Usage:
+    uv run --extra local --extra columnar pytest tests/
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "assets"))
+
+pytest.importorskip("duckdb")
+pytest.importorskip("numpy")
+
+from yir_cube import LEVEL_COLUMNS, fetch_cube  # noqa: E402
+from yir_data import fixture_backend  # noqa: E402
+from yir_metrics import METRICS  # noqa: E402
+from yir_sql import LEVELS, build_queries, month_label  # noqa: E402
+from yir_trend import month_range, time_series  # noqa: E402
+
+
+@pytest.mark.parametrize("recurring", [False, True])
+def test_vs_anchor_matches_level_query(recurring):
+    backend = fixture_backend(accounts=20)
+    months = month_range("2025-03", "2025-07")
+    cube = fetch_cube(backend, months)
+    anchor = months[0]
+
+    for level, spec in LEVELS.items():
+        if spec.get("spi"):
+            continue
+        series = time_series(cube, level, recurring=recurring)
+        assert series["anchor"] == anchor
+        layout = LEVEL_COLUMNS[spec["group"]]
+        for j, month in enumerate(months[1:], start=1):
+            _, rows = backend.query(build_queries(anchor, month, recurring=recurring)[level])
+            assert rows, (level, month_label(month))
+            for row in rows:
+                scope = series["scopes"].index(row[0])
+                for (_, metric), value in zip(layout, row):
+                    if metric not in METRICS:
+                        continue
+                    trend = series["vs_anchor"][metric][scope, j]
+                    expected = math.nan if value is None else float(value)
+                    assert trend == expected or (math.isnan(trend) and math.isnan(expected)), \
+                        (level, month_label(month), row[0], metric)